@@ -3,18 +3,59 @@ Payroll Calculator
 Complete payroll calculation engine with all salary components and deductions
 """
 
-from typing import Dict, Optional
-from dataclasses import dataclass
-from decimal import Decimal
+from __future__ import annotations
 
-from business.tax_calculator import TaxCalculator
+from dataclasses import dataclass, fields, MISSING
+from decimal import Decimal, ROUND_HALF_UP
+from functools import partial
+from itertools import repeat
+from operator import attrgetter
+
+from business.tax_calculator import (
+    TaxCalculator, STATUS_CODES, DATACLASS_SLOTS, parse_status_code
+)
 from config import (
     INPS_EMPLOYEE_RATE, INPS_EMPLOYER_RATE,
-    AMO_EMPLOYEE_RATE, AMO_EMPLOYER_RATE
+    AMO_EMPLOYEE_RATE, AMO_EMPLOYER_RATE,
+    TL_RATE, TFP_RATE, ATEJ_RATE, CFE_RATE,
+    TRANSPORT_ALLOWANCE_RATE
 )
 
+# Annotations only: importing typing at runtime is not needed
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterable, List
+
+
+# Standard working days per month; the daily rate is base_salary / this
+STANDARD_WORKING_DAYS = 26
+
+
+# Precision strategies for money amounts
+PRECISION_NONE = "none"  # Float arithmetic, results rounded to the cent (fastest)
+PRECISION_ROUND = "round"  # Intermediates rounded to 6 decimals, results to the cent
+PRECISION_DECIMAL = "decimal"  # As ROUND, results rounded half-up on the decimal value
+
+INTERMEDIATE_DECIMALS = 6
+CENT = Decimal("0.01")
+
+
+def _round_half_up_cents(amount) -> float:
+    """Round an amount to the cent, half-up on its decimal representation"""
+    return float(Decimal(repr(amount)).quantize(CENT, rounding=ROUND_HALF_UP))
+
+
+def _round_amounts(amounts):
+    """Round amounts to the cent in a single pass"""
+    return map(round, amounts, repeat(2))
+
+
+def _round_amounts_half_up(amounts):
+    """Round amounts to the cent, half-up on their decimal value, in a single pass"""
+    return map(_round_half_up_cents, amounts)
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class PayrollInput:
     """Input data for payroll calculation"""
     employee_id: str
@@ -43,8 +84,16 @@ class PayrollInput:
     advance_deduction: float = 0.0
     other_deductions: float = 0.0
 
+    # Input amounts already rounded to the cent (their rounding is skipped)
+    pre_rounded: bool = False
+
+    def __post_init__(self):
+        # Family allowance not set: use the one due for the status code
+        if not self.family_allowance and self.status_code:
+            self.family_allowance = default_family_allowance(self.status_code)
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PayrollResult:
     """Result of payroll calculation"""
     employee_id: str
@@ -99,6 +148,112 @@ class PayrollResult:
     total_cost: float  # Gross + Employer costs + Labor taxes
 
 
+# PayrollResult field names, in declaration order
+PAYROLL_RESULT_FIELDS = tuple(field.name for field in fields(PayrollResult))
+
+# PayrollResult amounts taken from the input as is (no rounding if pre-rounded)
+INPUT_AMOUNT_FIELDS = frozenset({
+    'base_salary', 'family_allowance', 'responsibility_allowance', 'risk_allowance',
+    'housing_allowance', 'overtime_amount', 'bonus_amount', 'ind_spec_1973',
+    'cher_vie_1974', 'loan_deduction', 'advance_deduction', 'other_deductions'
+})
+
+
+def _result_row(*values) -> tuple:
+    """Keep a calculated result as a plain row (see PayrollResultFrame)"""
+    return values
+
+
+class PayrollResultFrame:
+    """
+    Payroll results stored column by column
+
+    Each PayrollResult field is a list holding that field for every employee
+    (``frame.gross_salary``), so report totals sum one list instead of
+    reading an attribute from each result. ``frame[i]`` rebuilds the
+    PayrollResult of one employee.
+    """
+
+    __slots__ = ('_columns', '_length')
+
+    def __init__(self, rows: Iterable[tuple]):
+        """
+        Initialize the frame from result rows
+
+        Args:
+            rows: One tuple per employee, in PayrollResult field order
+        """
+        columns = list(zip(*rows)) or [()] * len(PAYROLL_RESULT_FIELDS)
+        self._columns = {
+            name: list(column) for name, column in zip(PAYROLL_RESULT_FIELDS, columns)
+        }
+        self._length = len(columns[0])
+
+    @classmethod
+    def from_results(cls, results: Iterable[PayrollResult]) -> PayrollResultFrame:
+        """Build a frame from PayrollResult objects"""
+        return cls(map(attrgetter(*PAYROLL_RESULT_FIELDS), results))
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index: int) -> PayrollResult:
+        return PayrollResult(*[column[index] for column in self._columns.values()])
+
+
+def _family_allowance(status_code: str) -> float:
+    """Family allowance for a status code (see PayrollCalculator.calculate_family_allowance)"""
+    parsed = parse_status_code(status_code)
+    if parsed is None:
+        return 0.0
+    marital_status, number = parsed
+
+    # Single (Célibataire)
+    if marital_status == 'C':
+        if 0 <= number <= 1:
+            return 15000.0
+        elif 2 <= number <= 4:
+            return 25000.0
+        elif number >= 5:
+            return 35000.0
+
+    # Married (Marié)
+    elif marital_status == 'M':
+        if 0 <= number <= 2:
+            return 25000.0
+        elif 3 <= number <= 4:
+            return 35000.0
+        elif 5 <= number <= 7:
+            return 45000.0
+        elif number >= 8:
+            return 55000.0
+
+    return 0.0
+
+
+# Family allowance per status code, so the common codes skip parsing
+FAMILY_ALLOWANCES = {
+    status_code: _family_allowance(status_code) for status_code in STATUS_CODES
+}
+FAMILY_ALLOWANCES[''] = 0.0
+
+
+def default_family_allowance(status_code: str) -> float:
+    """Family allowance due for a status code (table lookup, parsing as a fallback)"""
+    allowance = FAMILY_ALLOWANCES.get(status_code)
+    if allowance is None:
+        allowance = _family_allowance(status_code)
+    return allowance
+
+
 class PayrollCalculator:
     """
     Complete payroll calculation engine
@@ -113,9 +268,30 @@ class PayrollCalculator:
     7. Calculate employer costs and labor taxes
     """
 
-    def __init__(self):
-        """Initialize payroll calculator"""
+    def __init__(self, precision_strategy: str = PRECISION_NONE):
+        """
+        Initialize payroll calculator
+
+        Args:
+            precision_strategy: PRECISION_NONE, PRECISION_ROUND or PRECISION_DECIMAL
+        """
+        if precision_strategy not in (PRECISION_NONE, PRECISION_ROUND, PRECISION_DECIMAL):
+            raise ValueError(f"Stratégie de précision inconnue: {precision_strategy}")
+
         self.tax_calculator = TaxCalculator()
+        self.precision_strategy = precision_strategy
+        self._monthly_tax = self.tax_calculator.calculate_monthly_tax
+
+        # Rounding applied to intermediate amounts (float() leaves them as is)
+        # and to the amounts of the result
+        if precision_strategy == PRECISION_NONE:
+            self._round_step = float
+        else:
+            self._round_step = partial(round, ndigits=INTERMEDIATE_DECIMALS)
+        if precision_strategy == PRECISION_DECIMAL:
+            self._round_amounts = _round_amounts_half_up
+        else:
+            self._round_amounts = _round_amounts
 
     def calculate(self, input_data: PayrollInput) -> PayrollResult:
         """
@@ -127,15 +303,210 @@ class PayrollCalculator:
         Returns:
             PayrollResult with all calculations
         """
-        # 1. Adjust base salary for absences
-        adjusted_base = self._calculate_adjusted_base(
-            input_data.base_salary,
-            input_data.days_worked,
-            input_data.days_absent
+        return self._calculate(
+            input_data,
+            self.tax_calculator.get_family_charge_reduction(input_data.status_code)
         )
 
+    def calculate_batch(self, inputs: List[PayrollInput]) -> List[PayrollResult]:
+        """
+        Calculate payroll for many employees at once
+
+        The family charge reductions are resolved up front for the whole batch
+        (a table lookup per status code) and the per-employee loop only runs
+        the arithmetic.
+
+        Args:
+            inputs: PayrollInput for each employee
+
+        Returns:
+            PayrollResult for each input, in the same order
+        """
+        reductions = self.tax_calculator.get_family_charge_reductions(
+            [input_data.status_code for input_data in inputs]
+        )
+        return list(map(self._calculate, inputs, reductions))
+
+    def calculate_frame(self, inputs: List[PayrollInput]) -> PayrollResultFrame:
+        """
+        Calculate payroll for many employees into a column-wise frame
+
+        Same results as calculate_batch, without building a PayrollResult per
+        employee.
+
+        Args:
+            inputs: PayrollInput for each employee
+
+        Returns:
+            PayrollResultFrame with one entry per input, in the same order
+        """
+        reductions = self.tax_calculator.get_family_charge_reductions(
+            [input_data.status_code for input_data in inputs]
+        )
+        return PayrollResultFrame(
+            map(self._calculate, inputs, reductions, repeat(_result_row))
+        )
+
+    def calculate_dataframe(self, df):
+        """
+        Calculate payroll for a whole table of employees, column by column
+
+        Args:
+            df: pandas DataFrame with one row per employee and columns named
+                after the PayrollInput fields (employee_id and base_salary are
+                required, missing columns take the PayrollInput defaults)
+
+        Returns:
+            pandas DataFrame with one column per PayrollResult field, indexed
+            like df
+        """
+        import pandas as pd
+
+        index = df.index
+        columns = {}
+        for field in fields(PayrollInput):
+            if field.name in df.columns:
+                columns[field.name] = df[field.name]
+            elif field.default is not MISSING:
+                columns[field.name] = pd.Series(field.default, index=index)
+            else:
+                raise KeyError(f"Colonne manquante: {field.name}")
+
+        if self.precision_strategy == PRECISION_NONE:
+            def step(column):
+                return column
+        else:
+            def step(column):
+                return column.map(self._round_step)
+
+        base_salary = columns['base_salary']
+        days_absent = columns['days_absent']
+        status_codes = columns['status_code'].fillna("")
+
+        # Family allowance not set: use the one due for the status code
+        family = columns['family_allowance']
+        family = family.where(family != 0, status_codes.map(default_family_allowance))
+        ind_spec = columns['ind_spec_1973']
+        cher_vie = columns['cher_vie_1974']
+        loan = columns['loan_deduction']
+        advance = columns['advance_deduction']
+        other = columns['other_deductions']
+
+        # Same steps as _calculate, one column at a time
+        adjusted_base = step(
+            (base_salary - base_salary / STANDARD_WORKING_DAYS * days_absent)
+            .clip(lower=0)
+            .where(days_absent != 0, base_salary)
+        )
+        transport_in = columns['transport_allowance']
+        transport = step(transport_in.where(
+            transport_in != 0, adjusted_base * TRANSPORT_ALLOWANCE_RATE
+        ))
+        total_allowances = step(
+            transport + family + columns['responsibility_allowance'] +
+            columns['risk_allowance'] + columns['housing_allowance'] +
+            columns['overtime_amount'] + columns['bonus_amount'] + ind_spec + cher_vie
+        )
+        gross_salary = step(adjusted_base + total_allowances)
+        inps_amo_base = step(adjusted_base + transport + family + ind_spec + cher_vie)
+
+        inps_employee = step(inps_amo_base * INPS_EMPLOYEE_RATE)
+        amo_employee = step(inps_amo_base * AMO_EMPLOYEE_RATE)
+
+        # Income tax goes through the memoized scalar path
+        reductions = self.tax_calculator.get_family_charge_reductions(status_codes.tolist())
+        income_tax = pd.Series(
+            self.tax_calculator.calculate_monthly_taxes(gross_salary.tolist(), reductions),
+            index=index
+        )
+
+        total_deductions = inps_employee + amo_employee + income_tax + loan + advance + other
+        net_salary = gross_salary - inps_employee - amo_employee - income_tax
+        net_to_pay = net_salary - loan - advance - other
+
+        inps_employer = step(inps_amo_base * INPS_EMPLOYER_RATE)
+        amo_employer = step(inps_amo_base * AMO_EMPLOYER_RATE)
+        taxe_logement = step(gross_salary * TL_RATE)
+        taxe_formation = step(gross_salary * TFP_RATE)
+        taxe_emploi = step(gross_salary * ATEJ_RATE)
+        contribution_cfe = step(gross_salary * CFE_RATE)
+        total_labor_taxes = taxe_logement + taxe_formation + taxe_emploi + contribution_cfe
+        total_employer_cost = inps_employer + amo_employer + total_labor_taxes
+        total_cost = gross_salary + total_employer_cost
+
+        amounts = {
+            'base_salary': base_salary,
+            'adjusted_base_salary': adjusted_base,
+            'transport_allowance': transport,
+            'family_allowance': family,
+            'responsibility_allowance': columns['responsibility_allowance'],
+            'risk_allowance': columns['risk_allowance'],
+            'housing_allowance': columns['housing_allowance'],
+            'overtime_amount': columns['overtime_amount'],
+            'bonus_amount': columns['bonus_amount'],
+            'ind_spec_1973': ind_spec,
+            'cher_vie_1974': cher_vie,
+            'total_allowances': total_allowances,
+            'gross_salary': gross_salary,
+            'inps_employee': inps_employee,
+            'amo_employee': amo_employee,
+            'income_tax_net': income_tax,
+            'loan_deduction': loan,
+            'advance_deduction': advance,
+            'other_deductions': other,
+            'total_deductions': total_deductions,
+            'net_salary': net_salary,
+            'net_to_pay': net_to_pay,
+            'inps_employer': inps_employer,
+            'amo_employer': amo_employer,
+            'total_employer_cost': total_employer_cost,
+            'taxe_logement': taxe_logement,
+            'taxe_formation': taxe_formation,
+            'taxe_emploi': taxe_emploi,
+            'contribution_cfe': contribution_cfe,
+            'total_labor_taxes': total_labor_taxes,
+            'total_cost': total_cost
+        }
+
+        # Round with the strategy's rounding rather than Series.round(), whose
+        # scale-and-round can differ from round() by a cent
+        # (input amounts are left as is when every row is pre-rounded)
+        skip_inputs = bool(columns['pre_rounded'].all())
+        result = {}
+        for field in fields(PayrollResult):
+            name = field.name
+            if name not in amounts:
+                result[name] = columns[name]
+            elif skip_inputs and name in INPUT_AMOUNT_FIELDS:
+                result[name] = amounts[name]
+            else:
+                result[name] = pd.Series(
+                    list(self._round_amounts(amounts[name].tolist())), index=index
+                )
+        return pd.DataFrame(result, index=index)
+
+    def _calculate(self, input_data: PayrollInput, family_charge_reduction: float,
+                   make_result=PayrollResult):
+        """
+        Calculate payroll with an already resolved family charge reduction
+
+        The result is built by make_result from the values in PayrollResult
+        field order (a PayrollResult, or a plain row for PayrollResultFrame).
+        """
+        step = self._round_step
+
+        # 1. Adjust base salary for absences (most employees have none)
+        adjusted_base = input_data.base_salary
+        if input_data.days_absent:
+            adjusted_base = self._calculate_adjusted_base(
+                adjusted_base,
+                input_data.days_worked,
+                input_data.days_absent
+            )
+        adjusted_base = step(adjusted_base)
+
         # 2. Calculate allowances
-        transport = input_data.transport_allowance or (adjusted_base * 0.10)
+        transport = step(input_data.transport_allowance or (adjusted_base * TRANSPORT_ALLOWANCE_RATE))
         family = input_data.family_allowance
         responsibility = input_data.responsibility_allowance
         risk = input_data.risk_allowance
@@ -145,28 +516,25 @@ class PayrollCalculator:
         ind_spec = input_data.ind_spec_1973
         cher_vie = input_data.cher_vie_1974
 
-        total_allowances = (
+        total_allowances = step(
             transport + family + responsibility + risk + housing +
             overtime + bonus + ind_spec + cher_vie
         )
 
         # 3. Calculate gross salary
-        gross_salary = adjusted_base + total_allowances
+        gross_salary = step(adjusted_base + total_allowances)
 
         # 4. Calculate INPS/AMO base (some allowances excluded from social contributions)
         # Typically: base + transport + family + fixed allowances
         # Exclude: risk, responsibility, overtime, bonus
-        inps_amo_base = adjusted_base + transport + family + ind_spec + cher_vie
+        inps_amo_base = step(adjusted_base + transport + family + ind_spec + cher_vie)
 
         # 5. Calculate employee deductions
-        inps_employee = inps_amo_base * INPS_EMPLOYEE_RATE
-        amo_employee = inps_amo_base * AMO_EMPLOYEE_RATE
+        inps_employee = step(inps_amo_base * INPS_EMPLOYEE_RATE)
+        amo_employee = step(inps_amo_base * AMO_EMPLOYEE_RATE)
 
         # Calculate income tax on gross salary
-        income_tax = self.tax_calculator.calculate_monthly_tax(
-            gross_salary,
-            self.tax_calculator.get_family_charge_reduction(input_data.status_code)
-        )
+        income_tax = self._monthly_tax(gross_salary, family_charge_reduction)
 
         total_deductions = (
             inps_employee + amo_employee + income_tax +
@@ -179,14 +547,14 @@ class PayrollCalculator:
         net_to_pay = net_salary - input_data.loan_deduction - input_data.advance_deduction - input_data.other_deductions
 
         # 7. Calculate employer costs
-        inps_employer = inps_amo_base * INPS_EMPLOYER_RATE
-        amo_employer = inps_amo_base * AMO_EMPLOYER_RATE
+        inps_employer = step(inps_amo_base * INPS_EMPLOYER_RATE)
+        amo_employer = step(inps_amo_base * AMO_EMPLOYER_RATE)
 
         # Labor taxes (calculated on gross salary)
-        taxe_logement = gross_salary * 0.01  # TL: 1%
-        taxe_formation = gross_salary * 0.02  # TFP: 2%
-        taxe_emploi = gross_salary * 0.02  # ATEJ: 2%
-        contribution_cfe = gross_salary * 0.035  # CFE: 3.5%
+        taxe_logement = step(gross_salary * TL_RATE)  # TL: 1%
+        taxe_formation = step(gross_salary * TFP_RATE)  # TFP: 2%
+        taxe_emploi = step(gross_salary * ATEJ_RATE)  # ATEJ: 2%
+        contribution_cfe = step(gross_salary * CFE_RATE)  # CFE: 3.5%
 
         total_labor_taxes = taxe_logement + taxe_formation + taxe_emploi + contribution_cfe
         total_employer_cost = inps_employer + amo_employer + total_labor_taxes
@@ -194,42 +562,63 @@ class PayrollCalculator:
         # 8. Grand total cost
         total_cost = gross_salary + total_employer_cost
 
-        # Return complete result
-        return PayrollResult(
-            employee_id=input_data.employee_id,
-            base_salary=round(input_data.base_salary, 2),
-            days_worked=input_data.days_worked,
-            days_absent=input_data.days_absent,
-            adjusted_base_salary=round(adjusted_base, 2),
-            transport_allowance=round(transport, 2),
-            family_allowance=round(family, 2),
-            responsibility_allowance=round(responsibility, 2),
-            risk_allowance=round(risk, 2),
-            housing_allowance=round(housing, 2),
-            overtime_amount=round(overtime, 2),
-            bonus_amount=round(bonus, 2),
-            ind_spec_1973=round(ind_spec, 2),
-            cher_vie_1974=round(cher_vie, 2),
-            total_allowances=round(total_allowances, 2),
-            gross_salary=round(gross_salary, 2),
-            inps_employee=round(inps_employee, 2),
-            amo_employee=round(amo_employee, 2),
-            income_tax_net=round(income_tax, 2),
-            loan_deduction=round(input_data.loan_deduction, 2),
-            advance_deduction=round(input_data.advance_deduction, 2),
-            other_deductions=round(input_data.other_deductions, 2),
-            total_deductions=round(total_deductions, 2),
-            net_salary=round(net_salary, 2),
-            net_to_pay=round(net_to_pay, 2),
-            inps_employer=round(inps_employer, 2),
-            amo_employer=round(amo_employer, 2),
-            total_employer_cost=round(total_employer_cost, 2),
-            taxe_logement=round(taxe_logement, 2),
-            taxe_formation=round(taxe_formation, 2),
-            taxe_emploi=round(taxe_emploi, 2),
-            contribution_cfe=round(contribution_cfe, 2),
-            total_labor_taxes=round(total_labor_taxes, 2),
-            total_cost=round(total_cost, 2)
+        # Round the amounts to the cent, a single pass for the computed ones and
+        # one for those passed through from the input unless already rounded
+        input_amounts = (
+            input_data.base_salary,
+            family,
+            responsibility,
+            risk,
+            housing,
+            overtime,
+            bonus,
+            ind_spec,
+            cher_vie,
+            input_data.loan_deduction,
+            input_data.advance_deduction,
+            input_data.other_deductions
+        )
+        if not input_data.pre_rounded:
+            input_amounts = self._round_amounts(input_amounts)
+        (base_salary, family, responsibility, risk, housing, overtime, bonus,
+         ind_spec, cher_vie, loan, advance, other) = input_amounts
+
+        (adjusted_base, transport, total_allowances, gross_salary, inps_employee,
+         amo_employee, income_tax, total_deductions, net_salary, net_to_pay,
+         inps_employer, amo_employer, total_employer_cost, taxe_logement,
+         taxe_formation, taxe_emploi, contribution_cfe, total_labor_taxes,
+         total_cost) = self._round_amounts((
+            adjusted_base,
+            transport,
+            total_allowances,
+            gross_salary,
+            inps_employee,
+            amo_employee,
+            income_tax,
+            total_deductions,
+            net_salary,
+            net_to_pay,
+            inps_employer,
+            amo_employer,
+            total_employer_cost,
+            taxe_logement,
+            taxe_formation,
+            taxe_emploi,
+            contribution_cfe,
+            total_labor_taxes,
+            total_cost
+        ))
+
+        # Return complete result (values in PayrollResult field order)
+        return make_result(
+            input_data.employee_id, base_salary,
+            input_data.days_worked, input_data.days_absent,
+            adjusted_base, transport, family, responsibility, risk, housing,
+            overtime, bonus, ind_spec, cher_vie, total_allowances, gross_salary,
+            inps_employee, amo_employee, income_tax, loan, advance, other,
+            total_deductions, net_salary, net_to_pay, inps_employer, amo_employer,
+            total_employer_cost, taxe_logement, taxe_formation, taxe_emploi,
+            contribution_cfe, total_labor_taxes, total_cost
         )
 
     def _calculate_adjusted_base(self, base_salary: float,
@@ -246,18 +635,12 @@ class PayrollCalculator:
         Returns:
             Adjusted base salary
         """
-        # Standard working days per month
-        standard_days = 26
-
         # If no absences, return full salary
         if days_absent == 0:
             return base_salary
 
-        # Calculate daily rate
-        daily_rate = base_salary / standard_days
-
-        # Deduct absent days
-        absence_deduction = daily_rate * days_absent
+        # Deduct absent days at the daily rate
+        absence_deduction = base_salary / STANDARD_WORKING_DAYS * days_absent
         adjusted_base = base_salary - absence_deduction
 
         return max(0, adjusted_base)  # Ensure not negative
@@ -279,39 +662,11 @@ class PayrollCalculator:
         Returns:
             Family allowance amount in CFA
         """
-        if not status_code:
-            return 0.0
-
-        status_code = status_code.upper().strip()
+        return default_family_allowance(status_code)
 
-        # Extract marital status and number
-        marital_status = status_code[0]
-        try:
-            number = int(status_code[1:])
-        except (ValueError, IndexError):
-            return 0.0
-
-        # Single (Célibataire)
-        if marital_status == 'C':
-            if 0 <= number <= 1:
-                return 15000.0
-            elif 2 <= number <= 4:
-                return 25000.0
-            elif number >= 5:
-                return 35000.0
-
-        # Married (Marié)
-        elif marital_status == 'M':
-            if 0 <= number <= 2:
-                return 25000.0
-            elif 3 <= number <= 4:
-                return 35000.0
-            elif 5 <= number <= 7:
-                return 45000.0
-            elif number >= 8:
-                return 55000.0
 
-        return 0.0
+# Shared calculator for the convenience function
+_DEFAULT_PAYROLL_CALCULATOR = PayrollCalculator()
 
 
 # Convenience function for quick calculation
@@ -329,14 +684,9 @@ def calculate_payroll(employee_id: str, base_salary: float,
     Returns:
         PayrollResult with all calculations
     """
-    calculator = PayrollCalculator()
-
-    # Auto-calculate family allowance if not provided
-    if 'family_allowance' not in kwargs:
-        kwargs['family_allowance'] = calculator.calculate_family_allowance(
-            status_code, base_salary
-        )
+    calculator = _DEFAULT_PAYROLL_CALCULATOR
 
+    # PayrollInput fills in the family allowance when it is not provided
     input_data = PayrollInput(
         employee_id=employee_id,
         base_salary=base_salary,
@@ -3,11 +3,27 @@ Tax Calculator
 Progressive income tax calculation based on Malian tax brackets
 """
 
-from typing import List, Tuple, Optional
-from dataclasses import dataclass
+from __future__ import annotations
 
+import sys
+from bisect import bisect_right
+from functools import lru_cache
+from dataclasses import dataclass, replace
 
-@dataclass
+# Annotations only: importing typing at runtime is not needed
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import List, Tuple, Optional
+
+
+# Monthly tax results kept per calculator before the cache is reset
+MONTHLY_TAX_CACHE_SIZE = 4096
+
+# Slotted dataclasses (no per-instance __dict__) where supported (Python 3.10+)
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TaxBracket:
     """Tax bracket with min/max income and tax rate"""
     min_income: float
@@ -16,6 +32,91 @@ class TaxBracket:
     cumulative_tax: float = 0.0  # Tax from previous brackets
 
 
+def with_cumulative_tax(brackets: List[TaxBracket]) -> List[TaxBracket]:
+    """
+    Fill in the cumulative tax of each bracket from the brackets below it
+
+    Args:
+        brackets: Tax brackets in increasing order
+
+    Returns:
+        Copies of the brackets whose cumulative_tax is the tax charged on all
+        the lower brackets in full
+    """
+    result = []
+    tax = 0.0
+    for bracket in brackets:
+        result.append(replace(bracket, cumulative_tax=tax))
+        if bracket.max_income is not None:
+            tax += (bracket.max_income - bracket.min_income + 1) * bracket.tax_rate
+    return result
+
+
+@lru_cache(maxsize=256)
+def parse_status_code(status_code: str) -> Optional[Tuple[str, int]]:
+    """
+    Split an employee status code into marital status and number of children
+
+    Args:
+        status_code: Employee status code (e.g., "C0", "M08")
+
+    Returns:
+        (marital status letter, number), or None if the code is malformed
+    """
+    if not status_code:
+        return None
+
+    status_code = status_code.upper().strip()
+    number = status_code[1:]
+    if not number.isdecimal():
+        return None
+    return status_code[0], int(number)
+
+
+def _family_charge_reduction(status_code: str) -> float:
+    """Family charge reduction for a status code (see TaxCalculator.get_family_charge_reduction)"""
+    parsed = parse_status_code(status_code)
+    if parsed is None:
+        return 0.0
+    marital_status, number = parsed
+
+    # Single (Célibataire)
+    if marital_status == 'C':
+        if 0 <= number <= 4:
+            return 0.0
+        elif 5 <= number <= 9:
+            return 0.10
+        elif 10 <= number <= 15:
+            return 0.15
+
+    # Married (Marié)
+    elif marital_status == 'M':
+        if 0 <= number <= 4:
+            return 0.10
+        elif 5 <= number <= 9:
+            return 0.20
+        elif 10 <= number <= 20:
+            return 0.25
+
+    return 0.0
+
+
+# Status codes as stored for employees: C (single) or M (married) followed by
+# the number of children, with or without a leading zero
+STATUS_CODES = frozenset(
+    f'{marital_status}{number:{width}}'
+    for marital_status in 'CM'
+    for number in range(25)
+    for width in ('d', '02d')
+)
+
+# Family charge reduction per status code, so the common codes skip parsing
+FAMILY_CHARGE_REDUCTIONS = {
+    status_code: _family_charge_reduction(status_code) for status_code in STATUS_CODES
+}
+FAMILY_CHARGE_REDUCTIONS[''] = 0.0
+
+
 class TaxCalculator:
     """
     Calculate progressive income tax based on annual taxable income
@@ -36,9 +137,9 @@ class TaxCalculator:
         TaxBracket(330001, 578400, 0.05, 0),
         TaxBracket(578401, 1176400, 0.12, 12420),
         TaxBracket(1176401, 1789733, 0.18, 84180),
-        TaxBracket(1789734, 2384195, 0.26, 194579),
-        TaxBracket(2384196, 3494130, 0.31, 349134),
-        TaxBracket(3494131, None, 0.37, 693217)
+        TaxBracket(1789734, 2384195, 0.26, 194579.94),
+        TaxBracket(2384196, 3494130, 0.31, 349140.06),
+        TaxBracket(3494131, None, 0.37, 693219.91)
     ]
 
     def __init__(self, brackets: Optional[List[TaxBracket]] = None):
@@ -48,7 +149,33 @@ class TaxCalculator:
         Args:
             brackets: List of tax brackets (uses DEFAULT_BRACKETS if None)
         """
-        self.brackets = brackets or self.DEFAULT_BRACKETS
+        self.brackets = with_cumulative_tax(brackets or self.DEFAULT_BRACKETS)
+
+        # The tax is a continuous piecewise-linear function of the income: on
+        # each piece, tax = base_tax + (income - anchor) * rate. Brackets start
+        # one CFA above the previous maximum, so a bracket's anchor is
+        # min_income - 1; the gap between two brackets is a flat piece.
+        self._piece_starts = []
+        self._piece_anchors = []
+        self._piece_rates = []
+        self._piece_base_taxes = []
+        for bracket, next_bracket in zip(self.brackets, self.brackets[1:] + [None]):
+            self._add_piece(bracket.min_income, bracket.min_income - 1,
+                            bracket.tax_rate, bracket.cumulative_tax)
+            if (next_bracket is not None and bracket.max_income is not None
+                    and next_bracket.min_income > bracket.max_income):
+                self._add_piece(bracket.max_income, bracket.max_income,
+                                0.0, next_bracket.cumulative_tax)
+
+        # Income up to which no tax is due (the anchor of the first taxed bracket)
+        self._tax_free_income = 0.0
+        for bracket in self.brackets:
+            if bracket.tax_rate:
+                self._tax_free_income = max(0.0, bracket.min_income - 1)
+                break
+
+        # Monthly tax per (gross salary, reduction): salary bands repeat a lot
+        self._monthly_tax_cache = {}
 
     def calculate_annual_tax(self, annual_taxable_income: float) -> float:
         """
@@ -60,33 +187,28 @@ class TaxCalculator:
         Returns:
             Annual tax amount in CFA
         """
-        if annual_taxable_income <= 0:
+        if annual_taxable_income <= self._tax_free_income:
             return 0.0
 
-        tax = 0.0
-
-        for bracket in self.brackets:
-            # Skip if income is below this bracket
-            if annual_taxable_income < bracket.min_income:
-                break
+        # Piece starting at or below the income: one multiply-add
+        index = bisect_right(self._piece_starts, annual_taxable_income) - 1
+        if index < 0:
+            return 0.0
 
-            # Calculate taxable amount in this bracket
-            if bracket.max_income is None:
-                # Highest bracket - tax all remaining income
-                taxable_in_bracket = annual_taxable_income - bracket.min_income + 1
-            elif annual_taxable_income > bracket.max_income:
-                # Income exceeds this bracket - tax the full bracket
-                taxable_in_bracket = bracket.max_income - bracket.min_income + 1
-            else:
-                # Income falls within this bracket
-                taxable_in_bracket = annual_taxable_income - bracket.min_income + 1
-
-            # Add tax from this bracket
-            bracket_tax = taxable_in_bracket * bracket.tax_rate
-            tax += bracket_tax
+        tax = (
+            self._piece_base_taxes[index]
+            + (annual_taxable_income - self._piece_anchors[index]) * self._piece_rates[index]
+        )
 
         return round(tax, 2)
 
+    def _add_piece(self, start: float, anchor: float, rate: float, base_tax: float):
+        """Append a linear piece to the tax function"""
+        self._piece_starts.append(start)
+        self._piece_anchors.append(anchor)
+        self._piece_rates.append(rate)
+        self._piece_base_taxes.append(base_tax)
+
     def calculate_monthly_tax(self, monthly_gross_salary: float,
                              family_charge_reduction: float = 0.0) -> float:
         """
@@ -106,13 +228,40 @@ class TaxCalculator:
         if family_charge_reduction > 0:
             annual_taxable = annual_taxable * (1 - family_charge_reduction)
 
+        # Most low salaries owe nothing: skip the cache and the bracket lookup
+        if annual_taxable <= self._tax_free_income:
+            return 0.0
+
+        key = (monthly_gross_salary, family_charge_reduction)
+        monthly_tax = self._monthly_tax_cache.get(key)
+        if monthly_tax is not None:
+            return monthly_tax
+
         # Calculate annual tax
         annual_tax = self.calculate_annual_tax(annual_taxable)
 
         # Convert to monthly
-        monthly_tax = annual_tax / 12
+        monthly_tax = round(annual_tax / 12, 2)
+
+        if len(self._monthly_tax_cache) >= MONTHLY_TAX_CACHE_SIZE:
+            self._monthly_tax_cache.clear()
+        self._monthly_tax_cache[key] = monthly_tax
+        return monthly_tax
+
+    def calculate_monthly_taxes(self, monthly_gross_salaries: List[float],
+                                family_charge_reductions: List[float]) -> List[float]:
+        """
+        Calculate the monthly income tax of many employees at once
 
-        return round(monthly_tax, 2)
+        Args:
+            monthly_gross_salaries: Monthly gross salary of each employee in CFA
+            family_charge_reductions: Family charge reduction of each employee
+
+        Returns:
+            Monthly tax amount of each employee in CFA, in the same order
+        """
+        return list(map(self.calculate_monthly_tax, monthly_gross_salaries,
+                        family_charge_reductions))
 
     def get_family_charge_reduction(self, status_code: str) -> float:
         """
@@ -132,37 +281,22 @@ class TaxCalculator:
         Returns:
             Reduction percentage as decimal (0.0 to 0.25)
         """
-        if not status_code:
-            return 0.0
-
-        status_code = status_code.upper().strip()
+        reduction = FAMILY_CHARGE_REDUCTIONS.get(status_code)
+        if reduction is None:
+            reduction = _family_charge_reduction(status_code)
+        return reduction
 
-        # Extract marital status and number
-        marital_status = status_code[0]  # C or M
-        try:
-            number = int(status_code[1:])
-        except (ValueError, IndexError):
-            return 0.0
+    def get_family_charge_reductions(self, status_codes: List[str]) -> List[float]:
+        """
+        Get the family charge reduction of many employees at once
 
-        # Single (Célibataire)
-        if marital_status == 'C':
-            if 0 <= number <= 4:
-                return 0.0
-            elif 5 <= number <= 9:
-                return 0.10
-            elif 10 <= number <= 15:
-                return 0.15
-
-        # Married (Marié)
-        elif marital_status == 'M':
-            if 0 <= number <= 4:
-                return 0.10
-            elif 5 <= number <= 9:
-                return 0.20
-            elif 10 <= number <= 20:
-                return 0.25
+        Args:
+            status_codes: Status code of each employee
 
-        return 0.0
+        Returns:
+            Reduction of each employee as decimal, in the same order
+        """
+        return list(map(self.get_family_charge_reduction, status_codes))
 
     def calculate_tax_details(self, monthly_gross_salary: float,
                              status_code: str = "") -> dict:
@@ -199,6 +333,10 @@ class TaxCalculator:
         }
 
 
+# Shared calculator for the convenience function (brackets are read-only)
+_DEFAULT_TAX_CALCULATOR = TaxCalculator()
+
+
 # Convenience function for quick calculations
 def calculate_income_tax(monthly_gross: float, status_code: str = "") -> float:
     """
@@ -211,7 +349,7 @@ def calculate_income_tax(monthly_gross: float, status_code: str = "") -> float:
     Returns:
         Monthly tax amount in CFA
     """
-    calculator = TaxCalculator()
+    calculator = _DEFAULT_TAX_CALCULATOR
     return calculator.calculate_monthly_tax(
         monthly_gross,
         calculator.get_family_charge_reduction(status_code)
@@ -4,10 +4,203 @@ User authentication and session management
 """
 
 import hashlib
+import hmac
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict
+from functools import lru_cache
+from typing import Optional, Dict, List
 from database.connection import DatabaseConnection
+from utils.user_validation import user_error
+
+try:
+    from argon2 import PasswordHasher
+except ImportError:  # argon2-cffi not installed: hash with PBKDF2 only
+    PasswordHasher = None
+
+try:
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+except ImportError:  # cryptography not installed: hashlib's PBKDF2 only
+    PBKDF2HMAC = None
+
+
+# Argon2id with the OWASP recommended cost (64 MiB, 3 passes, 2 lanes)
+ARGON2_HASHER = PasswordHasher(
+    time_cost=3, memory_cost=65536, parallelism=2, hash_len=32, salt_len=16
+) if PasswordHasher is not None else None
+
+# Prefix of Argon2 encoded hashes
+ARGON2_PREFIX = "$argon2"
+
+# Prefix of PBKDF2-SHA512 hashes ("pbkdf2_sha512$<salt hex>$<hash hex>"), used
+# when argon2-cffi is not installed. Hashes with neither prefix are legacy
+# PBKDF2-SHA256 (salt + hash in hex)
+PBKDF2_SHA512_PREFIX = "pbkdf2_sha512$"
+
+# PBKDF2 parameters (fallback and legacy hashes)
+PBKDF2_ITERATIONS = 100000
+PBKDF2_SALT_BYTES = 32
+PBKDF2_HASH_BYTES = 32
+
+# Threads hashing a bulk import. Argon2 and OpenSSL's PBKDF2 run without the
+# GIL, so hashes run in parallel; each Argon2 hash holds 64 MiB while it runs
+BULK_HASH_WORKERS = min(4, os.cpu_count() or 1)
+
+# Smaller batches are hashed in the calling thread
+BULK_HASH_MIN_BATCH = 4
+
+# hashlib's PBKDF2 is OpenSSL's unless Python was built without OpenSSL, in
+# which case it is pure Python (3.9-3.11) or missing (3.12+). OpenSSL >= 1.1.0
+# picks the SHA-NI / AVX2 SHA-256 code for the CPU at run time.
+HASHLIB_PBKDF2_IS_OPENSSL = (
+    getattr(getattr(hashlib, 'pbkdf2_hmac', None), '__module__', None) == '_hashlib'
+)
+
+# HMAC pad translations for the pure Python PBKDF2
+HMAC_IPAD = bytes(x ^ 0x36 for x in range(256))
+HMAC_OPAD = bytes(x ^ 0x5C for x in range(256))
+
+# Statements run on every login, permission load and user listing, shared as
+# constants so every call hits the connection's statement cache (keyed by SQL
+# text). Values are always bound as parameters: SQL built with f-strings is a
+# new text per value and never reuses a compiled statement
+LOGIN_USER_SQL = """
+    SELECT user_id, username, password_hash, full_name, role, is_active
+    FROM users
+    WHERE LOWER(username) = LOWER(?)
+"""
+
+UPDATE_LAST_LOGIN_SQL = """
+    UPDATE users
+    SET last_login = ?
+    WHERE user_id = ?
+"""
+
+UPDATE_PASSWORD_SQL = """
+    UPDATE users
+    SET password_hash = ?
+    WHERE user_id = ?
+"""
+
+GET_USER_PERMISSIONS_SQL = """
+    SELECT * FROM user_permissions
+    WHERE user_id = ?
+"""
+
+USERNAME_EXISTS_SQL = "SELECT 1 FROM users WHERE LOWER(username) = LOWER(?) LIMIT 1"
+
+GET_ALL_USERS_SQL = """
+    SELECT user_id, username, full_name, role, is_active, last_login, created_at
+    FROM users
+    ORDER BY created_at DESC
+"""
+
+GET_USER_SQL = """
+    SELECT user_id, username, full_name, role, is_active, last_login, created_at
+    FROM users
+    WHERE user_id = ?
+"""
+
+INSERT_USER_SQL = """
+    INSERT INTO users (username, password_hash, full_name, role, is_active)
+    VALUES (?, ?, ?, ?, 1)
+"""
+
+# Default permissions of a user looked up by username: the same flags as
+# create_default_permissions, where admins get every permission and regular
+# users only the view/report ones
+INSERT_DEFAULT_PERMISSIONS_BY_USERNAME_SQL = """
+    INSERT INTO user_permissions (
+        user_id,
+        can_view_employees, can_edit_employees, can_delete_employees,
+        can_view_payroll, can_process_payroll, can_finalize_payroll,
+        can_view_loans, can_manage_loans,
+        can_generate_reports, can_export_data,
+        can_view_parameters, can_modify_parameters,
+        can_manage_users
+    )
+    SELECT user_id,
+           1, is_admin, is_admin,
+           1, is_admin, is_admin,
+           1, is_admin,
+           1, is_admin,
+           is_admin, is_admin,
+           is_admin
+    FROM (SELECT user_id, role = 'admin' AS is_admin FROM users WHERE username = ?)
+"""
+
+
+def _pbkdf2_python(hash_name: str, password: bytes, salt: bytes, iterations: int,
+                   dklen: int) -> bytes:
+    """
+    Derive a PBKDF2-HMAC key of at most one digest in pure Python
+
+    The keyed inner and outer hash states are built once and copied for
+    every iteration, so each iteration costs two compressions and no HMAC
+    key setup. U_1 xor ... xor U_c is accumulated as an int.
+    """
+    inner = hashlib.new(hash_name)
+    outer = hashlib.new(hash_name)
+    if len(password) > inner.block_size:
+        password = hashlib.new(hash_name, password).digest()
+    password = password.ljust(inner.block_size, b'\0')
+    inner.update(password.translate(HMAC_IPAD))
+    outer.update(password.translate(HMAC_OPAD))
+
+    def prf(message):
+        icpy = inner.copy()
+        ocpy = outer.copy()
+        icpy.update(message)
+        ocpy.update(icpy.digest())
+        return ocpy.digest()
+
+    u = prf(salt + b'\x00\x00\x00\x01')
+    result = int.from_bytes(u, 'big')
+    for _ in range(iterations - 1):
+        u = prf(u)
+        result ^= int.from_bytes(u, 'big')
+    return result.to_bytes(inner.digest_size, 'big')[:dklen]
+
+
+def _pbkdf2(hash_name: str, password: str, salt: bytes) -> bytes:
+    """
+    Derive the PBKDF2-HMAC key of a password ('sha256' or 'sha512')
+
+    hashlib.pbkdf2_hmac is OpenSSL's PKCS5_PBKDF2_HMAC (HMAC states set up
+    once, GIL released), so it is used directly rather than through ctypes.
+    Without an OpenSSL-backed hashlib, cryptography's OpenSSL PBKDF2 is used
+    when installed, else _pbkdf2_python.
+    """
+    if not HASHLIB_PBKDF2_IS_OPENSSL:
+        if PBKDF2HMAC is not None:
+            algorithm = hashes.SHA512() if hash_name == 'sha512' else hashes.SHA256()
+            kdf = PBKDF2HMAC(
+                algorithm=algorithm, length=PBKDF2_HASH_BYTES, salt=salt,
+                iterations=PBKDF2_ITERATIONS
+            )
+            return kdf.derive(password.encode('utf-8'))
+        return _pbkdf2_python(
+            hash_name, password.encode('utf-8'), salt, PBKDF2_ITERATIONS, PBKDF2_HASH_BYTES
+        )
+
+    return hashlib.pbkdf2_hmac(
+        hash_name, password.encode('utf-8'), salt, PBKDF2_ITERATIONS, PBKDF2_HASH_BYTES
+    )
+
+
+@lru_cache(maxsize=64)
+def _parse_pbkdf2_hash(password_hash: str) -> tuple[str, bytes, bytes]:
+    """
+    Split a stored PBKDF2 hash into (hash name, salt, hash), decoded from hex
+    once per stored hash rather than on every verification
+    """
+    if password_hash.startswith(PBKDF2_SHA512_PREFIX):
+        salt_hex, hash_hex = password_hash[len(PBKDF2_SHA512_PREFIX):].split('$')
+        return 'sha512', bytes.fromhex(salt_hex), bytes.fromhex(hash_hex)
+
+    # Legacy SHA-256: salt is the first 64 characters (32 bytes in hex)
+    return 'sha256', bytes.fromhex(password_hash[:64]), bytes.fromhex(password_hash[64:])
 
 
 class AuthManager:
@@ -19,7 +212,8 @@ class AuthManager:
     @staticmethod
     def hash_password(password: str) -> str:
         """
-        Hash a password using SHA-256 with salt
+        Hash a password using Argon2id, or PBKDF2-SHA512 with salt when
+        argon2-cffi is not installed
 
         Args:
             password: Plain text password
@@ -27,19 +221,34 @@ class AuthManager:
         Returns:
             Hashed password with salt
         """
+        if ARGON2_HASHER is not None:
+            return ARGON2_HASHER.hash(password)
+
         # Generate a random salt
-        salt = os.urandom(32)
-
-        # Hash password with salt using SHA-256
-        pwd_hash = hashlib.pbkdf2_hmac(
-            'sha256',
-            password.encode('utf-8'),
-            salt,
-            100000  # 100,000 iterations
-        )
+        salt = os.urandom(PBKDF2_SALT_BYTES)
+
+        # Hash password with salt using SHA-512 (64-bit words, faster on 64-bit CPUs)
+        pwd_hash = _pbkdf2('sha512', password, salt)
 
         # Store salt and hash together
-        return salt.hex() + pwd_hash.hex()
+        return f"{PBKDF2_SHA512_PREFIX}{salt.hex()}${pwd_hash.hex()}"
+
+    @classmethod
+    def hash_passwords_bulk(cls, passwords: List[str]) -> List[str]:
+        """
+        Hash many passwords, in parallel threads for larger batches
+
+        Args:
+            passwords: Plain text passwords
+
+        Returns:
+            Hashes in the order of the passwords, as given by hash_password
+        """
+        if len(passwords) < BULK_HASH_MIN_BATCH or BULK_HASH_WORKERS < 2:
+            return [cls.hash_password(password) for password in passwords]
+
+        with ThreadPoolExecutor(max_workers=BULK_HASH_WORKERS) as executor:
+            return list(executor.map(cls.hash_password, passwords))
 
     @staticmethod
     def verify_password(password: str, password_hash: str) -> bool:
@@ -54,23 +263,38 @@ class AuthManager:
             True if password matches, False otherwise
         """
         try:
-            # Extract salt (first 64 characters = 32 bytes in hex)
-            salt = bytes.fromhex(password_hash[:64])
-            stored_hash = password_hash[64:]
+            if password_hash.startswith(ARGON2_PREFIX):
+                # Raises VerificationError on mismatch
+                return ARGON2_HASHER is not None and ARGON2_HASHER.verify(password_hash, password)
+
+            hash_name, salt, stored_hash = _parse_pbkdf2_hash(password_hash)
 
             # Hash the provided password with the same salt
-            pwd_hash = hashlib.pbkdf2_hmac(
-                'sha256',
-                password.encode('utf-8'),
-                salt,
-                100000
-            )
+            pwd_hash = _pbkdf2(hash_name, password, salt)
 
-            # Compare hashes
-            return pwd_hash.hex() == stored_hash
+            # Compare hashes in constant time
+            return hmac.compare_digest(pwd_hash, stored_hash)
         except Exception:
             return False
 
+    @staticmethod
+    def password_needs_rehash(password_hash: str) -> bool:
+        """
+        Check if a stored hash should be replaced by a fresh hash_password hash
+
+        Args:
+            password_hash: Stored password hash
+
+        Returns:
+            True for legacy PBKDF2-SHA256 hashes, PBKDF2-SHA512 hashes when
+            Argon2 is available, or outdated Argon2 parameters
+        """
+        if ARGON2_HASHER is None:
+            return not password_hash.startswith((ARGON2_PREFIX, PBKDF2_SHA512_PREFIX))
+        if not password_hash.startswith(ARGON2_PREFIX):
+            return True
+        return ARGON2_HASHER.check_needs_rehash(password_hash)
+
     @classmethod
     def login(cls, username: str, password: str) -> tuple[bool, Optional[str]]:
         """
@@ -90,11 +314,7 @@ class AuthManager:
             username_normalized = username.strip()
 
             # Get user from database (case-insensitive search)
-            cursor = conn.execute("""
-                SELECT user_id, username, password_hash, full_name, role, is_active
-                FROM users
-                WHERE LOWER(username) = LOWER(?)
-            """, (username_normalized,))
+            cursor = conn.execute(LOGIN_USER_SQL, (username_normalized,))
 
             user = cursor.fetchone()
 
@@ -113,12 +333,14 @@ class AuthManager:
                 print(f"DEBUG: Password (repr): {repr(password)}")
                 return False, "Nom d'utilisateur ou mot de passe incorrect"
 
+            # Upgrade legacy hashes while the plain password is known
+            if cls.password_needs_rehash(user['password_hash']):
+                conn.execute(
+                    UPDATE_PASSWORD_SQL, (cls.hash_password(password), user['user_id'])
+                )
+
             # Update last login
-            conn.execute("""
-                UPDATE users
-                SET last_login = ?
-                WHERE user_id = ?
-            """, (datetime.now().isoformat(), user['user_id']))
+            conn.execute(UPDATE_LAST_LOGIN_SQL, (datetime.now().isoformat(), user['user_id']))
             conn.commit()
 
             # Create session
@@ -129,6 +351,10 @@ class AuthManager:
                 'role': user['role']
             }
 
+            # Permissions are read once per session; has_permission uses this copy
+            permissions = cls.get_user_permissions(user['user_id'])
+            cls.current_user['permissions'] = dict(permissions) if permissions else {}
+
             print(f"Login successful for user '{user['username']}'")
             return True, None
 
@@ -160,7 +386,8 @@ class AuthManager:
 
     @classmethod
     def create_user(cls, username: str, password: str, full_name: str,
-                   role: str = 'user') -> tuple[bool, Optional[str]]:
+                   role: str = 'user',
+                   password_hash: Optional[str] = None) -> tuple[Optional[Dict], Optional[str]]:
         """
         Create a new user (admin only)
 
@@ -169,12 +396,15 @@ class AuthManager:
             password: Plain text password (will be hashed)
             full_name: User's full name
             role: 'admin' or 'user'
+            password_hash: Hash of the password when already computed
+                (e.g. off the UI thread); the password is then not hashed again
 
         Returns:
-            Tuple of (success, error_message)
+            Tuple of (created user as listed by get_all_users, error_message);
+            the user is None on failure
         """
         if not cls.is_admin():
-            return False, "Seuls les administrateurs peuvent créer des utilisateurs"
+            return None, "Seuls les administrateurs peuvent créer des utilisateurs"
 
         try:
             conn = DatabaseConnection.get_connection()
@@ -184,21 +414,21 @@ class AuthManager:
             full_name_normalized = full_name.strip()
 
             # Check if username already exists (case-insensitive)
-            cursor = conn.execute("SELECT username FROM users WHERE LOWER(username) = LOWER(?)", (username_normalized,))
-            if cursor.fetchone():
-                return False, "Ce nom d'utilisateur existe déjà"
+            if cls.username_exists(username_normalized):
+                return None, "Ce nom d'utilisateur existe déjà"
 
             # Hash password
-            password_hash = cls.hash_password(password)
+            if password_hash is None:
+                password_hash = cls.hash_password(password)
             print(f"DEBUG: Creating user with password length: {len(password)}")
             print(f"DEBUG: Password (repr): {repr(password)}")
             print(f"DEBUG: Generated hash length: {len(password_hash)}")
 
             # Insert user
-            cursor = conn.execute("""
-                INSERT INTO users (username, password_hash, full_name, role, is_active)
-                VALUES (?, ?, ?, ?, 1)
-            """, (username_normalized, password_hash, full_name_normalized, role))
+            cursor = conn.execute(
+                INSERT_USER_SQL,
+                (username_normalized, password_hash, full_name_normalized, role)
+            )
             conn.commit()
 
             # Get the new user ID
@@ -208,13 +438,126 @@ class AuthManager:
             cls.create_default_permissions(new_user_id, is_admin=(role == 'admin'))
 
             print(f"User '{username_normalized}' created successfully with ID {new_user_id}")
-            return True, None
+            return cls.get_user(new_user_id), None
 
         except Exception as e:
             print(f"Error creating user: {str(e)}")
             import traceback
             traceback.print_exc()
-            return False, f"Erreur lors de la création: {str(e)}"
+            return None, f"Erreur lors de la création: {str(e)}"
+
+    @staticmethod
+    def _bulk_user_rows(conn, users: List[Dict]) -> tuple[list, list, Optional[str]]:
+        """
+        Check users to import against the user rules and the existing usernames
+
+        Returns:
+            Tuple of (user rows without password hash, passwords, error_message);
+            the message gives the first rejected user's row, numbered from 1
+        """
+        # Usernames are unique case-insensitively, also within the batch
+        taken = {row['username'].lower() for row in conn.execute("SELECT username FROM users")}
+
+        user_rows = []
+        passwords = []
+        for row_number, user in enumerate(users, 1):
+            username = (user.get('username') or '').strip()
+            full_name = (user.get('full_name') or '').strip()
+            password = user.get('password') or ''
+
+            error = user_error(username, full_name, password)
+            if error:
+                return [], [], f"Ligne {row_number}: {error}"
+            if username.lower() in taken:
+                return [], [], f"Ligne {row_number}: Le nom d'utilisateur '{username}' existe déjà"
+            taken.add(username.lower())
+
+            role = 'admin' if user.get('role') == 'admin' else 'user'
+            user_rows.append([username, None, full_name, role])
+            passwords.append(password)
+
+        return user_rows, passwords, None
+
+    @classmethod
+    def validate_users_bulk(cls, users: List[Dict]) -> Optional[str]:
+        """
+        Check users to import with create_users_bulk, without creating them
+
+        Args:
+            users: Dictionaries with username, password, full_name and role
+
+        Returns:
+            Error message for the first rejected user (row numbered from 1),
+            or None when all users can be created
+        """
+        try:
+            return cls._bulk_user_rows(DatabaseConnection.get_connection(), users)[2]
+        except Exception as e:
+            return f"Erreur lors de l'import: {str(e)}"
+
+    @classmethod
+    def create_users_bulk(cls, users: List[Dict],
+                          password_hashes: Optional[List[str]] = None) -> tuple[int, Optional[str]]:
+        """
+        Create many users with their default permissions in a single
+        transaction (admin only)
+
+        Each user is checked against the same rules as the user dialogs
+        before any password is hashed.
+
+        Args:
+            users: Dictionaries with username, password, full_name and role
+                (missing values may be None, as csv.DictReader gives them)
+            password_hashes: Hashes of the users' passwords, in order, when
+                already computed (e.g. off the UI thread); the passwords are
+                then not hashed again
+
+        Returns:
+            Tuple of (number of users created, error_message); nothing is
+            created when any user is rejected, and the message gives the
+            rejected user's row, numbered from 1
+        """
+        if not cls.is_admin():
+            return 0, "Seuls les administrateurs peuvent créer des utilisateurs"
+
+        conn = DatabaseConnection.get_connection()
+        try:
+            user_rows, passwords, error = cls._bulk_user_rows(conn, users)
+            if error:
+                return 0, error
+
+            # Passwords are hashed only once the whole batch is accepted
+            if password_hashes is None:
+                password_hashes = cls.hash_passwords_bulk(passwords)
+            for user_row, password_hash in zip(user_rows, password_hashes):
+                user_row[1] = password_hash
+
+            conn.executemany(INSERT_USER_SQL, user_rows)
+            conn.executemany(
+                INSERT_DEFAULT_PERMISSIONS_BY_USERNAME_SQL,
+                [(row[0],) for row in user_rows]
+            )
+            conn.commit()
+            return len(user_rows), None
+
+        except Exception as e:
+            conn.rollback()
+            return 0, f"Erreur lors de l'import: {str(e)}"
+
+    @classmethod
+    def username_exists(cls, username: str) -> bool:
+        """
+        Check if a username is already taken (case-insensitive)
+
+        Args:
+            username: Username to look up
+
+        Returns:
+            True if a user with this name exists
+        """
+        conn = DatabaseConnection.get_connection()
+        cursor = conn.execute(USERNAME_EXISTS_SQL, (username.strip(),))
+        return cursor.fetchone() is not None
 
     @classmethod
     def create_default_admin(cls) -> bool:
@@ -239,10 +582,9 @@ class AuthManager:
             # Create default admin
             password_hash = cls.hash_password("admin")
 
-            cursor = conn.execute("""
-                INSERT INTO users (username, password_hash, full_name, role, is_active)
-                VALUES (?, ?, ?, ?, 1)
-            """, ("admin", password_hash, "Administrateur", "admin"))
+            cursor = conn.execute(
+                INSERT_USER_SQL, ("admin", password_hash, "Administrateur", "admin")
+            )
             conn.commit()
 
             # Get the admin user ID
@@ -261,13 +603,16 @@ class AuthManager:
             return False
 
     @classmethod
-    def change_password(cls, user_id: int, new_password: str) -> tuple[bool, Optional[str]]:
+    def change_password(cls, user_id: int, new_password: str,
+                        password_hash: Optional[str] = None) -> tuple[bool, Optional[str]]:
         """
         Change user password
 
         Args:
             user_id: User ID
             new_password: New plain text password
+            password_hash: Hash of the new password when already computed
+                (e.g. off the UI thread); the password is then not hashed again
 
         Returns:
             Tuple of (success, error_message)
@@ -280,14 +625,11 @@ class AuthManager:
             conn = DatabaseConnection.get_connection()
 
             # Hash new password
-            password_hash = cls.hash_password(new_password)
+            if password_hash is None:
+                password_hash = cls.hash_password(new_password)
 
             # Update password
-            conn.execute("""
-                UPDATE users
-                SET password_hash = ?
-                WHERE user_id = ?
-            """, (password_hash, user_id))
+            conn.execute(UPDATE_PASSWORD_SQL, (password_hash, user_id))
             conn.commit()
 
             return True, None
@@ -373,17 +715,31 @@ class AuthManager:
         try:
             conn = DatabaseConnection.get_connection()
 
-            cursor = conn.execute("""
-                SELECT user_id, username, full_name, role, is_active, last_login, created_at
-                FROM users
-                ORDER BY created_at DESC
-            """)
+            cursor = conn.execute(GET_ALL_USERS_SQL)
 
             return cursor.fetchall()
 
         except Exception:
             return []
 
+    @classmethod
+    def get_user(cls, user_id: int) -> Optional[Dict]:
+        """
+        Get a single user with the fields listed by get_all_users
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            User dictionary or None
+        """
+        conn = DatabaseConnection.get_connection()
+
+        cursor = conn.execute(GET_USER_SQL, (user_id,))
+
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
     # ========================================================================
     # Permission Management Methods
     # ========================================================================
@@ -407,10 +763,7 @@ class AuthManager:
         try:
             conn = DatabaseConnection.get_connection()
 
-            cursor = conn.execute("""
-                SELECT * FROM user_permissions
-                WHERE user_id = ?
-            """, (user_id,))
+            cursor = conn.execute(GET_USER_PERMISSIONS_SQL, (user_id,))
 
             return cursor.fetchone()
 
@@ -420,7 +773,8 @@ class AuthManager:
     @classmethod
     def has_permission(cls, permission: str) -> bool:
         """
-        Check if current user has a specific permission
+        Check if current user has a specific permission, from the
+        permissions cached in the session at login
 
         Args:
             permission: Permission name (e.g., 'can_edit_employees')
@@ -435,11 +789,7 @@ class AuthManager:
         if cls.is_admin():
             return True
 
-        permissions = cls.get_user_permissions()
-        if not permissions:
-            return False
-
-        return permissions.get(permission, False) == 1
+        return cls.current_user['permissions'].get(permission, 0) == 1
 
     @classmethod
     def set_user_permissions(cls, user_id: int, permissions: Dict) -> tuple[bool, Optional[str]]:
@@ -483,6 +833,10 @@ class AuthManager:
                 """, values)
 
             conn.commit()
+
+            # Keep the session's permission cache in step
+            if cls.current_user and cls.current_user['user_id'] == user_id:
+                cls.current_user['permissions'].update(permissions)
             return True, None
 
         except Exception as e:
@@ -8,6 +8,21 @@ import os
 from pathlib import Path
 from typing import Optional
 
+# Number of compiled statements kept per connection (sqlite3 default is 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Bytes of the database file read through a memory map (no read() calls)
+MMAP_SIZE = 256 * 1024 * 1024
+
+# Page cache per connection, in KiB when negative (sqlite3 default is 2 MiB)
+CACHE_SIZE_KIB = 64 * 1024
+
+# WAL pages after which a commit checkpoints the log into the database
+WAL_AUTOCHECKPOINT_PAGES = 1000
+
+# Tracebacks from user-defined SQL callbacks are not useful to end users
+sqlite3.enable_callback_tracebacks(False)
+
 
 class DatabaseConnection:
     """Singleton database connection manager"""
@@ -48,14 +63,15 @@ class DatabaseConnection:
             os.makedirs(db_dir)
 
         # Connect to database
-        instance._connection = sqlite3.connect(
-            database_path,
-            check_same_thread=False  # Allow multi-threaded access
-        )
+        instance._connection = cls.create_connection(database_path)
 
         # Enable foreign key constraints
         instance._connection.execute("PRAGMA foreign_keys = ON")
 
+        # Write-ahead logging (persistent): background readers and writers do not
+        # block the GUI connection and commits need fewer fsyncs
+        instance._connection.execute("PRAGMA journal_mode = WAL")
+
         # Set row factory to return dict-like objects
         instance._connection.row_factory = sqlite3.Row
 
@@ -64,6 +80,31 @@ class DatabaseConnection:
 
         return instance
 
+    @staticmethod
+    def create_connection(database_path: str) -> sqlite3.Connection:
+        """
+        Open a raw SQLite connection with the application's statement cache size
+
+        Args:
+            database_path: Path to the SQLite database file
+
+        Returns:
+            sqlite3.Connection object (no row factory, foreign keys not enabled)
+        """
+        connection = sqlite3.connect(
+            database_path,
+            check_same_thread=False,  # Allow multi-threaded access
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
+        # Safe with WAL: a commit survives application crashes, only an OS
+        # crash can lose the last transactions (the database stays consistent)
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.execute("PRAGMA temp_store = MEMORY")
+        connection.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+        connection.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KIB}")
+        connection.execute(f"PRAGMA wal_autocheckpoint = {WAL_AUTOCHECKPOINT_PAGES}")
+        return connection
+
     def _initialize_schema(self):
         """Initialize database schema if tables don't exist"""
         # Check if employees table exists
@@ -160,6 +201,8 @@ class DatabaseConnection:
                         backup_path = os.path.join(BACKUP_DIR, f'pre_migration_{timestamp}.db')
 
                         try:
+                            # Move WAL content into the database file before copying it
+                            self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
                             shutil.copy2(self._database_path, backup_path)
                             print(f"Migration: Backup created at {backup_path}")
                         except Exception as backup_error:
@@ -265,6 +308,57 @@ class DatabaseConnection:
                 except:
                     pass
 
+        # Migration 3: Trigger-maintained active employee counter (app_metadata)
+        try:
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS app_metadata (
+                    key TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL DEFAULT 0
+                );
+
+                CREATE TRIGGER IF NOT EXISTS employees_active_count_insert
+                AFTER INSERT ON employees
+                FOR EACH ROW WHEN NEW.is_active = 1
+                BEGIN
+                    UPDATE app_metadata SET value = value + 1 WHERE key = 'active_employee_count';
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS employees_active_count_delete
+                AFTER DELETE ON employees
+                FOR EACH ROW WHEN OLD.is_active = 1
+                BEGIN
+                    UPDATE app_metadata SET value = value - 1 WHERE key = 'active_employee_count';
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS employees_active_count_update
+                AFTER UPDATE OF is_active ON employees
+                FOR EACH ROW WHEN (OLD.is_active = 1) <> (NEW.is_active = 1)
+                BEGIN
+                    UPDATE app_metadata
+                    SET value = value + (CASE WHEN NEW.is_active = 1 THEN 1 ELSE -1 END)
+                    WHERE key = 'active_employee_count';
+                END;
+
+                -- Resynchronize the counter with the table at startup
+                INSERT OR REPLACE INTO app_metadata (key, value)
+                VALUES ('active_employee_count',
+                        (SELECT COUNT(*) FROM employees WHERE is_active = 1));
+            """)
+        except Exception as e:
+            print(f"Migration warning (app_metadata): {e}")
+
+        # Migration 4: Indexes for the dashboard latest-period / net-to-pay queries
+        try:
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_pp_start ON payroll_periods(period_start_date DESC)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_pr_period_net ON payroll_records(period_id, net_to_pay)"
+            )
+            self._connection.commit()
+        except Exception as e:
+            print(f"Migration warning (dashboard indexes): {e}")
+
     @classmethod
     def get_connection(cls) -> sqlite3.Connection:
         """
@@ -385,6 +479,9 @@ class DatabaseConnection:
             # Commit any pending transactions
             cls.commit()
 
+            # Move WAL content into the database file so the copy is complete
+            cls._instance._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
             # Create backup directory if needed
             backup_dir = os.path.dirname(backup_path)
             if backup_dir and not os.path.exists(backup_dir):
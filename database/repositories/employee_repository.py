@@ -5,7 +5,7 @@ Handles all database operations for employees
 
 import sys
 import os
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 # Add parent directories to path
@@ -39,6 +39,25 @@ class EmployeeRepository:
         rows = DatabaseConnection.fetch_all(query)
         return [Employee.from_db_row(row) for row in rows]
 
+    @staticmethod
+    def get_all_by_id(include_inactive: bool = False) -> Dict[str, Employee]:
+        """
+        Get all employees keyed by employee ID
+
+        Args:
+            include_inactive: Include inactive employees
+
+        Returns:
+            Dictionary of employee_id -> Employee
+        """
+        query = "SELECT * FROM employees"
+
+        if not include_inactive:
+            query += " WHERE is_active = 1"
+
+        rows = DatabaseConnection.fetch_all(query)
+        return {row['employee_id']: Employee.from_db_row(row) for row in rows}
+
     @staticmethod
     def get_by_id(employee_id: str) -> Optional[Employee]:
         """
@@ -292,7 +311,7 @@ class EmployeeRepository:
         """
         query = "SELECT COUNT(*) as count FROM employees WHERE employee_id = ?"
         row = DatabaseConnection.fetch_one(query, (employee_id,))
-        return row['count'] > 0 if row else False
+        return row[0] > 0 if row else False
 
     @staticmethod
     def get_count(include_inactive: bool = False) -> int:
@@ -311,7 +330,7 @@ class EmployeeRepository:
             query += " WHERE is_active = 1"
 
         row = DatabaseConnection.fetch_one(query)
-        return row['count'] if row else 0
+        return row[0] if row else 0
 
     @staticmethod
     def get_next_employee_id() -> str:
@@ -349,7 +368,7 @@ class EmployeeRepository:
             ORDER BY department_code
         """
         rows = DatabaseConnection.fetch_all(query)
-        return [row['department_code'] for row in rows]
+        return [row[0] for row in rows]
 
     @staticmethod
     def get_categories() -> List[str]:
@@ -366,4 +385,4 @@ class EmployeeRepository:
             ORDER BY category
         """
         rows = DatabaseConnection.fetch_all(query)
-        return [row['category'] for row in rows]
+        return [row[0] for row in rows]
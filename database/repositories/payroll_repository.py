@@ -3,13 +3,143 @@ Payroll Repository
 Database operations for payroll periods and records
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import date, datetime
 import sqlite3
 
 from database.connection import DatabaseConnection
 
 
+# Statements writing payroll_records. Kept as module constants so every call
+# sends the same SQL text and hits the connection's statement cache.
+INSERT_PAYROLL_RECORD_SQL = """
+    INSERT INTO payroll_records (
+        period_id, employee_id,
+        base_salary, days_worked, days_absent,
+        ind_transport, family_allowance, responsibility_allowance,
+        risk_premium, vehicle_allowance, overtime_pay,
+        ind_spe_1973, ind_cher_vie_1974,
+        gross_salary,
+        inps_employee, amo_employee, income_tax_net,
+        advances_loans_deduction,
+        net_salary, net_to_pay,
+        inps_employer, amo_employer,
+        tl_tax, tfp_tax, atej_tax, cfe_tax,
+        total_payroll_cost
+    ) VALUES (
+        ?, ?,
+        ?, ?, ?,
+        ?, ?, ?,
+        ?, ?, ?,
+        ?, ?,
+        ?,
+        ?, ?, ?,
+        ?,
+        ?, ?,
+        ?, ?,
+        ?, ?, ?, ?,
+        ?
+    )
+"""
+
+# Upsert on UNIQUE(period_id, employee_id) keeps record_id and untouched columns
+UPSERT_PAYROLL_RECORD_SQL = INSERT_PAYROLL_RECORD_SQL + """
+    ON CONFLICT(period_id, employee_id) DO UPDATE SET
+        base_salary = excluded.base_salary,
+        days_worked = excluded.days_worked,
+        days_absent = excluded.days_absent,
+        ind_transport = excluded.ind_transport,
+        family_allowance = excluded.family_allowance,
+        responsibility_allowance = excluded.responsibility_allowance,
+        risk_premium = excluded.risk_premium,
+        vehicle_allowance = excluded.vehicle_allowance,
+        overtime_pay = excluded.overtime_pay,
+        ind_spe_1973 = excluded.ind_spe_1973,
+        ind_cher_vie_1974 = excluded.ind_cher_vie_1974,
+        gross_salary = excluded.gross_salary,
+        inps_employee = excluded.inps_employee,
+        amo_employee = excluded.amo_employee,
+        income_tax_net = excluded.income_tax_net,
+        advances_loans_deduction = excluded.advances_loans_deduction,
+        net_salary = excluded.net_salary,
+        net_to_pay = excluded.net_to_pay,
+        inps_employer = excluded.inps_employer,
+        amo_employer = excluded.amo_employer,
+        tl_tax = excluded.tl_tax,
+        tfp_tax = excluded.tfp_tax,
+        atej_tax = excluded.atej_tax,
+        cfe_tax = excluded.cfe_tax,
+        total_payroll_cost = excluded.total_payroll_cost
+"""
+
+UPDATE_PAYROLL_RECORD_SQL = """
+    UPDATE payroll_records SET
+        base_salary = ?,
+        days_worked = ?,
+        days_absent = ?,
+        ind_transport = ?,
+        family_allowance = ?,
+        responsibility_allowance = ?,
+        risk_premium = ?,
+        vehicle_allowance = ?,
+        overtime_pay = ?,
+        ind_spe_1973 = ?,
+        ind_cher_vie_1974 = ?,
+        gross_salary = ?,
+        inps_employee = ?,
+        amo_employee = ?,
+        income_tax_net = ?,
+        advances_loans_deduction = ?,
+        net_salary = ?,
+        net_to_pay = ?,
+        inps_employer = ?,
+        amo_employer = ?,
+        tl_tax = ?,
+        tfp_tax = ?,
+        atej_tax = ?,
+        cfe_tax = ?,
+        total_payroll_cost = ?
+    WHERE record_id = ?
+"""
+
+
+def _payroll_record_values(payroll_data: Dict[str, Any]) -> tuple:
+    """Column values of a payroll record, in the order used by the SQL above"""
+    # Calculate total advances/loans deduction
+    advances_total = (
+        payroll_data.get('loan_deduction', 0) +
+        payroll_data.get('advance_deduction', 0) +
+        payroll_data.get('other_deductions', 0)
+    )
+    return (
+        payroll_data.get('base_salary', 0),
+        payroll_data.get('days_worked', 26),
+        payroll_data.get('days_absent', 0),
+        payroll_data.get('transport_allowance', 0),
+        payroll_data.get('family_allowance', 0),
+        payroll_data.get('responsibility_allowance', 0),
+        payroll_data.get('risk_allowance', 0),
+        payroll_data.get('housing_allowance', 0),
+        payroll_data.get('overtime_amount', 0),
+        payroll_data.get('ind_spec_1973', 0),
+        payroll_data.get('cher_vie_1974', 0),
+        payroll_data.get('gross_salary', 0),
+        payroll_data.get('inps_employee', 0),
+        payroll_data.get('amo_employee', 0),
+        payroll_data.get('income_tax_net', 0),
+        advances_total,
+        payroll_data.get('net_salary', 0),
+        payroll_data.get('net_to_pay', 0),
+        payroll_data.get('inps_employer', 0),
+        payroll_data.get('amo_employer', 0),
+        payroll_data.get('taxe_logement', 0),
+        payroll_data.get('taxe_formation', 0),
+        payroll_data.get('taxe_emploi', 0),
+        payroll_data.get('contribution_cfe', 0),
+        payroll_data.get('total_cost', 0)
+    )
+
+
 class PayrollRepository:
     """Repository for payroll period and record operations"""
 
@@ -45,11 +175,17 @@ class PayrollRepository:
             include_finalized: Whether to include finalized periods
 
         Returns:
-            List of period dictionaries
+            List of period dictionaries, each with a display label
+            ("<start> au <end>", suffixed with " [Finalisée]")
         """
         conn = DatabaseConnection.get_connection()
 
-        query = "SELECT * FROM payroll_periods"
+        query = """
+            SELECT *,
+                period_start_date || ' au ' || period_end_date ||
+                CASE WHEN is_finalized THEN ' [Finalisée]' ELSE '' END AS label
+            FROM payroll_periods
+        """
         if not include_finalized:
             query += " WHERE is_finalized = 0"
         query += " ORDER BY period_start_date DESC"
@@ -165,79 +301,10 @@ class PayrollRepository:
             return record_id
         else:
             # Insert new record
-            # Calculate total advances/loans deduction
-            advances_total = (
-                payroll_data.get('loan_deduction', 0) +
-                payroll_data.get('advance_deduction', 0) +
-                payroll_data.get('other_deductions', 0)
-            )
-
-            # Calculate total employer cost (taxes)
-            total_employer = (
-                payroll_data.get('inps_employer', 0) +
-                payroll_data.get('amo_employer', 0) +
-                payroll_data.get('taxe_logement', 0) +
-                payroll_data.get('taxe_formation', 0) +
-                payroll_data.get('taxe_emploi', 0) +
-                payroll_data.get('contribution_cfe', 0)
+            cursor = conn.execute(
+                INSERT_PAYROLL_RECORD_SQL,
+                (period_id, employee_id) + _payroll_record_values(payroll_data)
             )
-
-            cursor = conn.execute("""
-                INSERT INTO payroll_records (
-                    period_id, employee_id,
-                    base_salary, days_worked, days_absent,
-                    ind_transport, family_allowance, responsibility_allowance,
-                    risk_premium, vehicle_allowance, overtime_pay,
-                    ind_spe_1973, ind_cher_vie_1974,
-                    gross_salary,
-                    inps_employee, amo_employee, income_tax_net,
-                    advances_loans_deduction,
-                    net_salary, net_to_pay,
-                    inps_employer, amo_employer,
-                    tl_tax, tfp_tax, atej_tax, cfe_tax,
-                    total_payroll_cost
-                ) VALUES (
-                    ?, ?,
-                    ?, ?, ?,
-                    ?, ?, ?,
-                    ?, ?, ?,
-                    ?, ?,
-                    ?,
-                    ?, ?, ?,
-                    ?,
-                    ?, ?,
-                    ?, ?,
-                    ?, ?, ?, ?,
-                    ?
-                )
-            """, (
-                period_id, employee_id,
-                payroll_data.get('base_salary', 0),
-                payroll_data.get('days_worked', 26),
-                payroll_data.get('days_absent', 0),
-                payroll_data.get('transport_allowance', 0),
-                payroll_data.get('family_allowance', 0),
-                payroll_data.get('responsibility_allowance', 0),
-                payroll_data.get('risk_allowance', 0),
-                payroll_data.get('housing_allowance', 0),
-                payroll_data.get('overtime_amount', 0),
-                payroll_data.get('ind_spec_1973', 0),
-                payroll_data.get('cher_vie_1974', 0),
-                payroll_data.get('gross_salary', 0),
-                payroll_data.get('inps_employee', 0),
-                payroll_data.get('amo_employee', 0),
-                payroll_data.get('income_tax_net', 0),
-                advances_total,
-                payroll_data.get('net_salary', 0),
-                payroll_data.get('net_to_pay', 0),
-                payroll_data.get('inps_employer', 0),
-                payroll_data.get('amo_employer', 0),
-                payroll_data.get('taxe_logement', 0),
-                payroll_data.get('taxe_formation', 0),
-                payroll_data.get('taxe_emploi', 0),
-                payroll_data.get('contribution_cfe', 0),
-                payroll_data.get('total_cost', 0)
-            ))
             conn.commit()
             return cursor.lastrowid
 
@@ -254,76 +321,47 @@ class PayrollRepository:
             True if successful
         """
         try:
-            # Calculate total advances/loans deduction
-            advances_total = (
-                payroll_data.get('loan_deduction', 0) +
-                payroll_data.get('advance_deduction', 0) +
-                payroll_data.get('other_deductions', 0)
-            )
-
             conn = DatabaseConnection.get_connection()
-            conn.execute("""
-                UPDATE payroll_records SET
-                    base_salary = ?,
-                    days_worked = ?,
-                    days_absent = ?,
-                    ind_transport = ?,
-                    family_allowance = ?,
-                    responsibility_allowance = ?,
-                    risk_premium = ?,
-                    vehicle_allowance = ?,
-                    overtime_pay = ?,
-                    ind_spe_1973 = ?,
-                    ind_cher_vie_1974 = ?,
-                    gross_salary = ?,
-                    inps_employee = ?,
-                    amo_employee = ?,
-                    income_tax_net = ?,
-                    advances_loans_deduction = ?,
-                    net_salary = ?,
-                    net_to_pay = ?,
-                    inps_employer = ?,
-                    amo_employer = ?,
-                    tl_tax = ?,
-                    tfp_tax = ?,
-                    atej_tax = ?,
-                    cfe_tax = ?,
-                    total_payroll_cost = ?
-                WHERE record_id = ?
-            """, (
-                payroll_data.get('base_salary', 0),
-                payroll_data.get('days_worked', 26),
-                payroll_data.get('days_absent', 0),
-                payroll_data.get('transport_allowance', 0),
-                payroll_data.get('family_allowance', 0),
-                payroll_data.get('responsibility_allowance', 0),
-                payroll_data.get('risk_allowance', 0),
-                payroll_data.get('housing_allowance', 0),
-                payroll_data.get('overtime_amount', 0),
-                payroll_data.get('ind_spec_1973', 0),
-                payroll_data.get('cher_vie_1974', 0),
-                payroll_data.get('gross_salary', 0),
-                payroll_data.get('inps_employee', 0),
-                payroll_data.get('amo_employee', 0),
-                payroll_data.get('income_tax_net', 0),
-                advances_total,
-                payroll_data.get('net_salary', 0),
-                payroll_data.get('net_to_pay', 0),
-                payroll_data.get('inps_employer', 0),
-                payroll_data.get('amo_employer', 0),
-                payroll_data.get('taxe_logement', 0),
-                payroll_data.get('taxe_formation', 0),
-                payroll_data.get('taxe_emploi', 0),
-                payroll_data.get('contribution_cfe', 0),
-                payroll_data.get('total_cost', 0),
-                record_id
-            ))
+            conn.execute(
+                UPDATE_PAYROLL_RECORD_SQL,
+                _payroll_record_values(payroll_data) + (record_id,)
+            )
             conn.commit()
             return True
         except Exception:
             conn.rollback()
             return False
 
+    @staticmethod
+    def bulk_upsert_payroll_records(period_id: int,
+                                    records: List[Tuple[str, Dict[str, Any]]],
+                                    conn: Optional[sqlite3.Connection] = None) -> int:
+        """
+        Create or update many payroll records of a period in one transaction
+
+        Args:
+            period_id: Payroll period ID
+            records: List of (employee_id, payroll_data) tuples
+            conn: Connection to write with (defaults to the application connection)
+
+        Returns:
+            Number of records written
+        """
+        rows = [
+            (period_id, employee_id) + _payroll_record_values(payroll_data)
+            for employee_id, payroll_data in records
+        ]
+
+        if conn is None:
+            conn = DatabaseConnection.get_connection()
+        try:
+            conn.executemany(UPSERT_PAYROLL_RECORD_SQL, rows)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return len(rows)
+
     @staticmethod
     def get_records_by_period(period_id: int) -> List[Dict[str, Any]]:
         """
@@ -333,12 +371,17 @@ class PayrollRepository:
             period_id: Period ID
 
         Returns:
-            List of payroll record dictionaries with employee info
+            List of payroll record dictionaries with employee info and
+            total_allowances (sum of the displayed allowance columns)
         """
         conn = DatabaseConnection.get_connection()
         cursor = conn.execute("""
             SELECT
                 pr.*,
+                (COALESCE(pr.ind_transport, 0) + COALESCE(pr.family_allowance, 0) +
+                 COALESCE(pr.responsibility_allowance, 0) + COALESCE(pr.risk_premium, 0) +
+                 COALESCE(pr.vehicle_allowance, 0) + COALESCE(pr.overtime_pay, 0)
+                ) AS total_allowances,
                 e.full_name,
                 e.position,
                 e.status_code,
@@ -52,6 +52,7 @@ CREATE TABLE IF NOT EXISTS payroll_periods (
 
 CREATE INDEX idx_periods_dates ON payroll_periods(period_start_date, period_end_date);
 CREATE INDEX idx_periods_finalized ON payroll_periods(is_finalized);
+CREATE INDEX IF NOT EXISTS idx_pp_start ON payroll_periods(period_start_date DESC);
 
 -- ============================================================================
 -- TABLE: payroll_records
@@ -119,6 +120,7 @@ CREATE TABLE IF NOT EXISTS payroll_records (
 
 CREATE INDEX idx_payroll_period ON payroll_records(period_id);
 CREATE INDEX idx_payroll_employee ON payroll_records(employee_id);
+CREATE INDEX IF NOT EXISTS idx_pr_period_net ON payroll_records(period_id, net_to_pay);  -- Covering for SUM(net_to_pay)
 
 -- ============================================================================
 -- TABLE: loans_advances
@@ -320,6 +322,17 @@ CREATE TABLE IF NOT EXISTS audit_log (
 CREATE INDEX idx_audit_table ON audit_log(table_name);
 CREATE INDEX idx_audit_timestamp ON audit_log(timestamp);
 
+-- ============================================================================
+-- TABLE: app_metadata
+-- Cached aggregate counters maintained by triggers
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS app_metadata (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO app_metadata (key, value) VALUES ('active_employee_count', 0);
+
 -- ============================================================================
 -- TRIGGERS for automatic timestamp updates
 -- ============================================================================
@@ -332,6 +345,30 @@ BEGIN
     UPDATE employees SET updated_at = CURRENT_TIMESTAMP WHERE employee_id = NEW.employee_id;
 END;
 
+-- Active employee counter triggers
+CREATE TRIGGER IF NOT EXISTS employees_active_count_insert
+AFTER INSERT ON employees
+FOR EACH ROW WHEN NEW.is_active = 1
+BEGIN
+    UPDATE app_metadata SET value = value + 1 WHERE key = 'active_employee_count';
+END;
+
+CREATE TRIGGER IF NOT EXISTS employees_active_count_delete
+AFTER DELETE ON employees
+FOR EACH ROW WHEN OLD.is_active = 1
+BEGIN
+    UPDATE app_metadata SET value = value - 1 WHERE key = 'active_employee_count';
+END;
+
+CREATE TRIGGER IF NOT EXISTS employees_active_count_update
+AFTER UPDATE OF is_active ON employees
+FOR EACH ROW WHEN (OLD.is_active = 1) <> (NEW.is_active = 1)
+BEGIN
+    UPDATE app_metadata
+    SET value = value + (CASE WHEN NEW.is_active = 1 THEN 1 ELSE -1 END)
+    WHERE key = 'active_employee_count';
+END;
+
 -- Payroll periods update trigger
 CREATE TRIGGER IF NOT EXISTS update_periods_timestamp
 AFTER UPDATE ON payroll_periods
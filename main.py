@@ -14,6 +14,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from config import APP_TITLE, APP_VERSION, APP_SUBTITLE, initialize_directories
 from database.connection import DatabaseConnection
 from ui.main_window import MainWindow
+from ui.screens.dashboard_screen import DashboardLoader
 from ui.dialogs.login_dialog import LoginDialog
 from PyQt6.QtWidgets import QDialog
 
@@ -90,6 +91,7 @@ def main():
 
     # Cleanup
     print("\nShutting down...")
+    DashboardLoader.close_connection()
     DatabaseConnection.close()
     print("Application closed")
 
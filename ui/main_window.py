@@ -11,7 +11,9 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QSize, QDate
 from PyQt6.QtGui import QAction, QFont
 import os
+import time
 from datetime import datetime, date
+from functools import lru_cache
 
 from config import APP_TITLE, APP_VERSION, WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT, \
     WINDOW_DEFAULT_WIDTH, WINDOW_DEFAULT_HEIGHT, BACKUP_DIR, REPORTS_DIR
@@ -25,6 +27,20 @@ from ui.screens.user_management_screen import UserManagementScreen
 from ui.dialogs.about_dialog import AboutDialog
 from database.auth import AuthManager
 
+# Minimum delay (seconds) before navigating back to a screen reloads its data
+SCREEN_REFRESH_INTERVAL = 10.0
+
+# Sidebar / status bar label texts
+VERSION_TEXT = f"v{APP_VERSION}"
+EMPLOYEE_COUNT_FORMAT = "Employés: {}"
+PERIOD_FORMAT = "Période: {}"
+
+
+@lru_cache(maxsize=None)
+def _tr(text):
+    """Return a shared instance of a UI label so rebuilt menus reuse the same string"""
+    return text
+
 
 class MainWindow(QMainWindow):
     """Main application window with navigation sidebar"""
@@ -33,6 +49,10 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.current_screen = None
         self.user_management_screen = None  # Initialize to None for non-admin users
+        # Last refresh time of data-heavy screens (0 forces a reload on next show)
+        self._last_dash_refresh = 0.0
+        self._last_reports_refresh = 0.0
+        self._confirm_box = None  # Reusable Yes/No confirmation dialog
         try:
             self.init_ui()
         except Exception as e:
@@ -87,109 +107,88 @@ class MainWindow(QMainWindow):
         menubar = self.menuBar()
 
         # File menu
-        file_menu = menubar.addMenu("Fichier")
-
-        new_period_action = QAction("Nouvelle Période", self)
-        new_period_action.triggered.connect(self.new_period)
-        file_menu.addAction(new_period_action)
-
-        import_action = QAction("Importer CSV...", self)
-        import_action.triggered.connect(self.import_csv)
-        file_menu.addAction(import_action)
-
-        export_action = QAction("Exporter...", self)
-        export_action.triggered.connect(self.export_data)
-        file_menu.addAction(export_action)
-
+        file_menu = menubar.addMenu(_tr("Fichier"))
+        self._add_menu_action(file_menu, "Nouvelle Période", self.new_period)
+        self._add_menu_action(file_menu, "Importer CSV...", self.import_csv)
+        self._add_menu_action(file_menu, "Exporter...", self.export_data)
         file_menu.addSeparator()
-
-        backup_action = QAction("Sauvegarder", self)
-        backup_action.triggered.connect(self.backup_database)
-        file_menu.addAction(backup_action)
-
+        self._add_menu_action(file_menu, "Sauvegarder", self.backup_database)
         file_menu.addSeparator()
-
-        logout_action = QAction("Déconnexion", self)
-        logout_action.setShortcut("Ctrl+L")
-        logout_action.triggered.connect(self.logout)
-        file_menu.addAction(logout_action)
-
-        exit_action = QAction("Quitter", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
+        self._add_menu_action(file_menu, "Déconnexion", self.logout, "Ctrl+L")
+        self._add_menu_action(file_menu, "Quitter", self.close, "Ctrl+Q")
 
         # Edit menu
-        edit_menu = menubar.addMenu("Édition")
-
-        edit_employee_action = QAction("Employés...", self)
-        edit_employee_action.setShortcut("Ctrl+E")
-        edit_employee_action.triggered.connect(self.show_employees)
-        edit_menu.addAction(edit_employee_action)
-
-        edit_payroll_action = QAction("Paie...", self)
-        edit_payroll_action.setShortcut("Ctrl+P")
-        edit_payroll_action.triggered.connect(self.show_payroll)
-        edit_menu.addAction(edit_payroll_action)
-
-        edit_loans_action = QAction("Prêts/Avances...", self)
-        edit_loans_action.setShortcut("Ctrl+A")
-        edit_loans_action.triggered.connect(self.show_loans)
-        edit_menu.addAction(edit_loans_action)
-
+        edit_menu = menubar.addMenu(_tr("Édition"))
+        self._add_menu_action(edit_menu, "Employés...", self.show_employees, "Ctrl+E")
+        self._add_menu_action(edit_menu, "Paie...", self.show_payroll, "Ctrl+P")
+        self._add_menu_action(edit_menu, "Prêts/Avances...", self.show_loans, "Ctrl+A")
         edit_menu.addSeparator()
-
-        edit_parameters_action = QAction("Paramètres...", self)
-        edit_parameters_action.triggered.connect(self.show_parameters)
-        edit_menu.addAction(edit_parameters_action)
+        self._add_menu_action(edit_menu, "Paramètres...", self.show_parameters)
 
         # Reports menu
-        reports_menu = menubar.addMenu("Rapports")
-
-        salary_slip_action = QAction("Bulletin de Salaire...", self)
-        salary_slip_action.triggered.connect(self.generate_salary_slip)
-        reports_menu.addAction(salary_slip_action)
-
-        payroll_summary_action = QAction("Résumé de Paie...", self)
-        payroll_summary_action.triggered.connect(self.generate_payroll_summary)
-        reports_menu.addAction(payroll_summary_action)
-
+        reports_menu = menubar.addMenu(_tr("Rapports"))
+        self._add_menu_action(reports_menu, "Bulletin de Salaire...", self.generate_salary_slip)
+        self._add_menu_action(reports_menu, "Résumé de Paie...", self.generate_payroll_summary)
         reports_menu.addSeparator()
-
-        all_reports_action = QAction("Tous les Rapports...", self)
-        all_reports_action.triggered.connect(self.show_reports)
-        reports_menu.addAction(all_reports_action)
+        self._add_menu_action(reports_menu, "Tous les Rapports...", self.show_reports)
 
         # Tools menu
-        tools_menu = menubar.addMenu("Outils")
-
-        settings_action = QAction("Paramètres", self)
-        settings_action.triggered.connect(self.show_parameters)
-        tools_menu.addAction(settings_action)
+        tools_menu = menubar.addMenu(_tr("Outils"))
+        self._add_menu_action(tools_menu, "Paramètres", self.show_parameters)
 
         # User management (admin only)
         if AuthManager.is_admin():
             tools_menu.addSeparator()
-            user_mgmt_action = QAction("Gestion des Utilisateurs", self)
-            user_mgmt_action.triggered.connect(self.show_user_management)
-            tools_menu.addAction(user_mgmt_action)
+            self._add_menu_action(tools_menu, "Gestion des Utilisateurs", self.show_user_management)
 
         # Help menu
-        help_menu = menubar.addMenu("Aide")
-
-        about_action = QAction("À propos", self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        help_menu = menubar.addMenu(_tr("Aide"))
+        self._add_menu_action(help_menu, "À propos", self.show_about)
+
+    def _add_menu_action(self, menu, text, callback, shortcut=None):
+        """Create a menu action with a cached label and add it to the menu"""
+        action = QAction(_tr(text), self)
+        if shortcut:
+            action.setShortcut(shortcut)
+        action.triggered.connect(callback)
+        menu.addAction(action)
+        return action
 
     def create_navigation(self):
         """Create navigation sidebar"""
         nav_frame = QFrame()
+        self._nav_frame = nav_frame
         nav_frame.setFixedWidth(240)
         nav_frame.setStyleSheet("""
             QFrame {
                 background-color: #2c3e50;
                 border-right: 1px solid #1a252f;
             }
+            QLabel#navTitle {
+                color: #3498db;
+                font-size: 26px;
+                font-weight: bold;
+                letter-spacing: 2px;
+            }
+            QLabel#navSubtitle {
+                color: #ecf0f1;
+                font-size: 13px;
+                font-weight: normal;
+            }
+            QLabel#navUserName {
+                color: #ecf0f1;
+                font-size: 13px;
+                font-weight: bold;
+            }
+            QLabel#navUserRole {
+                color: #3498db;
+                font-size: 11px;
+            }
+            QLabel#navVersion {
+                color: #7f8c8d;
+                font-size: 10px;
+                padding: 10px;
+            }
         """)
 
         nav_layout = QVBoxLayout(nav_frame)
@@ -205,26 +204,13 @@ class MainWindow(QMainWindow):
 
         # Main title
         main_title = QLabel("PAIERO")
-        main_title.setStyleSheet("""
-            QLabel {
-                color: #3498db;
-                font-size: 26px;
-                font-weight: bold;
-                letter-spacing: 2px;
-            }
-        """)
+        main_title.setObjectName("navTitle")
         main_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         title_layout.addWidget(main_title)
 
         # Subtitle
         subtitle = QLabel("Gestion de Paie")
-        subtitle.setStyleSheet("""
-            QLabel {
-                color: #ecf0f1;
-                font-size: 13px;
-                font-weight: normal;
-            }
-        """)
+        subtitle.setObjectName("navSubtitle")
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
         title_layout.addWidget(subtitle)
 
@@ -271,25 +257,14 @@ class MainWindow(QMainWindow):
             user_layout.addWidget(user_icon)
 
             user_name = QLabel(current_user['full_name'])
-            user_name.setStyleSheet("""
-                QLabel {
-                    color: #ecf0f1;
-                    font-size: 13px;
-                    font-weight: bold;
-                }
-            """)
+            user_name.setObjectName("navUserName")
             user_name.setAlignment(Qt.AlignmentFlag.AlignCenter)
             user_name.setWordWrap(True)
             user_layout.addWidget(user_name)
 
             role_text = "Administrateur" if current_user['role'] == 'admin' else "Utilisateur"
             user_role = QLabel(role_text)
-            user_role.setStyleSheet("""
-                QLabel {
-                    color: #3498db;
-                    font-size: 11px;
-                }
-            """)
+            user_role.setObjectName("navUserRole")
             user_role.setAlignment(Qt.AlignmentFlag.AlignCenter)
             user_layout.addWidget(user_role)
 
@@ -318,14 +293,8 @@ class MainWindow(QMainWindow):
         nav_layout.addWidget(user_frame)
 
         # Version label at bottom
-        version_label = QLabel(f"v{APP_VERSION}")
-        version_label.setStyleSheet("""
-            QLabel {
-                color: #7f8c8d;
-                font-size: 10px;
-                padding: 10px;
-            }
-        """)
+        version_label = QLabel(VERSION_TEXT)
+        version_label.setObjectName("navVersion")
         version_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         nav_layout.addWidget(version_label)
 
@@ -363,13 +332,19 @@ class MainWindow(QMainWindow):
 
     def set_active_nav_button(self, button_id):
         """Set the active navigation button"""
-        for btn_id, btn in self.nav_buttons.items():
-            if btn_id == button_id:
-                btn.setProperty("active", "true")
-            else:
-                btn.setProperty("active", "false")
-            btn.style().unpolish(btn)
-            btn.style().polish(btn)
+        # Repaint the sidebar once, and only repolish buttons whose state changed
+        self._nav_frame.setUpdatesEnabled(False)
+        try:
+            for btn_id, btn in self.nav_buttons.items():
+                state = "true" if btn_id == button_id else "false"
+                if btn.property("active") == state:
+                    continue
+                btn.setProperty("active", state)
+                btn.style().unpolish(btn)
+                btn.style().polish(btn)
+        finally:
+            self._nav_frame.setUpdatesEnabled(True)
+        self._nav_frame.update()
 
     def create_status_bar(self):
         """Create status bar"""
@@ -381,13 +356,20 @@ class MainWindow(QMainWindow):
         self.status_bar.addWidget(self.status_label)
 
         # Add employee count
-        self.employee_count_label = QLabel("Employés: 0")
+        self.employee_count_label = QLabel(EMPLOYEE_COUNT_FORMAT.format(0))
         self.status_bar.addPermanentWidget(self.employee_count_label)
 
         # Add period info
-        self.period_label = QLabel("Période: --")
+        self.period_label = QLabel(PERIOD_FORMAT.format("--"))
         self.status_bar.addPermanentWidget(self.period_label)
 
+    def update_status_info(self, employee_count=None, period=None):
+        """Update the employee count and/or period shown in the status bar"""
+        if employee_count is not None:
+            self.employee_count_label.setText(EMPLOYEE_COUNT_FORMAT.format(employee_count))
+        if period is not None:
+            self.period_label.setText(PERIOD_FORMAT.format(period))
+
     def init_screens(self):
         """Initialize all application screens"""
         # Dashboard
@@ -399,6 +381,9 @@ class MainWindow(QMainWindow):
         self.dashboard_screen.navigate_to_loans.connect(self.show_loans)
         self.dashboard_screen.navigate_to_reports.connect(self.show_reports)
 
+        # The status bar shows the counts of the latest dashboard load
+        self.dashboard_screen.stats_loaded.connect(self.update_status_info)
+
         self.content_stack.addWidget(self.dashboard_screen)
 
         # Employee Management Screen
@@ -408,6 +393,11 @@ class MainWindow(QMainWindow):
         # Payroll Processing Screen
         self.payroll_screen = PayrollScreen()
         self.content_stack.addWidget(self.payroll_screen)
+        self.employees_screen.employees_changed.connect(self.payroll_screen.invalidate_employee_cache)
+
+        # Dashboard and reports reload after any employee or payroll change
+        self.employees_screen.employees_changed.connect(self.invalidate_screen_data)
+        self.payroll_screen.payroll_changed.connect(self.invalidate_screen_data)
 
         # Loans & Advances Screen
         self.loans_screen = LoanScreen()
@@ -450,8 +440,11 @@ class MainWindow(QMainWindow):
         self.content_stack.setCurrentWidget(self.dashboard_screen)
         self.set_active_nav_button("dashboard")
         self.status_label.setText("Tableau de Bord")
-        # Refresh dashboard data when shown
-        self.dashboard_screen.refresh_data()
+        # Refresh dashboard data when shown, unless it was refreshed just now
+        now = time.monotonic()
+        if now - self._last_dash_refresh > SCREEN_REFRESH_INTERVAL:
+            self.dashboard_screen.refresh_data()
+            self._last_dash_refresh = now
 
     def show_employees(self):
         """Show employees screen"""
@@ -476,8 +469,16 @@ class MainWindow(QMainWindow):
         self.content_stack.setCurrentWidget(self.reports_screen)
         self.set_active_nav_button("reports")
         self.status_label.setText("Rapports")
-        # Refresh report screen data when shown
-        self.reports_screen.refresh_data()
+        # Refresh report screen data when shown, unless it was refreshed just now
+        now = time.monotonic()
+        if now - self._last_reports_refresh > SCREEN_REFRESH_INTERVAL:
+            self.reports_screen.refresh_data()
+            self._last_reports_refresh = now
+
+    def invalidate_screen_data(self):
+        """Force dashboard and reports to reload on their next display"""
+        self._last_dash_refresh = 0.0
+        self._last_reports_refresh = 0.0
 
     def show_parameters(self):
         """Show parameters screen"""
@@ -499,16 +500,23 @@ class MainWindow(QMainWindow):
         self.set_active_nav_button(None)  # No nav button for this screen
         self.status_label.setText("Gestion des Utilisateurs")
 
+    def _confirm(self, title, text):
+        """Ask a Yes/No question using a single reusable message box"""
+        if self._confirm_box is None:
+            self._confirm_box = QMessageBox(self)
+            self._confirm_box.setIcon(QMessageBox.Icon.Question)
+            self._confirm_box.setStandardButtons(
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+        self._confirm_box.setWindowTitle(title)
+        self._confirm_box.setText(text)
+        self._confirm_box.exec()
+        clicked = self._confirm_box.clickedButton()
+        return self._confirm_box.standardButton(clicked) == QMessageBox.StandardButton.Yes
+
     def logout(self):
         """Logout current user"""
-        reply = QMessageBox.question(
-            self,
-            "Déconnexion",
-            "Voulez-vous vraiment vous déconnecter?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
-
-        if reply == QMessageBox.StandardButton.Yes:
+        if self._confirm("Déconnexion", "Voulez-vous vraiment vous déconnecter?"):
             AuthManager.logout()
             QMessageBox.information(
                 self,
@@ -585,6 +593,7 @@ class MainWindow(QMainWindow):
                     )
                     # Refresh payroll screen if visible
                     self.payroll_screen.load_periods()
+                    self.invalidate_screen_data()
                 else:
                     QMessageBox.warning(self, "Erreur", "Cette période existe déjà.")
             except Exception as e:
@@ -611,13 +620,10 @@ class MainWindow(QMainWindow):
                 preview += f"Lignes: {len(df)}\n"
                 preview += f"Colonnes: {', '.join(df.columns[:5])}..."
 
-                reply = QMessageBox.question(
-                    self, "Confirmer l'import",
-                    f"{preview}\n\nVoulez-vous importer ces données?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                )
-
-                if reply == QMessageBox.StandardButton.Yes:
+                if self._confirm(
+                    "Confirmer l'import",
+                    f"{preview}\n\nVoulez-vous importer ces données?"
+                ):
                     # Basic import logic - adjust based on CSV structure
                     imported = 0
                     for _, row in df.iterrows():
@@ -633,6 +639,8 @@ class MainWindow(QMainWindow):
                         f"{imported} enregistrements importés avec succès."
                     )
                     self.employees_screen.load_employees()
+                    self.payroll_screen.invalidate_employee_cache()
+                    self.invalidate_screen_data()
 
             except Exception as e:
                 QMessageBox.critical(self, "Erreur d'import", f"Erreur: {str(e)}")
@@ -7,12 +7,161 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QFrame, QGridLayout, QPushButton
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool, QTimer
 from PyQt6.QtGui import QFont
+import threading
 
 from database.connection import DatabaseConnection
 
 
+# All dashboard statistics in a single round-trip:
+# - active employee count (trigger-maintained counter)
+# - latest period with payroll data
+# - net to pay of the most recent FINALIZED period, falling back
+#   to the most recent period with calculated payroll
+DASHBOARD_STATS_QUERY = """
+    WITH latest_period AS (
+        SELECT pp.period_start_date
+        FROM payroll_periods pp
+        WHERE EXISTS (
+            SELECT 1 FROM payroll_records pr WHERE pr.period_id = pp.period_id
+        )
+        ORDER BY pp.period_start_date DESC
+        LIMIT 1
+    ),
+    finalized_net AS (
+        SELECT SUM(pr.net_to_pay) AS total_net, pp.period_start_date
+        FROM payroll_records pr
+        JOIN payroll_periods pp ON pr.period_id = pp.period_id
+        WHERE pp.is_finalized = 1
+        GROUP BY pr.period_id
+        ORDER BY pp.period_start_date DESC
+        LIMIT 1
+    ),
+    calculated_net AS (
+        SELECT SUM(pr.net_to_pay) AS total_net, pp.period_start_date
+        FROM payroll_records pr
+        JOIN payroll_periods pp ON pr.period_id = pp.period_id
+        WHERE pr.net_to_pay > 0
+        GROUP BY pr.period_id
+        ORDER BY pp.period_start_date DESC
+        LIMIT 1
+    )
+    SELECT
+        (SELECT value FROM app_metadata WHERE key = 'active_employee_count'),
+        (SELECT period_start_date FROM latest_period),
+        CASE WHEN COALESCE((SELECT total_net FROM finalized_net), 0) <> 0
+             THEN (SELECT total_net FROM finalized_net)
+             ELSE (SELECT total_net FROM calculated_net) END,
+        CASE WHEN COALESCE((SELECT total_net FROM finalized_net), 0) <> 0
+             THEN (SELECT period_start_date FROM finalized_net)
+             ELSE (SELECT period_start_date FROM calculated_net) END
+"""
+
+
+# Widget stylesheets (module constants, built once)
+ACTION_BUTTON_QSS_TEMPLATE = """
+    QPushButton {{
+        background-color: {color};
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 20px;
+        font-size: 16px;
+        font-weight: bold;
+        text-align: left;
+    }}
+    QPushButton:hover {{
+        background-color: {hover_color};
+        transform: translateY(-2px);
+    }}
+    QPushButton:pressed {{
+        background-color: {pressed_color};
+    }}
+"""
+
+REFRESH_BUTTON_QSS = """
+    QPushButton {
+        background-color: #3498db;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 15px;
+    }
+    QPushButton:hover {
+        background-color: #2980b9;
+    }
+"""
+
+STATS_FRAME_QSS = """
+    QFrame {
+        background-color: white;
+        border-radius: 8px;
+        padding: 15px;
+    }
+"""
+
+
+# Marker for dashboard values not displayed yet
+_NOT_DISPLAYED = object()
+
+
+class DashboardLoaderSignals(QObject):
+    """Signals emitted by DashboardLoader (delivered on the GUI thread)"""
+    finished = pyqtSignal(tuple)
+    failed = pyqtSignal(str)
+
+
+class DashboardLoader(QRunnable):
+    """Compute dashboard statistics off the UI thread"""
+
+    # Dedicated connection reused by every load, so the compiled statistics
+    # query stays in its statement cache. Never shared with the GUI connection;
+    # the lock serializes loads running on different pool threads.
+    _connection = None
+    _connection_path = None
+    _lock = threading.Lock()
+
+    def __init__(self, database_path):
+        super().__init__()
+        self.database_path = database_path
+        self.signals = DashboardLoaderSignals()
+
+    @classmethod
+    def _get_connection(cls, database_path):
+        """Return the loader connection, reopening it if the database changed"""
+        if cls._connection is None or cls._connection_path != database_path:
+            if cls._connection is not None:
+                cls._connection.close()
+            cls._connection = DatabaseConnection.create_connection(database_path)
+            cls._connection_path = database_path
+        return cls._connection
+
+    @classmethod
+    def close_connection(cls):
+        """Close the loader connection (waits for a load in progress)"""
+        with cls._lock:
+            if cls._connection is not None:
+                cls._connection.close()
+                cls._connection = None
+                cls._connection_path = None
+
+    def run(self):
+        """Run the statistics query on the loader's own connection"""
+        try:
+            with self._lock:
+                conn = self._get_connection(self.database_path)
+                # Drain the cursor so the statement is reset and no read lock lingers
+                row = conn.execute(DASHBOARD_STATS_QUERY).fetchall()[0]
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            self.signals.failed.emit(str(e))
+            return
+
+        self.signals.finished.emit(tuple(row))
+
+
 class DashboardScreen(QWidget):
     """Dashboard screen with summary cards and quick actions"""
 
@@ -22,10 +171,26 @@ class DashboardScreen(QWidget):
     navigate_to_loans = pyqtSignal()
     navigate_to_reports = pyqtSignal()
 
+    # Emitted after each load: active employee count, latest period ("2026-02")
+    stats_loaded = pyqtSignal(int, str)
+
+    # Darkened hover/pressed colors, shared by all instances: (color, factor) -> "#rrggbb"
+    _DARKEN_CACHE = {}
+    # Action button stylesheets, built once per color
+    _ACTION_BUTTON_QSS = {}
+
     def __init__(self):
         super().__init__()
+        self._loader = None  # Background statistics loader in flight
+        # Refresh requested while a load was in flight (its data may predate it)
+        self._reload_pending = False
+        # Last displayed values; labels are only updated when these change
+        self._last_employee_count = _NOT_DISPLAYED
+        self._last_period_start = _NOT_DISPLAYED
+        self._last_net_total = _NOT_DISPLAYED
         self.init_ui()
-        self.load_data()
+        # Let the widget paint first; values show "…" until the load completes
+        QTimer.singleShot(0, self.load_data)
 
     def init_ui(self):
         """Initialize the user interface"""
@@ -34,37 +199,42 @@ class DashboardScreen(QWidget):
         layout.setSpacing(30)
 
         # Dashboard header
+        header_layout = QHBoxLayout()
         header_label = QLabel("Tableau de Bord")
         header_font = QFont()
         header_font.setPointSize(28)
         header_font.setBold(True)
         header_label.setFont(header_font)
         header_label.setStyleSheet("color: #2c3e50;")
-        layout.addWidget(header_label)
+        header_layout.addWidget(header_label)
+        header_layout.addStretch()
+
+        # Refresh button (navigation only reloads data periodically)
+        refresh_btn = QPushButton("🔄 Actualiser")
+        refresh_btn.clicked.connect(self.refresh_data)
+        refresh_btn.setStyleSheet(REFRESH_BUTTON_QSS)
+        refresh_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        header_layout.addWidget(refresh_btn)
+
+        layout.addLayout(header_layout)
 
         # Summary statistics - compact horizontal layout
         stats_frame = QFrame()
-        stats_frame.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 8px;
-                padding: 15px;
-            }
-        """)
+        stats_frame.setStyleSheet(STATS_FRAME_QSS)
         stats_layout = QHBoxLayout(stats_frame)
         stats_layout.setSpacing(30)
 
-        self.employee_card = self.create_compact_stat("👥", "Employés", "0")
+        self.employee_card = self.create_compact_stat("👥", "Employés", "…")
         stats_layout.addWidget(self.employee_card)
 
         stats_layout.addWidget(self.create_separator())
 
-        self.period_card = self.create_compact_stat("📅", "Période", "---")
+        self.period_card = self.create_compact_stat("📅", "Période", "…")
         stats_layout.addWidget(self.period_card)
 
         stats_layout.addWidget(self.create_separator())
 
-        self.net_card = self.create_compact_stat("💰", "Net à Payer", "0 CFA")
+        self.net_card = self.create_compact_stat("💰", "Net à Payer", "…")
         stats_layout.addWidget(self.net_card)
 
         stats_layout.addStretch()
@@ -151,115 +321,108 @@ class DashboardScreen(QWidget):
     def create_action_button(self, text, color):
         """Create a simple action button"""
         btn = QPushButton(text)
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 20px;
-                font-size: 16px;
-                font-weight: bold;
-                text-align: left;
-            }}
-            QPushButton:hover {{
-                background-color: {self.darken_color(color, 0.15)};
-                transform: translateY(-2px);
-            }}
-            QPushButton:pressed {{
-                background-color: {self.darken_color(color, 0.3)};
-            }}
-        """)
+        qss = self._ACTION_BUTTON_QSS.get(color)
+        if qss is None:
+            qss = self._ACTION_BUTTON_QSS[color] = ACTION_BUTTON_QSS_TEMPLATE.format(
+                color=color,
+                hover_color=self.darken_color(color, 0.15),
+                pressed_color=self.darken_color(color, 0.3),
+            )
+        btn.setStyleSheet(qss)
         btn.setMinimumHeight(80)
         btn.setCursor(Qt.CursorShape.PointingHandCursor)
         return btn
 
     def darken_color(self, hex_color, factor=0.2):
         """Darken a hex color by a factor"""
-        hex_color = hex_color.lstrip('#')
-        r, g, b = int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
+        key = (hex_color, factor)
+        cached = self._DARKEN_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        rgb = hex_color.lstrip('#')
+        r, g, b = int(rgb[0:2], 16), int(rgb[2:4], 16), int(rgb[4:6], 16)
         r = int(r * (1 - factor))
         g = int(g * (1 - factor))
         b = int(b * (1 - factor))
-        return f'#{r:02x}{g:02x}{b:02x}'
+        result = f'#{r:02x}{g:02x}{b:02x}'
+        self._DARKEN_CACHE[key] = result
+        return result
 
     def load_data(self):
-        """Load dashboard data from database"""
-        try:
-            conn = DatabaseConnection.get_connection()
+        """Load dashboard data from database in a background thread"""
+        if self._loader is not None:
+            # A load is already running; load again once it completes
+            self._reload_pending = True
+            return
+
+        database_path = DatabaseConnection.get_database_path()
+        if database_path is None:
+            self._show_load_error("Database not initialized")
+            return
+
+        self._loader = DashboardLoader(database_path)
+        self._loader.signals.finished.connect(self._apply_stats)
+        self._loader.signals.failed.connect(self._on_load_failed)
+        QThreadPool.globalInstance().start(self._loader)
+
+    def _start_pending_reload(self):
+        """Start the load requested while the previous one ran, if any"""
+        if not self._reload_pending:
+            return False
+        self._reload_pending = False
+        self.load_data()
+        return True
 
-            # Get employee count
-            cursor = conn.execute("SELECT COUNT(*) FROM employees WHERE is_active = 1")
-            employee_count = cursor.fetchone()[0]
-            self.employee_card.value_label.setText(str(employee_count))
+    def _apply_stats(self, stats):
+        """Display statistics computed by the background loader"""
+        self._loader = None
+        self._start_pending_reload()
+        employee_count, period_start, total_net, net_period = stats
 
-            # Get latest period with payroll data
-            cursor = conn.execute("""
-                SELECT DISTINCT pp.period_start_date, pp.period_end_date
-                FROM payroll_periods pp
-                JOIN payroll_records pr ON pp.period_id = pr.period_id
-                ORDER BY pp.period_start_date DESC
-                LIMIT 1
-            """)
-            period = cursor.fetchone()
-            if period:
-                start = period['period_start_date']
-                end = period['period_end_date']
-                # Format as "2026-02"
-                self.period_card.value_label.setText(start[:7])
-            else:
-                self.period_card.value_label.setText("Aucune")
-
-            # Get payroll statistics - net to pay from most recent FINALIZED period
-            # First try finalized periods, then fall back to any period with data
-            cursor = conn.execute("""
-                SELECT SUM(pr.net_to_pay) as total_net, pp.period_start_date
-                FROM payroll_records pr
-                JOIN payroll_periods pp ON pr.period_id = pp.period_id
-                WHERE pp.is_finalized = 1
-                GROUP BY pr.period_id
-                ORDER BY pp.period_start_date DESC
-                LIMIT 1
-            """)
-            stats = cursor.fetchone()
-
-            # If no finalized periods, try any period with calculated payroll
-            if not stats or not stats['total_net']:
-                cursor = conn.execute("""
-                    SELECT SUM(pr.net_to_pay) as total_net, pp.period_start_date
-                    FROM payroll_records pr
-                    JOIN payroll_periods pp ON pr.period_id = pp.period_id
-                    WHERE pr.net_to_pay > 0
-                    GROUP BY pr.period_id
-                    ORDER BY pp.period_start_date DESC
-                    LIMIT 1
-                """)
-                stats = cursor.fetchone()
-
-            if stats and stats['total_net'] and stats['total_net'] > 0:
-                # Format with thousands separators and CFA
-                total = int(stats['total_net'])
-                self.net_card.value_label.setText(f"{total:,} CFA")
-                print(f"Dashboard: Net à payer = {total:,} CFA from period {stats['period_start_date']}")
-            else:
-                self.net_card.value_label.setText("0 CFA")
-                print("Dashboard: No payroll data found with net_to_pay > 0")
-
-            # Success - data loaded
-            print(f"Dashboard data loaded successfully: {employee_count} employees")
+        if employee_count != self._last_employee_count:
+            self._last_employee_count = employee_count
+            self.employee_card.value_label.setText(str(employee_count))
 
-        except Exception as e:
-            print(f"Error loading dashboard data: {e}")
-            import traceback
-            traceback.print_exc()
-            # Show error to user
-            from PyQt6.QtWidgets import QMessageBox
-            QMessageBox.warning(
-                self,
-                "Erreur de Chargement",
-                f"Impossible de charger les données du tableau de bord:\n{str(e)}\n\n"
-                "Vérifiez que la base de données est correctement initialisée."
-            )
+        # Format as "2026-02"
+        period_text = period_start[:7] if period_start else "Aucune"
+        if period_start != self._last_period_start:
+            self._last_period_start = period_start
+            self.period_card.value_label.setText(period_text)
+
+        total = int(total_net) if total_net and total_net > 0 else 0
+        if total != self._last_net_total:
+            self._last_net_total = total
+            # Format with thousands separators and CFA
+            self.net_card.value_label.setText(f"{total:,} CFA")
+
+        if total:
+            print(f"Dashboard: Net à payer = {total:,} CFA from period {net_period}")
+        else:
+            print("Dashboard: No payroll data found with net_to_pay > 0")
+
+        # Success - data loaded
+        print(f"Dashboard data loaded successfully: {employee_count} employees")
+        self.stats_loaded.emit(employee_count or 0, period_text)
+
+    def _on_load_failed(self, message):
+        """Handle a failure reported by the background loader"""
+        self._loader = None
+        # The pending load reports its own failure, if it fails too
+        if self._start_pending_reload():
+            return
+        self._show_load_error(message)
+
+    def _show_load_error(self, message):
+        """Show a dashboard loading error to the user"""
+        print(f"Error loading dashboard data: {message}")
+        from PyQt6.QtWidgets import QMessageBox
+        QMessageBox.warning(
+            self,
+            "Erreur de Chargement",
+            f"Impossible de charger les données du tableau de bord:\n{message}\n\n"
+            "Vérifiez que la base de données est correctement initialisée."
+        )
 
     def refresh_data(self):
         """Refresh dashboard data"""
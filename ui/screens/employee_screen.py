@@ -7,10 +7,10 @@ import sys
 import os
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTableWidget, QTableWidgetItem, QLineEdit, QMessageBox,
+    QTableView, QLineEdit, QMessageBox,
     QHeaderView, QAbstractItemView, QComboBox, QDialog
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex, pyqtSignal
 from PyQt6.QtGui import QFont, QColor
 
 # Add parent directories to path
@@ -19,16 +19,189 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 from database.repositories.employee_repository import EmployeeRepository
 from models.employee import Employee
 from ui.dialogs.employee_dialog import EmployeeDialog
+from ui.widgets.action_delegate import ActionButtonDelegate
 from database.auth import AuthManager
 
 
+# Delay (ms) after the last keystroke before the search is applied
+SEARCH_DEBOUNCE_MS = 150
+
+# Table columns whose text is centered
+CENTERED_COLUMNS = (0, 3, 4, 5, 6)
+ACTIONS_COLUMN = 7
+
+# Row action buttons: (action, text, color)
+EDIT_BUTTON = ("edit", "Modifier", "#3498db")
+DELETE_BUTTON = ("delete", "Supprimer", "#e74c3c")
+RESTORE_BUTTON = ("restore", "Restaurer", "#2ecc71")
+
+# Widget stylesheets (module constants, built once)
+ADD_BUTTON_QSS = """
+    QPushButton {
+        background-color: #2ecc71;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 10px 20px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #27ae60;
+    }
+    QPushButton:pressed {
+        background-color: #229954;
+    }
+"""
+
+SEARCH_INPUT_QSS = """
+    QLineEdit {
+        padding: 8px;
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        font-size: 13px;
+    }
+"""
+
+FILTER_COMBO_QSS = """
+    QComboBox {
+        padding: 8px;
+        border: 1px solid #ddd;
+        border-radius: 4px;
+    }
+"""
+
+REFRESH_BUTTON_QSS = """
+    QPushButton {
+        background-color: #3498db;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 15px;
+    }
+    QPushButton:hover {
+        background-color: #2980b9;
+    }
+"""
+
+TABLE_QSS = """
+    QTableView {
+        background-color: white;
+        border: 1px solid #ddd;
+        border-radius: 5px;
+        gridline-color: #e0e0e0;
+    }
+    QTableView::item {
+        padding: 5px;
+    }
+    QTableView::item:selected {
+        background-color: #3498db;
+        color: white;
+    }
+    QHeaderView::section {
+        background-color: #34495e;
+        color: white;
+        padding: 8px;
+        border: none;
+        font-weight: bold;
+    }
+"""
+
+ACTIVE_COLOR = QColor("#2ecc71")
+INACTIVE_COLOR = QColor("#e74c3c")
+
+
+class EmployeeTableModel(QAbstractTableModel):
+    """Table model exposing a list of employees to a QTableView"""
+
+    HEADERS = [
+        "ID", "Nom Complet", "Poste", "Catégorie",
+        "Statut", "Date d'Embauche", "Ancienneté", "Actions"
+    ]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._display_rows = []  # Preformatted texts, parallel to _rows
+        self._display_cache = {}  # employee_id -> preformatted texts
+
+    def preformat(self, employees):
+        """Format the display texts of freshly loaded employees once"""
+        self._display_cache = {emp.employee_id: self.format_row(emp) for emp in employees}
+
+    def set_rows(self, employees):
+        """Replace the displayed employees"""
+        cache = self._display_cache
+        self.beginResetModel()
+        self._rows = employees
+        self._display_rows = [
+            cache.get(emp.employee_id) or self.format_row(emp) for emp in employees
+        ]
+        self.endResetModel()
+
+    def employee_at(self, row):
+        """Return the employee displayed at a row"""
+        return self._rows[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        column = index.column()
+        if column == ACTIONS_COLUMN:
+            return None  # Painted by ActionButtonDelegate
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display_rows[index.row()][column]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if column in CENTERED_COLUMNS:
+                return Qt.AlignmentFlag.AlignCenter
+            return None
+        if role == Qt.ItemDataRole.ForegroundRole and column == 4:
+            return ACTIVE_COLOR if self._rows[index.row()].is_active else INACTIVE_COLOR
+        return None
+
+    @staticmethod
+    def format_row(employee: Employee):
+        """Return the display text of each data column for an employee"""
+        return (
+            employee.employee_id,
+            employee.full_name,
+            employee.position or "-",
+            employee.category or "-",
+            "Actif" if employee.is_active else "Inactif",
+            employee.hire_date.strftime("%d/%m/%Y") if employee.hire_date else "-",
+            f"{employee.seniority:.1f} ans" if employee.seniority else "-",
+        )
+
+
 class EmployeeScreen(QWidget):
     """Employee management screen"""
 
+    # Emitted after employees are added, edited, deleted or restored
+    employees_changed = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.employees = []
         self.filtered_employees = []
+        # Lowercased search fields per employee: (id, name, position, employee)
+        self._search_index = []
+        # Row buttons for (active, inactive) employees, set from the user's permissions
+        self._row_buttons = ((), ())
+        # Department codes shown in the filter (None = reload on next load)
+        self._departments_cached = None
         self.init_ui()
         self.load_employees()
 
@@ -53,23 +226,7 @@ class EmployeeScreen(QWidget):
         # Add employee button (only if user has permission)
         if AuthManager.has_permission('can_edit_employees'):
             add_btn = QPushButton("+ Ajouter Employé")
-            add_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #2ecc71;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 10px 20px;
-                    font-size: 14px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #27ae60;
-                }
-                QPushButton:pressed {
-                    background-color: #229954;
-                }
-            """)
+            add_btn.setStyleSheet(ADD_BUTTON_QSS)
             add_btn.clicked.connect(self.add_employee)
             header_layout.addWidget(add_btn)
 
@@ -84,14 +241,13 @@ class EmployeeScreen(QWidget):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Rechercher par ID, nom ou poste...")
         self.search_input.textChanged.connect(self.on_search)
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                padding: 8px;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                font-size: 13px;
-            }
-        """)
+
+        # Coalesce rapid keystrokes into a single filter pass
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self.apply_filters)
+        self.search_input.setStyleSheet(SEARCH_INPUT_QSS)
         search_layout.addWidget(self.search_input, 1)
 
         # Department filter
@@ -100,14 +256,8 @@ class EmployeeScreen(QWidget):
 
         self.dept_filter = QComboBox()
         self.dept_filter.addItem("Tous", None)
-        self.dept_filter.currentIndexChanged.connect(self.on_filter_change)
-        self.dept_filter.setStyleSheet("""
-            QComboBox {
-                padding: 8px;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-            }
-        """)
+        self.dept_filter.currentIndexChanged.connect(self.on_department_change)
+        self.dept_filter.setStyleSheet(FILTER_COMBO_QSS)
         search_layout.addWidget(self.dept_filter)
 
         # Status filter
@@ -117,42 +267,22 @@ class EmployeeScreen(QWidget):
         self.status_filter = QComboBox()
         self.status_filter.addItem("Actifs", False)
         self.status_filter.addItem("Tous", True)
-        self.status_filter.currentIndexChanged.connect(self.on_filter_change)
-        self.status_filter.setStyleSheet("""
-            QComboBox {
-                padding: 8px;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-            }
-        """)
+        self.status_filter.currentIndexChanged.connect(self.on_status_change)
+        self.status_filter.setStyleSheet(FILTER_COMBO_QSS)
         search_layout.addWidget(self.status_filter)
 
         # Refresh button
         refresh_btn = QPushButton("🔄 Actualiser")
-        refresh_btn.clicked.connect(self.load_employees)
-        refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 15px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
+        refresh_btn.clicked.connect(self.refresh_employees)
+        refresh_btn.setStyleSheet(REFRESH_BUTTON_QSS)
         search_layout.addWidget(refresh_btn)
 
         layout.addLayout(search_layout)
 
         # Employee table
-        self.table = QTableWidget()
-        self.table.setColumnCount(8)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "Nom Complet", "Poste", "Catégorie",
-            "Statut", "Date d'Embauche", "Ancienneté", "Actions"
-        ])
+        self.table = QTableView()
+        self.model = EmployeeTableModel(self)
+        self.table.setModel(self.model)
 
         # Table styling
         self.table.setAlternatingRowColors(True)
@@ -173,30 +303,14 @@ class EmployeeScreen(QWidget):
         header.setSectionResizeMode(7, QHeaderView.ResizeMode.Fixed)
 
         self.table.setColumnWidth(0, 60)
-        self.table.setColumnWidth(7, 200)
-
-        self.table.setStyleSheet("""
-            QTableWidget {
-                background-color: white;
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                gridline-color: #e0e0e0;
-            }
-            QTableWidget::item {
-                padding: 5px;
-            }
-            QTableWidget::item:selected {
-                background-color: #3498db;
-                color: white;
-            }
-            QHeaderView::section {
-                background-color: #34495e;
-                color: white;
-                padding: 8px;
-                border: none;
-                font-weight: bold;
-            }
-        """)
+        self.table.setColumnWidth(ACTIONS_COLUMN, 200)
+
+        # Row action buttons are painted by a delegate instead of per-row widgets
+        self.action_delegate = ActionButtonDelegate(self.action_buttons, self.table)
+        self.action_delegate.action_triggered.connect(self.on_row_action)
+        self.table.setItemDelegateForColumn(ACTIONS_COLUMN, self.action_delegate)
+
+        self.table.setStyleSheet(TABLE_QSS)
 
         layout.addWidget(self.table)
 
@@ -211,103 +325,73 @@ class EmployeeScreen(QWidget):
             include_inactive = self.status_filter.currentData()
             self.employees = EmployeeRepository.get_all(include_inactive=include_inactive)
             self.filtered_employees = self.employees
+            self._search_index = [
+                (emp.employee_id.lower(), emp.full_name.lower(), (emp.position or '').lower(), emp)
+                for emp in self.employees
+            ]
+            self.model.preformat(self.employees)
+
+            # Permissions are resolved once per load, not per painted row
+            can_edit = AuthManager.has_permission('can_edit_employees')
+            can_delete = AuthManager.has_permission('can_delete_employees')
+            edit = (EDIT_BUTTON,) if can_edit else ()
+            self._row_buttons = (
+                edit + ((DELETE_BUTTON,) if can_delete else ()),
+                edit + ((RESTORE_BUTTON,) if can_edit else ()),
+            )
+
+            # Load departments for filter (only when not cached)
+            if self._departments_cached is None:
+                self._departments_cached = EmployeeRepository.get_departments()
+                self.populate_departments(self._departments_cached)
 
-            # Load departments for filter
-            departments = EmployeeRepository.get_departments()
-            current_dept = self.dept_filter.currentData()
+            self.apply_filters()
 
-            # Block signals to prevent infinite loop
-            self.dept_filter.blockSignals(True)
-            self.dept_filter.clear()
-            self.dept_filter.addItem("Tous", None)
-            for dept in departments:
-                self.dept_filter.addItem(dept, dept)
+        except Exception as e:
+            QMessageBox.critical(self, "Erreur", f"Erreur lors du chargement des employés:\n{e}")
 
-            # Restore selected department
-            if current_dept:
-                index = self.dept_filter.findData(current_dept)
-                if index >= 0:
-                    self.dept_filter.setCurrentIndex(index)
+    def populate_departments(self, departments):
+        """Fill the department filter, keeping the current selection"""
+        current_dept = self.dept_filter.currentData()
 
-            # Unblock signals
-            self.dept_filter.blockSignals(False)
+        # Block signals to prevent infinite loop
+        self.dept_filter.blockSignals(True)
+        self.dept_filter.clear()
+        self.dept_filter.addItem("Tous", None)
+        for dept in departments:
+            self.dept_filter.addItem(dept, dept)
 
-            self.apply_filters()
+        # Restore selected department
+        if current_dept:
+            index = self.dept_filter.findData(current_dept)
+            if index >= 0:
+                self.dept_filter.setCurrentIndex(index)
 
-        except Exception as e:
-            QMessageBox.critical(self, "Erreur", f"Erreur lors du chargement des employés:\n{e}")
+        # Unblock signals
+        self.dept_filter.blockSignals(False)
+
+    def refresh_employees(self):
+        """Reload employees and the department list (refresh button)"""
+        self._departments_cached = None
+        self.load_employees()
 
     def apply_filters(self):
         """Apply search and filters"""
-        # Start with all employees
-        filtered = list(self.employees)
-
-        # Apply search filter
         search_text = self.search_input.text().strip()
-        if search_text:
-            filtered = [
-                emp for emp in filtered
-                if search_text.lower() in emp.employee_id.lower()
-                or search_text.lower() in emp.full_name.lower()
-                or (emp.position and search_text.lower() in emp.position.lower())
-            ]
-
-        # Apply department filter
         dept_code = self.dept_filter.currentData()
-        if dept_code:
-            filtered = [emp for emp in filtered if emp.department_code == dept_code]
 
-        self.filtered_employees = filtered
+        # Search and department filters in a single pass over the loaded list
+        query = search_text.lower()
+        self.filtered_employees = [
+            emp for id_lc, name_lc, position_lc, emp in self._search_index
+            if (not query or query in id_lc or query in name_lc or query in position_lc)
+            and (not dept_code or emp.department_code == dept_code)
+        ]
         self.display_employees()
 
     def display_employees(self):
         """Display employees in table"""
-        self.table.setRowCount(0)
-
-        for employee in self.filtered_employees:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-
-            # ID
-            id_item = QTableWidgetItem(employee.employee_id)
-            id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 0, id_item)
-
-            # Full Name
-            self.table.setItem(row, 1, QTableWidgetItem(employee.full_name))
-
-            # Position
-            self.table.setItem(row, 2, QTableWidgetItem(employee.position or "-"))
-
-            # Category
-            category_item = QTableWidgetItem(employee.category or "-")
-            category_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 3, category_item)
-
-            # Status
-            status_item = QTableWidgetItem("Actif" if employee.is_active else "Inactif")
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if employee.is_active:
-                status_item.setForeground(QColor("#2ecc71"))
-            else:
-                status_item.setForeground(QColor("#e74c3c"))
-            self.table.setItem(row, 4, status_item)
-
-            # Hire Date
-            hire_date = employee.hire_date.strftime("%d/%m/%Y") if employee.hire_date else "-"
-            date_item = QTableWidgetItem(hire_date)
-            date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 5, date_item)
-
-            # Seniority
-            seniority = f"{employee.seniority:.1f} ans" if employee.seniority else "-"
-            sen_item = QTableWidgetItem(seniority)
-            sen_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 6, sen_item)
-
-            # Actions buttons
-            actions_widget = self.create_action_buttons(employee)
-            self.table.setCellWidget(row, 7, actions_widget)
+        self.model.set_rows(self.filtered_employees)
 
         # Update status label with timestamp
         from datetime import datetime
@@ -318,82 +402,32 @@ class EmployeeScreen(QWidget):
             f"Affichage de {shown} employé(s) sur {total} | 🔄 Actualisé: {timestamp}"
         )
 
-    def create_action_buttons(self, employee: Employee):
-        """Create action buttons for a row"""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(5, 2, 5, 2)
-        layout.setSpacing(5)
-
-        # Edit button (only if user has permission)
-        if AuthManager.has_permission('can_edit_employees'):
-            edit_btn = QPushButton("Modifier")
-            edit_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #3498db;
-                    color: white;
-                    border: none;
-                    border-radius: 3px;
-                    padding: 5px 10px;
-                    font-size: 12px;
-                }
-                QPushButton:hover {
-                    background-color: #2980b9;
-                }
-            """)
-            edit_btn.clicked.connect(lambda: self.edit_employee(employee))
-            layout.addWidget(edit_btn)
-
-        # Delete/Restore button (only if user has permission)
-        if employee.is_active and AuthManager.has_permission('can_delete_employees'):
-            delete_btn = QPushButton("Supprimer")
-            delete_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #e74c3c;
-                    color: white;
-                    border: none;
-                    border-radius: 3px;
-                    padding: 5px 10px;
-                    font-size: 12px;
-                }
-                QPushButton:hover {
-                    background-color: #c0392b;
-                }
-            """)
-            delete_btn.clicked.connect(lambda: self.delete_employee(employee))
-            layout.addWidget(delete_btn)
-        elif not employee.is_active and AuthManager.has_permission('can_edit_employees'):
-            restore_btn = QPushButton("Restaurer")
-            restore_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #2ecc71;
-                    color: white;
-                    border: none;
-                    border-radius: 3px;
-                    padding: 5px 10px;
-                    font-size: 12px;
-                }
-                QPushButton:hover {
-                    background-color: #27ae60;
-                }
-            """)
-            restore_btn.clicked.connect(lambda: self.restore_employee(employee))
-            layout.addWidget(restore_btn)
-
-        # If no buttons shown, add a label
-        if layout.count() == 0:
-            no_action_label = QLabel("Lecture seule")
-            no_action_label.setStyleSheet("color: #95a5a6; font-style: italic; font-size: 11px;")
-            layout.addWidget(no_action_label)
-
-        return widget
+    def action_buttons(self, row):
+        """Return the action buttons painted for a table row"""
+        if row >= self.model.rowCount():
+            return ()
+        return self._row_buttons[0 if self.model.employee_at(row).is_active else 1]
+
+    def on_row_action(self, action, row):
+        """Handle a click on a row action button"""
+        employee = self.model.employee_at(row)
+        if action == "edit":
+            self.edit_employee(employee)
+        elif action == "delete":
+            self.delete_employee(employee)
+        elif action == "restore":
+            self.restore_employee(employee)
 
     def on_search(self, text):
-        """Handle search text change"""
+        """Handle search text change (restarts the debounce timer)"""
+        self._search_timer.start()
+
+    def on_department_change(self, index):
+        """Handle department filter change (filters the loaded list in memory)"""
         self.apply_filters()
 
-    def on_filter_change(self, index):
-        """Handle filter change"""
+    def on_status_change(self, index):
+        """Handle status filter change (active/all requires a new query)"""
         self.load_employees()
 
     def add_employee(self):
@@ -404,7 +438,9 @@ class EmployeeScreen(QWidget):
 
         dialog = EmployeeDialog(parent=self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.load_employees()
+            # The new employee may introduce a department
+            self.refresh_employees()
+            self.employees_changed.emit()
 
     def edit_employee(self, employee: Employee):
         """Open dialog to edit employee"""
@@ -414,7 +450,9 @@ class EmployeeScreen(QWidget):
 
         dialog = EmployeeDialog(parent=self, employee=employee)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.load_employees()
+            # The department may have changed
+            self.refresh_employees()
+            self.employees_changed.emit()
 
     def delete_employee(self, employee: Employee):
         """Delete employee (soft delete)"""
@@ -433,6 +471,7 @@ class EmployeeScreen(QWidget):
             if EmployeeRepository.delete(employee.employee_id):
                 QMessageBox.information(self, "Succès", "Employé supprimé avec succès.")
                 self.load_employees()
+                self.employees_changed.emit()
             else:
                 QMessageBox.critical(self, "Erreur", "Erreur lors de la suppression de l'employé.")
 
@@ -441,5 +480,6 @@ class EmployeeScreen(QWidget):
         if EmployeeRepository.restore(employee.employee_id):
             QMessageBox.information(self, "Succès", "Employé restauré avec succès.")
             self.load_employees()
+            self.employees_changed.emit()
         else:
             QMessageBox.critical(self, "Erreur", "Erreur lors de la restauration de l'employé.")
@@ -5,27 +5,165 @@ Create payroll periods and process employee payroll with calculations
 
 import sys
 import os
-from datetime import date, datetime
+from operator import itemgetter
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QTableWidget, QTableWidgetItem, QMessageBox, QHeaderView,
     QAbstractItemView, QComboBox, QDialog, QDialogButtonBox,
-    QDateEdit, QSpinBox, QDoubleSpinBox, QFormLayout, QFrame
+    QDateEdit, QFormLayout
 )
-from PyQt6.QtCore import Qt, QDate
+from PyQt6.QtCore import Qt, QDate, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QFont, QColor
 
 # Add parent directories to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from database.connection import DatabaseConnection
 from database.repositories.employee_repository import EmployeeRepository
 from database.repositories.payroll_repository import PayrollRepository
 from business.payroll_calculator import PayrollCalculator, PayrollInput
-from business.tax_calculator import TaxCalculator
-from ui.dialogs.payroll_edit_dialog import PayrollEditDialog
+from ui.widgets.action_delegate import ActionButtonDelegate
 from database.auth import AuthManager
 
 
+ACTIONS_COLUMN = 9
+
+# Row action buttons: (action, text, color)
+ROW_BUTTONS = (
+    ("edit", "✏️ Éditer", "#3498db"),
+    ("calculate", "⚡ Calc", "#f39c12"),
+)
+
+# Shown when a row action or finalization is attempted during "Calculer Tout"
+CALCULATION_RUNNING_MESSAGE = (
+    "Un calcul de la période est en cours. Veuillez patienter jusqu'à la fin du calcul."
+)
+
+# Shared cell styles for the payroll table
+ALIGN_RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+BOLD_FONT = QFont("", -1, QFont.Weight.Bold)
+DEDUCTION_COLOR = QColor("#e74c3c")
+TAX_COLOR = QColor("#e67e22")
+NET_COLOR = QColor("#27ae60")
+
+format_amount = "{:,.0f}".format
+
+# Numeric table cells: (column, value getter, text formatter, alignment, font, color)
+CELL_SPECS = (
+    (2, itemgetter('base_salary'), format_amount, ALIGN_RIGHT, None, None),
+    (3, itemgetter('days_worked'), str, Qt.AlignmentFlag.AlignCenter, None, None),
+    # Summed by PayrollRepository.get_records_by_period
+    (4, itemgetter('total_allowances'), format_amount, ALIGN_RIGHT, None, None),
+    (5, itemgetter('gross_salary'), format_amount, ALIGN_RIGHT, BOLD_FONT, None),
+    # INPS + AMO
+    (6, lambda record: record['inps_employee'] + record['amo_employee'],
+     format_amount, ALIGN_RIGHT, None, DEDUCTION_COLOR),
+    (7, itemgetter('income_tax_net'), format_amount, ALIGN_RIGHT, None, TAX_COLOR),
+    (8, itemgetter('net_to_pay'), format_amount, ALIGN_RIGHT, BOLD_FONT, NET_COLOR),
+)
+
+# Allowance columns of a payroll record, in PayrollInput order
+ALLOWANCE_COLUMNS = (
+    'ind_transport', 'family_allowance', 'responsibility_allowance',
+    'risk_premium', 'vehicle_allowance', 'overtime_pay',
+)
+get_allowances = itemgetter(*ALLOWANCE_COLUMNS)
+get_gross_salary = itemgetter('gross_salary')
+get_net_to_pay = itemgetter('net_to_pay')
+
+# Screen stylesheet, parsed once and matched by object name. Every rule is
+# scoped to a named widget so dialogs opened from the screen are unaffected.
+PAYROLL_SCREEN_QSS = """
+    QPushButton#createPeriodButton, QPushButton#calculateAllButton,
+    QPushButton#finalizeButton {
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 10px 20px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton#createPeriodButton {
+        background-color: #2ecc71;
+    }
+    QPushButton#createPeriodButton:hover {
+        background-color: #27ae60;
+    }
+    QPushButton#calculateAllButton {
+        background-color: #f39c12;
+    }
+    QPushButton#calculateAllButton:hover {
+        background-color: #e67e22;
+    }
+    QPushButton#finalizeButton {
+        background-color: #9b59b6;
+    }
+    QPushButton#finalizeButton:hover {
+        background-color: #8e44ad;
+    }
+    QPushButton#calculateAllButton:disabled, QPushButton#finalizeButton:disabled {
+        background-color: #bdc3c7;
+    }
+    QLabel#periodLabel {
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QComboBox#periodCombo {
+        padding: 8px;
+        border: 2px solid #3498db;
+        border-radius: 4px;
+        font-size: 13px;
+        min-width: 300px;
+    }
+    QTableWidget#payrollTable {
+        background-color: white;
+        border: 1px solid #ddd;
+        border-radius: 5px;
+        gridline-color: #e0e0e0;
+    }
+    QTableWidget#payrollTable::item {
+        padding: 5px;
+    }
+    QTableWidget#payrollTable::item:selected {
+        background-color: #3498db;
+        color: white;
+    }
+    QTableWidget#payrollTable QHeaderView::section {
+        background-color: #34495e;
+        color: white;
+        padding: 8px;
+        border: none;
+        font-weight: bold;
+    }
+    QLabel#payrollSummary {
+        background-color: #ecf0f1;
+        padding: 12px;
+        border-radius: 5px;
+        font-size: 13px;
+        color: #2c3e50;
+    }
+"""
+
+# payroll_records column -> payroll_data key, to refresh a displayed record
+RECORD_FIELDS = {
+    'base_salary': 'base_salary',
+    'days_worked': 'days_worked',
+    'days_absent': 'days_absent',
+    'ind_transport': 'transport_allowance',
+    'family_allowance': 'family_allowance',
+    'responsibility_allowance': 'responsibility_allowance',
+    'risk_premium': 'risk_allowance',
+    'vehicle_allowance': 'housing_allowance',
+    'overtime_pay': 'overtime_amount',
+    'gross_salary': 'gross_salary',
+    'inps_employee': 'inps_employee',
+    'amo_employee': 'amo_employee',
+    'income_tax_net': 'income_tax_net',
+    'net_salary': 'net_salary',
+    'net_to_pay': 'net_to_pay',
+}
+
+
 class CreatePeriodDialog(QDialog):
     """Dialog to create a new payroll period"""
 
@@ -73,6 +211,13 @@ class CreatePeriodDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
+    def reset(self):
+        """Reset all dates to today before showing the dialog again"""
+        today = QDate.currentDate()
+        self.start_date.setDate(today)
+        self.end_date.setDate(today)
+        self.payment_date.setDate(today)
+
     def get_data(self):
         """Get period data from dialog"""
         return {
@@ -82,19 +227,80 @@ class CreatePeriodDialog(QDialog):
         }
 
 
+class PayrollWorkerSignals(QObject):
+    """Signals emitted by PayrollWorker (delivered on the GUI thread)"""
+    row_done = pyqtSignal(int, dict)
+    finished = pyqtSignal(int)
+    failed = pyqtSignal(str)
+
+
+class PayrollWorker(QRunnable):
+    """Calculate and save a whole period's payroll off the UI thread"""
+
+    def __init__(self, database_path, period_id, calculator, rows, inputs):
+        super().__init__()
+        self.database_path = database_path
+        self.period_id = period_id
+        self.calculator = calculator
+        self.rows = rows  # Table row of each input
+        self.inputs = inputs
+        self.signals = PayrollWorkerSignals()
+
+    def run(self):
+        """Calculate every input, report each row, then write them all at once"""
+        try:
+            results = []
+            for row, result in zip(self.rows, self.calculator.calculate_batch(self.inputs)):
+                payroll_data = PayrollScreen.payroll_data_from_result(result)
+                results.append((result.employee_id, payroll_data))
+                self.signals.row_done.emit(row, payroll_data)
+
+            # Own connection: the GUI connection is never used from this thread
+            conn = DatabaseConnection.create_connection(self.database_path)
+            try:
+                conn.execute("PRAGMA foreign_keys = ON")
+                count = PayrollRepository.bulk_upsert_payroll_records(
+                    self.period_id, results, conn
+                )
+            finally:
+                conn.close()
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            self.signals.failed.emit(str(e))
+            return
+
+        self.signals.finished.emit(count)
+
+
 class PayrollScreen(QWidget):
     """Payroll processing screen"""
 
+    # Emitted after payroll records or periods are saved
+    payroll_changed = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.current_period = None
         self.payroll_records = []
         self.calculator = PayrollCalculator()
+        # Employees keyed by employee_id, loaded on first use (None = reload)
+        self._employee_by_id = None
+        # Running "Calculer Tout" worker and the errors found while preparing it
+        self._worker = None
+        self._worker_errors = []
+        # Period ID of each period combo entry
+        self._period_ids = []
+        self._create_period_dialog = None
+        # Table row of each displayed employee_id
+        self._row_by_emp = {}
         self.init_ui()
         self.load_periods()
 
     def init_ui(self):
         """Initialize the user interface"""
+        self.setStyleSheet(PAYROLL_SCREEN_QSS)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30, 30, 30, 30)
         layout.setSpacing(20)
@@ -113,20 +319,7 @@ class PayrollScreen(QWidget):
 
         # Create period button
         create_period_btn = QPushButton("+ Nouvelle Période")
-        create_period_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2ecc71;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 10px 20px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #27ae60;
-            }
-        """)
+        create_period_btn.setObjectName("createPeriodButton")
         create_period_btn.clicked.connect(self.create_period)
         header_layout.addWidget(create_period_btn)
 
@@ -136,19 +329,11 @@ class PayrollScreen(QWidget):
         period_layout = QHBoxLayout()
 
         period_label = QLabel("Période:")
-        period_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+        period_label.setObjectName("periodLabel")
         period_layout.addWidget(period_label)
 
         self.period_combo = QComboBox()
-        self.period_combo.setStyleSheet("""
-            QComboBox {
-                padding: 8px;
-                border: 2px solid #3498db;
-                border-radius: 4px;
-                font-size: 13px;
-                min-width: 300px;
-            }
-        """)
+        self.period_combo.setObjectName("periodCombo")
         self.period_combo.currentIndexChanged.connect(self.on_period_changed)
         period_layout.addWidget(self.period_combo)
 
@@ -156,46 +341,14 @@ class PayrollScreen(QWidget):
 
         # Calculate All button
         self.calculate_all_btn = QPushButton("⚡ Calculer Tout")
-        self.calculate_all_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f39c12;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 10px 20px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #e67e22;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-            }
-        """)
+        self.calculate_all_btn.setObjectName("calculateAllButton")
         self.calculate_all_btn.clicked.connect(self.calculate_all)
         self.calculate_all_btn.setEnabled(False)
         period_layout.addWidget(self.calculate_all_btn)
 
         # Finalize button
         self.finalize_btn = QPushButton("✓ Finaliser")
-        self.finalize_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #9b59b6;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 10px 20px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #8e44ad;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-            }
-        """)
+        self.finalize_btn.setObjectName("finalizeButton")
         self.finalize_btn.clicked.connect(self.finalize_period)
         self.finalize_btn.setEnabled(False)
         period_layout.addWidget(self.finalize_btn)
@@ -233,65 +386,53 @@ class PayrollScreen(QWidget):
         header.setSectionResizeMode(9, QHeaderView.ResizeMode.Fixed)
 
         self.table.setColumnWidth(3, 60)
-        self.table.setColumnWidth(9, 200)
-
-        self.table.setStyleSheet("""
-            QTableWidget {
-                background-color: white;
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                gridline-color: #e0e0e0;
-            }
-            QTableWidget::item {
-                padding: 5px;
-            }
-            QTableWidget::item:selected {
-                background-color: #3498db;
-                color: white;
-            }
-            QHeaderView::section {
-                background-color: #34495e;
-                color: white;
-                padding: 8px;
-                border: none;
-                font-weight: bold;
-            }
-        """)
+        self.table.setColumnWidth(ACTIONS_COLUMN, 200)
+
+        # Row action buttons are painted by a delegate instead of per-row widgets
+        self.action_delegate = ActionButtonDelegate(self.action_buttons, self.table)
+        self.action_delegate.action_triggered.connect(self.on_row_action)
+        self.table.setItemDelegateForColumn(ACTIONS_COLUMN, self.action_delegate)
+
+        self.table.setObjectName("payrollTable")
 
         layout.addWidget(self.table)
 
         # Summary bar
         self.summary_label = QLabel("Sélectionnez une période pour commencer")
-        self.summary_label.setStyleSheet("""
-            QLabel {
-                background-color: #ecf0f1;
-                padding: 12px;
-                border-radius: 5px;
-                font-size: 13px;
-                color: #2c3e50;
-            }
-        """)
+        self.summary_label.setObjectName("payrollSummary")
         layout.addWidget(self.summary_label)
 
+    def invalidate_employee_cache(self):
+        """Drop cached employees so the next lookup reloads them"""
+        self._employee_by_id = None
+
+    def _get_employee(self, employee_id):
+        """Return an employee by ID from the screen's employee cache"""
+        if self._employee_by_id is None:
+            self._employee_by_id = EmployeeRepository.get_all_by_id(include_inactive=True)
+        return self._employee_by_id.get(employee_id)
+
     def load_periods(self):
         """Load all payroll periods"""
+        self.invalidate_employee_cache()
         try:
             periods = PayrollRepository.get_all_periods()
 
+            # Rebuild the combo with one repaint and no selection signals
+            self.period_combo.setUpdatesEnabled(False)
             self.period_combo.blockSignals(True)
             self.period_combo.clear()
 
+            # Period IDs in combo order (labels are built by the query)
+            self._period_ids = [period['period_id'] for period in periods]
+
             if not periods:
-                self.period_combo.addItem("Aucune période - Créez-en une", None)
+                self.period_combo.addItem("Aucune période - Créez-en une")
             else:
-                for period in periods:
-                    start = period['period_start_date']
-                    end = period['period_end_date']
-                    finalized = " [Finalisée]" if period['is_finalized'] else ""
-                    label = f"{start} au {end}{finalized}"
-                    self.period_combo.addItem(label, period['period_id'])
+                self.period_combo.addItems([period['label'] for period in periods])
 
             self.period_combo.blockSignals(False)
+            self.period_combo.setUpdatesEnabled(True)
 
             # Load first period if available
             if periods:
@@ -303,7 +444,7 @@ class PayrollScreen(QWidget):
 
     def on_period_changed(self, index):
         """Handle period selection change"""
-        period_id = self.period_combo.currentData()
+        period_id = self._period_ids[index] if 0 <= index < len(self._period_ids) else None
 
         if period_id is None:
             self.current_period = None
@@ -316,10 +457,8 @@ class PayrollScreen(QWidget):
         # Load period details
         self.current_period = PayrollRepository.get_period_by_id(period_id)
 
-        # Check if finalized
-        is_finalized = self.current_period['is_finalized']
-        self.calculate_all_btn.setEnabled(not is_finalized)
-        self.finalize_btn.setEnabled(not is_finalized)
+        # Check if finalized (both actions wait for a running "Calculer Tout")
+        self._update_period_buttons()
 
         # Load payroll records
         self.load_payroll_records()
@@ -351,129 +490,69 @@ class PayrollScreen(QWidget):
 
     def display_payroll_records(self):
         """Display payroll records in table"""
+        # Fill all rows with a single repaint and no per-row model signals
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
         self.table.setRowCount(0)
+        self.table.setRowCount(len(self.payroll_records))
 
-        total_gross = 0
-        total_net = 0
+        for row, record in enumerate(self.payroll_records):
+            self._fill_row(row, record)
+        self._row_by_emp = {
+            record['employee_id']: row for row, record in enumerate(self.payroll_records)
+        }
 
-        for record in self.payroll_records:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
+        self.table.blockSignals(False)
+        self.table.setUpdatesEnabled(True)
 
-            # Employee name
-            self.table.setItem(row, 0, QTableWidgetItem(record['full_name']))
+        self.update_summary()
 
-            # Position
-            self.table.setItem(row, 1, QTableWidgetItem(record['position'] or "-"))
+    def _fill_row(self, row, record):
+        """Set the cells of one table row from a payroll record"""
+        # Employee name and position
+        self.table.setItem(row, 0, QTableWidgetItem(record['full_name']))
+        self.table.setItem(row, 1, QTableWidgetItem(record['position'] or "-"))
 
-            # Base salary
-            base_item = QTableWidgetItem(f"{int(record['base_salary']):,}")
-            base_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(row, 2, base_item)
+        # Numeric columns, styled from CELL_SPECS
+        for column, value, to_text, alignment, font, color in CELL_SPECS:
+            item = QTableWidgetItem(to_text(value(record)))
+            item.setTextAlignment(alignment)
+            if font is not None:
+                item.setFont(font)
+            if color is not None:
+                item.setForeground(color)
+            self.table.setItem(row, column, item)
 
-            # Days worked
-            days_item = QTableWidgetItem(str(record['days_worked']))
-            days_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 3, days_item)
+    def update_summary(self):
+        """Update the totals shown under the table"""
+        total_gross = sum(map(get_gross_salary, self.payroll_records))
+        total_net = sum(map(get_net_to_pay, self.payroll_records))
 
-            # Total allowances - use correct database column names
-            total_allowances = (
-                record.get('ind_transport', 0) + record.get('family_allowance', 0) +
-                record.get('responsibility_allowance', 0) + record.get('risk_premium', 0) +
-                record.get('vehicle_allowance', 0) + record.get('overtime_pay', 0)
-            )
-            allowances_item = QTableWidgetItem(f"{int(total_allowances):,}")
-            allowances_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(row, 4, allowances_item)
-
-            # Gross salary
-            gross_item = QTableWidgetItem(f"{int(record['gross_salary']):,}")
-            gross_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            gross_item.setFont(QFont("", -1, QFont.Weight.Bold))
-            self.table.setItem(row, 5, gross_item)
-            total_gross += record['gross_salary']
-
-            # INPS + AMO
-            social_deductions = record['inps_employee'] + record['amo_employee']
-            social_item = QTableWidgetItem(f"{int(social_deductions):,}")
-            social_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            social_item.setForeground(QColor("#e74c3c"))
-            self.table.setItem(row, 6, social_item)
-
-            # Tax
-            tax_item = QTableWidgetItem(f"{int(record['income_tax_net']):,}")
-            tax_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            tax_item.setForeground(QColor("#e67e22"))
-            self.table.setItem(row, 7, tax_item)
-
-            # Net to pay
-            net_item = QTableWidgetItem(f"{int(record['net_to_pay']):,}")
-            net_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            net_item.setFont(QFont("", -1, QFont.Weight.Bold))
-            net_item.setForeground(QColor("#27ae60"))
-            self.table.setItem(row, 8, net_item)
-            total_net += record['net_to_pay']
-
-            # Actions
-            actions_widget = self.create_action_buttons(record)
-            self.table.setCellWidget(row, 9, actions_widget)
-
-        # Update summary
         employee_count = len(self.payroll_records)
         self.summary_label.setText(
             f"Total: {employee_count} employé(s) | "
-            f"Salaire Brut: {int(total_gross):,} CFA | "
-            f"Net à Payer: {int(total_net):,} CFA"
+            f"Salaire Brut: {total_gross:,.0f} CFA | "
+            f"Net à Payer: {total_net:,.0f} CFA"
         )
 
-    def create_action_buttons(self, record):
-        """Create action buttons for a payroll record"""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setSpacing(8)
-
-        # Edit button
-        edit_btn = QPushButton("✏️ Éditer")
-        edit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 12px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
-        edit_btn.setMinimumWidth(80)
-        edit_btn.clicked.connect(lambda: self.edit_payroll_record(record))
-        layout.addWidget(edit_btn)
-
-        # Calculate button
-        calc_btn = QPushButton("⚡ Calc")
-        calc_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f39c12;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 12px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #e67e22;
-            }
-        """)
-        calc_btn.setMinimumWidth(75)
-        calc_btn.clicked.connect(lambda: self.calculate_single_record(record))
-        layout.addWidget(calc_btn)
-
-        return widget
+    def action_buttons(self, row):
+        """Return the action buttons painted for a table row"""
+        if row >= len(self.payroll_records):
+            return ()
+        return ROW_BUTTONS
+
+    def on_row_action(self, action, row):
+        """Handle a click on a row action button"""
+        # A running "Calculer Tout" saves its own values for every row
+        if self._worker is not None:
+            QMessageBox.information(self, "Calcul en cours", CALCULATION_RUNNING_MESSAGE)
+            return
+
+        record = self.payroll_records[row]
+        if action == "edit":
+            self.edit_payroll_record(record)
+        elif action == "calculate":
+            self.calculate_single_record(record)
 
     def create_period(self):
         """Create a new payroll period"""
@@ -481,9 +560,14 @@ class PayrollScreen(QWidget):
             QMessageBox.warning(self, "Permission refusée", "Vous n'avez pas la permission de créer des périodes de paie.")
             return
 
-        dialog = CreatePeriodDialog(self)
+        # Built once and reused on later clicks
+        if self._create_period_dialog is None:
+            self._create_period_dialog = CreatePeriodDialog(self)
+        dialog = self._create_period_dialog
+        dialog.reset()
         if dialog.exec() == QDialog.DialogCode.Accepted:
             data = dialog.get_data()
+            self.invalidate_employee_cache()
             try:
                 period_id = PayrollRepository.create_period(
                     data['start_date'],
@@ -496,92 +580,108 @@ class PayrollScreen(QWidget):
                     "Période créée avec succès.\nLes employés actifs seront ajoutés automatiquement."
                 )
                 self.load_periods()
+                self.payroll_changed.emit()
             except Exception as e:
                 QMessageBox.critical(self, "Erreur", f"Erreur lors de la création de la période:\n{e}")
 
+    def build_payroll_input(self, record, employee):
+        """Build the calculator input for a payroll record"""
+        transport, family, responsibility, risk, vehicle, overtime = get_allowances(record)
+
+        # Create payroll input (an unset family allowance defaults from the status code)
+        return PayrollInput(
+            employee_id=record['employee_id'],
+            base_salary=record['base_salary'],
+            status_code=employee.status_code or "",
+            days_worked=record['days_worked'],
+            days_absent=record['days_absent'],
+            transport_allowance=transport,
+            family_allowance=family,
+            responsibility_allowance=responsibility,
+            risk_allowance=risk,
+            housing_allowance=vehicle,
+            overtime_amount=overtime,
+            bonus_amount=0,  # Not in current schema
+            loan_deduction=record['advances_loans_deduction'],
+            advance_deduction=0,
+            other_deductions=0
+        )
+
+    def build_payroll_data(self, record, employee):
+        """Calculate a payroll record and return the fields to persist"""
+        result = self.calculator.calculate(self.build_payroll_input(record, employee))
+        return self.payroll_data_from_result(result)
+
+    @staticmethod
+    def payroll_data_from_result(result):
+        """Map a PayrollResult to the fields stored on a payroll record"""
+        return {
+            'base_salary': result.base_salary,
+            'days_worked': result.days_worked,
+            'days_absent': result.days_absent,
+            'transport_allowance': result.transport_allowance,
+            'family_allowance': result.family_allowance,
+            'responsibility_allowance': result.responsibility_allowance,
+            'risk_allowance': result.risk_allowance,
+            'housing_allowance': result.housing_allowance,
+            'overtime_amount': result.overtime_amount,
+            'bonus_amount': result.bonus_amount,
+            'ind_spec_1973': result.ind_spec_1973,
+            'cher_vie_1974': result.cher_vie_1974,
+            'gross_salary': result.gross_salary,
+            'inps_employee': result.inps_employee,
+            'amo_employee': result.amo_employee,
+            'income_tax_net': result.income_tax_net,
+            'loan_deduction': result.loan_deduction,
+            'advance_deduction': result.advance_deduction,
+            'other_deductions': result.other_deductions,
+            'net_salary': result.net_salary,
+            'net_to_pay': result.net_to_pay,
+            'inps_employer': result.inps_employer,
+            'amo_employer': result.amo_employer,
+            'taxe_logement': result.taxe_logement,
+            'taxe_formation': result.taxe_formation,
+            'taxe_emploi': result.taxe_emploi,
+            'contribution_cfe': result.contribution_cfe,
+            'total_employer_cost': result.total_employer_cost,
+            'total_cost': result.total_cost
+        }
+
     def calculate_single_record(self, record):
-        """Calculate payroll for a single employee"""
+        """
+        Calculate payroll for a single employee
+
+        Returns the saved payroll data, or None on error. The employee's row is
+        updated in place (full reload only if it is not displayed).
+        """
         try:
             # Get employee data
             employee_id = record['employee_id']
-            employees = EmployeeRepository.get_all(include_inactive=True)
-            employee = next((e for e in employees if e.employee_id == employee_id), None)
+            employee = self._get_employee(employee_id)
 
             if not employee:
                 QMessageBox.warning(self, "Erreur", "Employé introuvable")
                 return
 
-            # Create payroll input
-            input_data = PayrollInput(
-                employee_id=employee_id,
-                base_salary=record['base_salary'],
-                status_code=employee.status_code or "",
-                days_worked=record['days_worked'],
-                days_absent=record['days_absent'],
-                transport_allowance=record.get('ind_transport', 0),
-                family_allowance=record.get('family_allowance', 0),
-                responsibility_allowance=record.get('responsibility_allowance', 0),
-                risk_allowance=record.get('risk_premium', 0),
-                housing_allowance=record.get('vehicle_allowance', 0),
-                overtime_amount=record.get('overtime_pay', 0),
-                bonus_amount=0,  # Not in current schema
-                loan_deduction=record.get('advances_loans_deduction', 0),
-                advance_deduction=0,
-                other_deductions=0
-            )
-
-            # Auto-calculate family allowance if not set
-            if input_data.family_allowance == 0:
-                input_data.family_allowance = self.calculator.calculate_family_allowance(
-                    employee.status_code or "", input_data.base_salary
-                )
-
-            # Calculate payroll
-            result = self.calculator.calculate(input_data)
-
-            # Update database
-            payroll_data = {
-                'base_salary': result.base_salary,
-                'days_worked': result.days_worked,
-                'days_absent': result.days_absent,
-                'transport_allowance': result.transport_allowance,
-                'family_allowance': result.family_allowance,
-                'responsibility_allowance': result.responsibility_allowance,
-                'risk_allowance': result.risk_allowance,
-                'housing_allowance': result.housing_allowance,
-                'overtime_amount': result.overtime_amount,
-                'bonus_amount': result.bonus_amount,
-                'ind_spec_1973': result.ind_spec_1973,
-                'cher_vie_1974': result.cher_vie_1974,
-                'gross_salary': result.gross_salary,
-                'inps_employee': result.inps_employee,
-                'amo_employee': result.amo_employee,
-                'income_tax_net': result.income_tax_net,
-                'loan_deduction': result.loan_deduction,
-                'advance_deduction': result.advance_deduction,
-                'other_deductions': result.other_deductions,
-                'net_salary': result.net_salary,
-                'net_to_pay': result.net_to_pay,
-                'inps_employer': result.inps_employer,
-                'amo_employer': result.amo_employer,
-                'taxe_logement': result.taxe_logement,
-                'taxe_formation': result.taxe_formation,
-                'taxe_emploi': result.taxe_emploi,
-                'contribution_cfe': result.contribution_cfe,
-                'total_employer_cost': result.total_employer_cost,
-                'total_cost': result.total_cost
-            }
+            payroll_data = self.build_payroll_data(record, employee)
 
             PayrollRepository.create_payroll_record(
                 self.current_period['period_id'],
                 employee_id,
                 payroll_data
             )
+            self.payroll_changed.emit()
 
-            # Reload data
-            self.load_payroll_records()
+            # Refresh only this employee's row when it is displayed
+            row = self._row_by_emp.get(employee_id)
+            if row is None:
+                self.load_payroll_records()
+            else:
+                self._update_row(row, payroll_data)
+                self.update_summary()
 
             QMessageBox.information(self, "Succès", f"Calcul effectué pour {employee.full_name}")
+            return payroll_data
 
         except Exception as e:
             import traceback
@@ -594,37 +694,111 @@ class PayrollScreen(QWidget):
             QMessageBox.warning(self, "Permission refusée", "Vous n'avez pas la permission de traiter la paie.")
             return
 
-        if not self.current_period:
+        if not self.current_period or self._worker is not None:
             return
 
         try:
-            count = 0
+            rows = []
+            inputs = []
             errors = []
 
-            for record in self.payroll_records:
+            for row, record in enumerate(self.payroll_records):
                 try:
-                    self.calculate_single_record(record)
-                    count += 1
+                    employee = self._get_employee(record['employee_id'])
+                    if employee is None:
+                        raise ValueError("Employé introuvable")
+                    inputs.append(self.build_payroll_input(record, employee))
+                    rows.append(row)
                 except Exception as e:
                     errors.append(f"{record['full_name']}: {str(e)}")
 
-            if errors:
-                QMessageBox.warning(
-                    self,
-                    "Calculs Terminés avec Erreurs",
-                    f"{count} calculs réussis.\n\nErreurs:\n" + "\n".join(errors[:5])
-                )
-            else:
-                QMessageBox.information(
-                    self,
-                    "Succès",
-                    f"Calculs effectués pour {count} employé(s)."
-                )
-
-            self.load_payroll_records()
+            database_path = DatabaseConnection.get_database_path()
+            if database_path is None:
+                raise RuntimeError("Database not initialized")
 
         except Exception as e:
             QMessageBox.critical(self, "Erreur", f"Erreur lors du calcul:\n{e}")
+            return
+
+        # Calculate and save in the background; rows are refreshed as they complete
+        self._worker_errors = errors
+        self._worker = PayrollWorker(
+            database_path, self.current_period['period_id'], self.calculator, rows, inputs
+        )
+        self._worker.signals.row_done.connect(self._on_row_calculated)
+        self._worker.signals.finished.connect(self._on_calculate_all_finished)
+        self._worker.signals.failed.connect(self._on_calculate_all_failed)
+        self._update_period_buttons()
+        QThreadPool.globalInstance().start(self._worker)
+
+    def _on_row_calculated(self, row, payroll_data):
+        """Show a record calculated by the background worker"""
+        if not self._is_worker_period() or row >= len(self.payroll_records):
+            return
+        self._update_row(row, payroll_data)
+
+    def _update_row(self, row, payroll_data):
+        """Apply saved payroll data to a displayed record and redraw its row"""
+        record = self.payroll_records[row]
+        for column, key in RECORD_FIELDS.items():
+            record[column] = payroll_data[key]
+        record['advances_loans_deduction'] = (
+            payroll_data['loan_deduction'] +
+            payroll_data['advance_deduction'] +
+            payroll_data['other_deductions']
+        )
+        record['total_allowances'] = sum(get_allowances(record))
+        self._fill_row(row, record)
+
+    def _is_worker_period(self):
+        """Whether the running worker calculates the displayed period"""
+        return (
+            self._worker is not None and self.current_period is not None
+            and self.current_period['period_id'] == self._worker.period_id
+        )
+
+    def _update_period_buttons(self):
+        """Enable "Calculer Tout" and "Finaliser" for an open period with no run in progress"""
+        enabled = (
+            self.current_period is not None
+            and not self.current_period['is_finalized']
+            and self._worker is None
+        )
+        self.calculate_all_btn.setEnabled(enabled)
+        self.finalize_btn.setEnabled(enabled)
+
+    def _end_worker(self):
+        """Forget the finished worker and re-enable the period actions if allowed"""
+        self._worker = None
+        self._update_period_buttons()
+
+    def _on_calculate_all_finished(self, count):
+        """Report the end of a "Calculer Tout" run"""
+        if self._is_worker_period():
+            self.update_summary()
+        self._end_worker()
+        self.payroll_changed.emit()
+
+        errors = self._worker_errors
+        if errors:
+            QMessageBox.warning(
+                self,
+                "Calculs Terminés avec Erreurs",
+                f"{count} calculs réussis.\n\nErreurs:\n" + "\n".join(errors[:5])
+            )
+        else:
+            QMessageBox.information(
+                self,
+                "Succès",
+                f"Calculs effectués pour {count} employé(s)."
+            )
+
+    def _on_calculate_all_failed(self, message):
+        """Handle a failure reported by the background worker"""
+        self._end_worker()
+        QMessageBox.critical(self, "Erreur", f"Erreur lors du calcul:\n{message}")
+        # Rows may show values that were not saved
+        self.load_payroll_records()
 
     def edit_payroll_record(self, record):
         """Edit a payroll record"""
@@ -632,6 +806,9 @@ class PayrollScreen(QWidget):
             QMessageBox.warning(self, "Permission refusée", "Vous n'avez pas la permission de modifier la paie.")
             return
 
+        # Imported on first use: only needed once a record is edited
+        from ui.dialogs.payroll_edit_dialog import PayrollEditDialog
+
         # Open edit dialog
         dialog = PayrollEditDialog(
             employee_name=record['full_name'],
@@ -659,6 +836,10 @@ class PayrollScreen(QWidget):
         if not self.current_period:
             return
 
+        if self._worker is not None:
+            QMessageBox.information(self, "Calcul en cours", CALCULATION_RUNNING_MESSAGE)
+            return
+
         reply = QMessageBox.question(
             self,
             "Confirmer la Finalisation",
@@ -670,6 +851,8 @@ class PayrollScreen(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             if PayrollRepository.finalize_period(self.current_period['period_id']):
                 QMessageBox.information(self, "Succès", "Période finalisée avec succès.")
+                self.invalidate_employee_cache()
                 self.load_periods()
+                self.payroll_changed.emit()
             else:
                 QMessageBox.critical(self, "Erreur", "Erreur lors de la finalisation.")
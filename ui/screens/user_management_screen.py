@@ -3,20 +3,252 @@ User Management Screen
 Admin interface for managing system users
 """
 
+import csv
+import os
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTableWidget, QTableWidgetItem, QMessageBox, QHeaderView,
+    QTableView, QMessageBox, QHeaderView,
     QAbstractItemView, QDialog, QLineEdit, QComboBox, QFormLayout,
-    QDialogButtonBox, QFrame
+    QDialogButtonBox, QFileDialog
+)
+from PyQt6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, pyqtSignal
 )
-from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont, QColor
 
 from database.auth import AuthManager
 from ui.dialogs.permissions_dialog import PermissionsDialog
+from ui.widgets.action_delegate import ActionButtonDelegate
+from ui.widgets.debouncer import Debouncer
+from ui.widgets.password_strength import PasswordStrengthBar
+from utils.user_validation import IDENTITY_RULES, PASSWORD_RULES, first_failed_rule
+
+
+# Table columns
+ACTIONS_COLUMN = 6
+CENTERED_COLUMNS = (2, 3, 4, 5)
+
+# Rows formatted and handed to the view per fetch, as it scrolls
+ROW_BATCH_SIZE = 100
+
+# Row action buttons: (action, text, color)
+PASSWORD_BUTTON = ("password", "🔑 Mot de passe", "#3498db")
+PERMISSIONS_BUTTON = ("permissions", "🔒 Permissions", "#9b59b6")
+DEACTIVATE_BUTTON = ("toggle", "❌ Désactiver", "#e74c3c")
+ACTIVATE_BUTTON = ("toggle", "✓ Activer", "#27ae60")
+DELETE_BUTTON = ("delete", "🗑️", "#95a5a6")
+
+ACTIVE_USER_BUTTONS = (PASSWORD_BUTTON, PERMISSIONS_BUTTON, DEACTIVATE_BUTTON, DELETE_BUTTON)
+INACTIVE_USER_BUTTONS = (PASSWORD_BUTTON, PERMISSIONS_BUTTON, ACTIVATE_BUTTON, DELETE_BUTTON)
+
+# Shared cell styles for the users table
+BOLD_FONT = QFont("", -1, QFont.Weight.Bold)
+ADMIN_COLOR = QColor("#e74c3c")
+USER_COLOR = QColor("#3498db")
+ACTIVE_COLOR = QColor("#27ae60")
+INACTIVE_COLOR = QColor("#95a5a6")
+ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+
+# Item data roles, resolved once instead of on every data() call
+DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+FONT_ROLE = Qt.ItemDataRole.FontRole
+FOREGROUND_ROLE = Qt.ItemDataRole.ForegroundRole
+HORIZONTAL = Qt.Orientation.Horizontal
+MODEL_ROLES = frozenset((DISPLAY_ROLE, ALIGNMENT_ROLE, FONT_ROLE, FOREGROUND_ROLE))
+
+# Columns required in a users CSV import (role is optional, 'user' by default)
+IMPORT_COLUMNS = ("username", "full_name", "password")
+
+# Delay (ms) after the last keystroke before the username is looked up
+USERNAME_CHECK_DEBOUNCE_MS = 250
+
+# Stylesheet shared by the user dialogs, parsed once per dialog instead of
+# once per input
+USER_DIALOG_QSS = """
+    QLineEdit, QComboBox {
+        padding: 10px;
+        border: 2px solid #bdc3c7;
+        border-radius: 5px;
+        font-size: 13px;
+    }
+    QLabel#dialogHeader, QLabel#dialogTitle {
+        font-size: 14px;
+        font-weight: bold;
+        color: #2c3e50;
+    }
+    QLabel#dialogTitle {
+        font-size: 16px;
+    }
+    QLabel#usernameWarning {
+        color: #e74c3c;
+        font-size: 11px;
+    }
+    QLabel#dialogInfo {
+        color: #7f8c8d;
+        font-size: 11px;
+        font-style: italic;
+        padding: 8px;
+    }
+"""
+
+# Screen stylesheet, parsed once and matched by object name. Every rule is
+# scoped to a named widget so dialogs opened from the screen are unaffected.
+USER_SCREEN_QSS = """
+    QLabel#usersTitle {
+        color: #2c3e50;
+    }
+    QLabel#usersSubtitle {
+        color: #7f8c8d;
+        font-size: 14px;
+        margin-bottom: 10px;
+    }
+    QPushButton#addUserButton {
+        background-color: #27ae60;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 10px 20px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton#addUserButton:hover {
+        background-color: #229954;
+    }
+    QPushButton#importUsersButton {
+        background-color: #3498db;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 10px 20px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton#importUsersButton:hover {
+        background-color: #2980b9;
+    }
+    QTableView#usersTable {
+        background-color: white;
+        border: 1px solid #ddd;
+        border-radius: 5px;
+        gridline-color: #e0e0e0;
+    }
+    QTableView#usersTable::item {
+        padding: 5px;
+    }
+    QTableView#usersTable::item:selected {
+        background-color: #3498db;
+        color: white;
+    }
+    QTableView#usersTable QHeaderView::section {
+        background-color: #34495e;
+        color: white;
+        padding: 10px;
+        border: none;
+        font-weight: bold;
+    }
+    QLabel#usersSummary {
+        background-color: #ecf0f1;
+        padding: 12px;
+        border-radius: 5px;
+        font-size: 13px;
+        color: #2c3e50;
+    }
+"""
+
+
+class PasswordHashWorkerSignals(QObject):
+    """Signals emitted by PasswordHashWorker (delivered on the GUI thread)"""
+    hashed = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+
+class PasswordHashWorker(QRunnable):
+    """Hash a password off the UI thread (Argon2id takes a few hundred ms)"""
+
+    def __init__(self, password):
+        super().__init__()
+        self.password = password
+        self.signals = PasswordHashWorkerSignals()
+
+    def run(self):
+        """Hash the password and report the result"""
+        try:
+            password_hash = AuthManager.hash_password(self.password)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
 
+        self.signals.hashed.emit(password_hash)
 
-class ChangePasswordDialog(QDialog):
+
+class BulkPasswordHashWorkerSignals(QObject):
+    """Signals emitted by BulkPasswordHashWorker (delivered on the GUI thread)"""
+    hashed = pyqtSignal(list)
+    failed = pyqtSignal(str)
+
+
+class BulkPasswordHashWorker(QRunnable):
+    """Hash the passwords of a users import off the UI thread"""
+
+    def __init__(self, passwords):
+        super().__init__()
+        self.passwords = passwords
+        self.signals = BulkPasswordHashWorkerSignals()
+
+    def run(self):
+        """Hash the passwords and report the hashes, in order"""
+        try:
+            password_hashes = AuthManager.hash_passwords_bulk(self.passwords)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+
+        self.signals.hashed.emit(password_hashes)
+
+
+class PasswordHashingDialog(QDialog):
+    """Base for dialogs saving a password hashed in the thread pool"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._hash_worker = None
+        self._on_hashed = None
+
+    def hash_password_async(self, password, on_hashed):
+        """Hash a password in the background, then call on_hashed(hash)
+
+        The dialog stays disabled (and cannot be closed) until the hash is ready.
+        """
+        self.setEnabled(False)
+        self.setCursor(Qt.CursorShape.WaitCursor)
+        self._on_hashed = on_hashed
+        self._hash_worker = PasswordHashWorker(password)
+        self._hash_worker.signals.hashed.connect(self._password_hashed)
+        self._hash_worker.signals.failed.connect(self._password_hash_failed)
+        QThreadPool.globalInstance().start(self._hash_worker)
+
+    def _end_hashing(self):
+        """Re-enable the dialog after hashing"""
+        self._hash_worker = None
+        self.unsetCursor()
+        self.setEnabled(True)
+
+    def _password_hashed(self, password_hash):
+        self._end_hashing()
+        self._on_hashed(password_hash)
+
+    def _password_hash_failed(self, error):
+        self._end_hashing()
+        QMessageBox.critical(self, "Erreur", f"Erreur lors du hachage du mot de passe: {error}")
+
+    def reject(self):
+        """Ignore closing while a password is being hashed"""
+        if self._hash_worker is None:
+            super().reject()
+
+
+class ChangePasswordDialog(PasswordHashingDialog):
     """Dialog to change user password"""
 
     def __init__(self, user_id, username, parent=None):
@@ -25,6 +257,7 @@ class ChangePasswordDialog(QDialog):
         self.username = username
         self.setWindowTitle(f"Changer le Mot de Passe - {username}")
         self.setMinimumWidth(400)
+        self.setStyleSheet(USER_DIALOG_QSS)
         self.init_ui()
 
     def init_ui(self):
@@ -34,7 +267,7 @@ class ChangePasswordDialog(QDialog):
 
         # Header
         header = QLabel(f"Nouveau mot de passe pour: {self.username}")
-        header.setStyleSheet("font-size: 14px; font-weight: bold; color: #2c3e50;")
+        header.setObjectName("dialogHeader")
         layout.addWidget(header)
 
         # Form
@@ -44,27 +277,12 @@ class ChangePasswordDialog(QDialog):
         self.password_input = QLineEdit()
         self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
         self.password_input.setPlaceholderText("Entrez le nouveau mot de passe")
-        self.password_input.setStyleSheet("""
-            QLineEdit {
-                padding: 10px;
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                font-size: 13px;
-            }
-        """)
         form_layout.addRow("Mot de passe:", self.password_input)
+        form_layout.addRow("Robustesse:", PasswordStrengthBar(self.password_input, self))
 
         self.confirm_input = QLineEdit()
         self.confirm_input.setEchoMode(QLineEdit.EchoMode.Password)
         self.confirm_input.setPlaceholderText("Confirmez le mot de passe")
-        self.confirm_input.setStyleSheet("""
-            QLineEdit {
-                padding: 10px;
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                font-size: 13px;
-            }
-        """)
         form_layout.addRow("Confirmation:", self.confirm_input)
 
         layout.addLayout(form_layout)
@@ -81,22 +299,20 @@ class ChangePasswordDialog(QDialog):
     def save_password(self):
         """Save new password"""
         password = self.password_input.text()
-        confirm = self.confirm_input.text()
-
-        if not password:
-            QMessageBox.warning(self, "Erreur", "Le mot de passe ne peut pas être vide")
-            return
 
-        if len(password) < 4:
-            QMessageBox.warning(self, "Erreur", "Le mot de passe doit contenir au moins 4 caractères")
+        error = first_failed_rule(PASSWORD_RULES, password, self.confirm_input.text())
+        if error:
+            QMessageBox.warning(self, "Erreur", error)
             return
 
-        if password != confirm:
-            QMessageBox.warning(self, "Erreur", "Les mots de passe ne correspondent pas")
-            return
+        # Hash off the UI thread, then save
+        self.hash_password_async(password, self.store_password)
 
-        # Change password
-        success, error = AuthManager.change_password(self.user_id, password)
+    def store_password(self, password_hash):
+        """Save the hashed new password"""
+        success, error = AuthManager.change_password(
+            self.user_id, self.password_input.text(), password_hash=password_hash
+        )
 
         if success:
             QMessageBox.information(self, "Succès", "Mot de passe modifié avec succès")
@@ -105,13 +321,15 @@ class ChangePasswordDialog(QDialog):
             QMessageBox.critical(self, "Erreur", error)
 
 
-class AddUserDialog(QDialog):
+class AddUserDialog(PasswordHashingDialog):
     """Dialog to add a new user"""
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Ajouter un Utilisateur")
         self.setMinimumWidth(450)
+        self.created_user = None  # Row of the new user, set on success
+        self.setStyleSheet(USER_DIALOG_QSS)
         self.init_ui()
 
     def init_ui(self):
@@ -121,7 +339,7 @@ class AddUserDialog(QDialog):
 
         # Header
         header = QLabel("Créer un nouveau compte utilisateur")
-        header.setStyleSheet("font-size: 16px; font-weight: bold; color: #2c3e50;")
+        header.setObjectName("dialogTitle")
         layout.addWidget(header)
 
         # Form
@@ -131,76 +349,47 @@ class AddUserDialog(QDialog):
         # Username
         self.username_input = QLineEdit()
         self.username_input.setPlaceholderText("Nom d'utilisateur unique")
-        self.username_input.setStyleSheet("""
-            QLineEdit {
-                padding: 10px;
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                font-size: 13px;
-            }
-        """)
         form_layout.addRow("Nom d'utilisateur:", self.username_input)
 
+        # Availability hint, checked once typing pauses
+        self.username_warning = QLabel("Ce nom d'utilisateur existe déjà")
+        self.username_warning.setObjectName("usernameWarning")
+        self.username_warning.hide()
+        form_layout.addRow("", self.username_warning)
+        Debouncer(
+            self.username_input.textChanged, USERNAME_CHECK_DEBOUNCE_MS,
+            self.check_username_taken, self
+        )
+
         # Full name
         self.fullname_input = QLineEdit()
         self.fullname_input.setPlaceholderText("Nom complet de l'utilisateur")
-        self.fullname_input.setStyleSheet("""
-            QLineEdit {
-                padding: 10px;
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                font-size: 13px;
-            }
-        """)
         form_layout.addRow("Nom complet:", self.fullname_input)
 
         # Role
         self.role_combo = QComboBox()
         self.role_combo.addItem("Utilisateur", "user")
         self.role_combo.addItem("Administrateur", "admin")
-        self.role_combo.setStyleSheet("""
-            QComboBox {
-                padding: 10px;
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                font-size: 13px;
-            }
-        """)
         form_layout.addRow("Rôle:", self.role_combo)
 
         # Password
         self.password_input = QLineEdit()
         self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
         self.password_input.setPlaceholderText("Mot de passe initial")
-        self.password_input.setStyleSheet("""
-            QLineEdit {
-                padding: 10px;
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                font-size: 13px;
-            }
-        """)
         form_layout.addRow("Mot de passe:", self.password_input)
+        form_layout.addRow("Robustesse:", PasswordStrengthBar(self.password_input, self))
 
         # Confirm password
         self.confirm_input = QLineEdit()
         self.confirm_input.setEchoMode(QLineEdit.EchoMode.Password)
         self.confirm_input.setPlaceholderText("Confirmez le mot de passe")
-        self.confirm_input.setStyleSheet("""
-            QLineEdit {
-                padding: 10px;
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                font-size: 13px;
-            }
-        """)
         form_layout.addRow("Confirmation:", self.confirm_input)
 
         layout.addLayout(form_layout)
 
         # Info note
         info_label = QLabel("ℹ️ L'utilisateur pourra changer son mot de passe après la première connexion")
-        info_label.setStyleSheet("color: #7f8c8d; font-size: 11px; font-style: italic; padding: 8px;")
+        info_label.setObjectName("dialogInfo")
         info_label.setWordWrap(True)
         layout.addWidget(info_label)
 
@@ -213,47 +402,195 @@ class AddUserDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
+    def check_username_taken(self):
+        """Show the warning when the typed username already exists"""
+        username = self.username_input.text().strip()
+        try:
+            taken = len(username) >= 3 and AuthManager.username_exists(username)
+        except Exception:
+            taken = False  # The check is only a hint; create_user validates again
+        self.username_warning.setVisible(taken)
+
     def create_user(self):
         """Create new user"""
         username = self.username_input.text().strip()
         fullname = self.fullname_input.text().strip()
-        role = self.role_combo.currentData()
         password = self.password_input.text()
-        confirm = self.confirm_input.text()
 
         # Validation
-        if not username:
-            QMessageBox.warning(self, "Erreur", "Le nom d'utilisateur est requis")
+        error = (
+            first_failed_rule(IDENTITY_RULES, username, fullname)
+            or first_failed_rule(PASSWORD_RULES, password, self.confirm_input.text())
+        )
+        if error:
+            QMessageBox.warning(self, "Erreur", error)
             return
 
-        if len(username) < 3:
-            QMessageBox.warning(self, "Erreur", "Le nom d'utilisateur doit contenir au moins 3 caractères")
-            return
+        # Hash off the UI thread, then create the user
+        self.hash_password_async(password, self.store_user)
 
-        if not fullname:
-            QMessageBox.warning(self, "Erreur", "Le nom complet est requis")
-            return
+    def store_user(self, password_hash):
+        """Create the user with the hashed password"""
+        username = self.username_input.text().strip()
+        user, error = AuthManager.create_user(
+            username, self.password_input.text(), self.fullname_input.text().strip(),
+            self.role_combo.currentData(), password_hash=password_hash
+        )
 
-        if not password:
-            QMessageBox.warning(self, "Erreur", "Le mot de passe est requis")
-            return
+        if user:
+            self.created_user = user
+            QMessageBox.information(self, "Succès", f"Utilisateur '{username}' créé avec succès")
+            self.accept()
+        else:
+            QMessageBox.critical(self, "Erreur", error)
 
-        if len(password) < 4:
-            QMessageBox.warning(self, "Erreur", "Le mot de passe doit contenir au moins 4 caractères")
-            return
 
-        if password != confirm:
-            QMessageBox.warning(self, "Erreur", "Les mots de passe ne correspondent pas")
+class UserTableModel(QAbstractTableModel):
+    """Table model exposing the list of users to a QTableView"""
+
+    HEADERS = [
+        "Nom d'utilisateur", "Nom Complet", "Rôle",
+        "Statut", "Dernière Connexion", "Créé le", "Actions"
+    ]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._users = []
+        # Per-row display data of the rows fetched so far, one list per
+        # attribute: texts, text colors and action buttons
+        self._display_rows = []
+        self._foregrounds = []
+        self._buttons = []
+
+    def _attribute_lists(self):
+        """Return the per-row display lists with the formatter filling each"""
+        return (
+            (self._display_rows, self.format_row),
+            (self._foregrounds, self.row_foregrounds),
+            (self._buttons, self.row_buttons),
+        )
+
+    def set_users(self, users):
+        """Replace the displayed users, exposing only the first batch of rows"""
+        batch = users[:ROW_BATCH_SIZE]
+        self.beginResetModel()
+        self._users = users
+        for values, formatter in self._attribute_lists():
+            values[:] = map(formatter, batch)
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and len(self._display_rows) < len(self._users)
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Format the next batch of rows once the view scrolls near the end"""
+        if parent.isValid():
+            return
+        first = len(self._display_rows)
+        last = min(first + ROW_BATCH_SIZE, len(self._users)) - 1
+        if last < first:
             return
+        batch = self._users[first:last + 1]
+        self.beginInsertRows(QModelIndex(), first, last)
+        for values, formatter in self._attribute_lists():
+            values.extend(map(formatter, batch))
+        self.endInsertRows()
+
+    def user_at(self, row):
+        """Return the user displayed at a row"""
+        return self._users[row]
+
+    def buttons_at(self, row):
+        """Return the action buttons of a displayed row"""
+        return self._buttons[row] if row < len(self._buttons) else ()
+
+    def refresh_row(self, row):
+        """Reformat a user whose fields were changed in place"""
+        if row >= len(self._display_rows):
+            return  # Not fetched yet: formatted when scrolled into view
+        user = self._users[row]
+        for values, formatter in self._attribute_lists():
+            values[row] = formatter(user)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def insert_user(self, row, user):
+        """Insert a newly created user at a row"""
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._users.insert(row, user)
+        for values, formatter in self._attribute_lists():
+            values.insert(row, formatter(user))
+        self.endInsertRows()
+
+    def remove_row(self, row):
+        """Remove the user displayed at a row"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._users[row]
+        for values, _ in self._attribute_lists():
+            del values[row]
+        self.endRemoveRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._display_rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=DISPLAY_ROLE):
+        if role == DISPLAY_ROLE and orientation == HORIZONTAL:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=DISPLAY_ROLE):
+        # Queried for every role of every painted cell: drop the unused
+        # roles (decoration, check state, size hint...) before anything else
+        if role not in MODEL_ROLES or not index.isValid():
+            return None
+
+        column = index.column()
+        if column == ACTIONS_COLUMN:
+            return None  # Painted by ActionButtonDelegate
+
+        if role == DISPLAY_ROLE:
+            return self._display_rows[index.row()][column]
+        if role == ALIGNMENT_ROLE:
+            if column in CENTERED_COLUMNS:
+                return ALIGN_CENTER
+            return None
+        if role == FONT_ROLE and column == 0:
+            return BOLD_FONT
+        if role == FOREGROUND_ROLE:
+            return self._foregrounds[index.row()][column]
+        return None
+
+    @staticmethod
+    def format_row(user):
+        """Return the display text of each data column for a user"""
+        return (
+            user['username'],
+            user['full_name'],
+            "Admin" if user['role'] == 'admin' else "Utilisateur",
+            "Actif" if user['is_active'] else "Inactif",
+            # Format datetime to readable format
+            user['last_login'][:16].replace('T', ' ') if user['last_login'] else "Jamais",
+            user['created_at'][:10],  # Just the date part
+        )
 
-        # Create user
-        success, error = AuthManager.create_user(username, password, fullname, role)
+    @staticmethod
+    def row_foregrounds(user):
+        """Return the text color of each data column for a user (None = default)"""
+        return (
+            None,
+            None,
+            ADMIN_COLOR if user['role'] == 'admin' else USER_COLOR,
+            ACTIVE_COLOR if user['is_active'] else INACTIVE_COLOR,
+            None,
+            None,
+        )
 
-        if success:
-            QMessageBox.information(self, "Succès", f"Utilisateur '{username}' créé avec succès")
-            self.accept()
-        else:
-            QMessageBox.critical(self, "Erreur", error)
+    @staticmethod
+    def row_buttons(user):
+        """Return the action buttons painted for a user"""
+        return ACTIVE_USER_BUTTONS if user['is_active'] else INACTIVE_USER_BUTTONS
 
 
 class UserManagementScreen(QWidget):
@@ -262,11 +599,15 @@ class UserManagementScreen(QWidget):
     def __init__(self):
         super().__init__()
         self.users = []
+        self._import_worker = None
+        self._import_users = None
         self.init_ui()
         self.load_users()
 
     def init_ui(self):
         """Initialize the user interface"""
+        self.setStyleSheet(USER_SCREEN_QSS)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30, 30, 30, 30)
         layout.setSpacing(20)
@@ -279,27 +620,21 @@ class UserManagementScreen(QWidget):
         title_font.setPointSize(24)
         title_font.setBold(True)
         title.setFont(title_font)
-        title.setStyleSheet("color: #2c3e50;")
+        title.setObjectName("usersTitle")
         header_layout.addWidget(title)
 
         header_layout.addStretch()
 
+        # Import users button
+        import_btn = QPushButton("📥 Importer CSV")
+        import_btn.setObjectName("importUsersButton")
+        import_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        import_btn.clicked.connect(self.import_users)
+        header_layout.addWidget(import_btn)
+
         # Add user button
         add_btn = QPushButton("+ Nouvel Utilisateur")
-        add_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 10px 20px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #229954;
-            }
-        """)
+        add_btn.setObjectName("addUserButton")
         add_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         add_btn.clicked.connect(self.add_user)
         header_layout.addWidget(add_btn)
@@ -308,260 +643,193 @@ class UserManagementScreen(QWidget):
 
         # Subtitle
         subtitle = QLabel("Gérer les comptes utilisateurs et leurs permissions")
-        subtitle.setStyleSheet("color: #7f8c8d; font-size: 14px; margin-bottom: 10px;")
+        subtitle.setObjectName("usersSubtitle")
         layout.addWidget(subtitle)
 
         # Users table
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
-            "Nom d'utilisateur", "Nom Complet", "Rôle",
-            "Statut", "Dernière Connexion", "Créé le", "Actions"
-        ])
+        self.table = QTableView()
+        self.table.setObjectName("usersTable")
+        self.model = UserTableModel(self)
+        self.table.setModel(self.model)
 
         # Table styling
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        # Uniform fixed-height rows: no per-row size hints are ever computed
         self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.table.verticalHeader().setDefaultSectionSize(50)
 
-        # Set column widths
+        # Set column widths. Dates have a fixed format, so their columns get a
+        # fixed width instead of ResizeToContents, which measures every row.
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(5, QHeaderView.ResizeMode.Fixed)
         header.setSectionResizeMode(6, QHeaderView.ResizeMode.Fixed)
 
         self.table.setColumnWidth(2, 120)
         self.table.setColumnWidth(3, 80)
-        self.table.setColumnWidth(6, 280)
-
-        self.table.setStyleSheet("""
-            QTableWidget {
-                background-color: white;
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                gridline-color: #e0e0e0;
-            }
-            QTableWidget::item {
-                padding: 5px;
-            }
-            QTableWidget::item:selected {
-                background-color: #3498db;
-                color: white;
-            }
-            QHeaderView::section {
-                background-color: #34495e;
-                color: white;
-                padding: 10px;
-                border: none;
-                font-weight: bold;
-            }
-        """)
+        self.table.setColumnWidth(4, 160)
+        self.table.setColumnWidth(5, 100)
+        self.table.setColumnWidth(ACTIONS_COLUMN, 360)
+
+        # Row action buttons are painted by a delegate instead of per-row widgets
+        self.action_delegate = ActionButtonDelegate(self.action_buttons, self.table)
+        self.action_delegate.action_triggered.connect(self.on_row_action)
+        self.table.setItemDelegateForColumn(ACTIONS_COLUMN, self.action_delegate)
+
 
         layout.addWidget(self.table)
 
         # Summary
         self.summary_label = QLabel()
-        self.summary_label.setStyleSheet("""
-            QLabel {
-                background-color: #ecf0f1;
-                padding: 12px;
-                border-radius: 5px;
-                font-size: 13px;
-                color: #2c3e50;
-            }
-        """)
+        self.summary_label.setObjectName("usersSummary")
         layout.addWidget(self.summary_label)
 
     def load_users(self):
         """Load users from database"""
-        self.users = AuthManager.get_all_users()
+        # Mutable copies: single-row changes are applied in place
+        self.users = [dict(user) for user in AuthManager.get_all_users()]
         self.display_users()
 
     def display_users(self):
         """Display users in table"""
-        self.table.setRowCount(0)
-
-        active_count = 0
-        admin_count = 0
-
-        for user in self.users:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-
-            # Username
-            username_item = QTableWidgetItem(user['username'])
-            username_item.setFont(QFont("", -1, QFont.Weight.Bold))
-            self.table.setItem(row, 0, username_item)
-
-            # Full name
-            self.table.setItem(row, 1, QTableWidgetItem(user['full_name']))
-
-            # Role
-            role_text = "Admin" if user['role'] == 'admin' else "Utilisateur"
-            role_item = QTableWidgetItem(role_text)
-            role_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if user['role'] == 'admin':
-                role_item.setForeground(QColor("#e74c3c"))
-                admin_count += 1
-            else:
-                role_item.setForeground(QColor("#3498db"))
-            self.table.setItem(row, 2, role_item)
-
-            # Status
-            status_text = "Actif" if user['is_active'] else "Inactif"
-            status_item = QTableWidgetItem(status_text)
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if user['is_active']:
-                status_item.setForeground(QColor("#27ae60"))
-                active_count += 1
-            else:
-                status_item.setForeground(QColor("#95a5a6"))
-            self.table.setItem(row, 3, status_item)
-
-            # Last login
-            last_login = user['last_login'] if user['last_login'] else "Jamais"
-            if user['last_login']:
-                # Format datetime to readable format
-                last_login = last_login[:16].replace('T', ' ')
-            last_login_item = QTableWidgetItem(last_login)
-            last_login_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 4, last_login_item)
-
-            # Created date
-            created = user['created_at'][:10]  # Just the date part
-            created_item = QTableWidgetItem(created)
-            created_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 5, created_item)
-
-            # Actions
-            actions_widget = self.create_action_buttons(user)
-            self.table.setCellWidget(row, 6, actions_widget)
-
-        # Update summary
+        self.model.set_users(self.users)
+        self.update_summary()
+
+    def update_summary(self):
+        """Update the user counts below the table"""
         total_count = len(self.users)
+        active_count = sum(1 for user in self.users if user['is_active'])
+        admin_count = sum(1 for user in self.users if user['role'] == 'admin')
         self.summary_label.setText(
             f"Total: {total_count} utilisateur(s) | "
             f"Actifs: {active_count} | "
             f"Administrateurs: {admin_count}"
         )
 
-    def create_action_buttons(self, user):
-        """Create action buttons for a user"""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setSpacing(5)
-
-        # Change password button
-        password_btn = QPushButton("🔑 Mot de passe")
-        password_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                padding: 6px 10px;
-                font-size: 11px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
-        password_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        password_btn.clicked.connect(lambda: self.change_password(user))
-        layout.addWidget(password_btn)
-
-        # Permissions button
-        permissions_btn = QPushButton("🔒 Permissions")
-        permissions_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #9b59b6;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                padding: 6px 10px;
-                font-size: 11px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #8e44ad;
-            }
-        """)
-        permissions_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        permissions_btn.clicked.connect(lambda: self.manage_permissions(user))
-        layout.addWidget(permissions_btn)
-
-        # Toggle active button
-        toggle_text = "❌ Désactiver" if user['is_active'] else "✓ Activer"
-        toggle_color = "#e74c3c" if user['is_active'] else "#27ae60"
-
-        toggle_btn = QPushButton(toggle_text)
-        toggle_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {toggle_color};
-                color: white;
-                border: none;
-                border-radius: 3px;
-                padding: 6px 10px;
-                font-size: 11px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                opacity: 0.8;
-            }}
-        """)
-        toggle_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        toggle_btn.clicked.connect(lambda: self.toggle_user(user))
-        layout.addWidget(toggle_btn)
-
-        # Delete button
-        delete_btn = QPushButton("🗑️")
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #95a5a6;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                padding: 6px 10px;
-                font-size: 11px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #7f8c8d;
-            }
-        """)
-        delete_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        delete_btn.clicked.connect(lambda: self.delete_user(user))
-        layout.addWidget(delete_btn)
-
-        return widget
+    def action_buttons(self, row):
+        """Return the action buttons painted for a table row"""
+        return self.model.buttons_at(row)
+
+    def on_row_action(self, action, row):
+        """Handle a click on a row action button"""
+        user = self.model.user_at(row)
+        if action == "password":
+            self.change_password(user)
+        elif action == "permissions":
+            self.manage_permissions(user)
+        elif action == "toggle":
+            self.toggle_user(user, row)
+        elif action == "delete":
+            self.delete_user(user, row)
 
     def add_user(self):
         """Add a new user"""
         dialog = AddUserDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.load_users()
+            # Users are listed newest first
+            self.model.insert_user(0, dialog.created_user)
+            self.update_summary()
+
+    def import_users(self):
+        """Create users from a CSV file (username, full_name, password, role)"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Importer des utilisateurs",
+            "",
+            "Fichiers CSV (*.csv);;Tous les fichiers (*)"
+        )
+        if not file_path:
+            return
+
+        try:
+            with open(file_path, newline='', encoding='utf-8-sig') as f:
+                reader = csv.DictReader(f)
+                missing = [col for col in IMPORT_COLUMNS if col not in (reader.fieldnames or [])]
+                if missing:
+                    QMessageBox.warning(
+                        self, "Erreur",
+                        f"Colonnes manquantes dans le fichier: {', '.join(missing)}"
+                    )
+                    return
+                # Rows are kept in file order so errors can give their number
+                users = list(reader)
+        except Exception as e:
+            QMessageBox.critical(self, "Erreur d'import", f"Erreur: {str(e)}")
+            return
+
+        error = AuthManager.validate_users_bulk(users)
+        if error:
+            QMessageBox.warning(self, "Erreur", error)
+            return
+
+        reply = QMessageBox.question(
+            self,
+            "Confirmer l'import",
+            f"Fichier: {os.path.basename(file_path)}\n"
+            f"Utilisateurs: {len(users)}\n\n"
+            "Voulez-vous créer ces utilisateurs?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+
+        # Hash off the UI thread (Argon2id, a few hundred ms per password);
+        # the screen stays disabled until the users are created
+        self.setEnabled(False)
+        self.setCursor(Qt.CursorShape.WaitCursor)
+        self._import_users = users
+        self._import_worker = BulkPasswordHashWorker(
+            [user['password'] for user in users]
+        )
+        self._import_worker.signals.hashed.connect(self._import_passwords_hashed)
+        self._import_worker.signals.failed.connect(self._import_hash_failed)
+        QThreadPool.globalInstance().start(self._import_worker)
+
+    def _end_import(self):
+        """Re-enable the screen after an import"""
+        users = self._import_users
+        self._import_worker = None
+        self._import_users = None
+        self.unsetCursor()
+        self.setEnabled(True)
+        return users
+
+    def _import_passwords_hashed(self, password_hashes):
+        """Create the imported users once their passwords are hashed"""
+        users = self._end_import()
+
+        # One transaction for the whole file
+        created, error = AuthManager.create_users_bulk(users, password_hashes)
+        if error:
+            QMessageBox.critical(self, "Erreur", error)
+            return
+
+        QMessageBox.information(self, "Succès", f"{created} utilisateur(s) importé(s) avec succès")
+        self.load_users()
+
+    def _import_hash_failed(self, error):
+        self._end_import()
+        QMessageBox.critical(self, "Erreur", f"Erreur lors du hachage des mots de passe: {error}")
 
     def change_password(self, user):
         """Change user password"""
         dialog = ChangePasswordDialog(user['user_id'], user['username'], self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.load_users()
+        dialog.exec()  # No displayed field changes
 
     def manage_permissions(self, user):
         """Manage user permissions"""
         dialog = PermissionsDialog(user['user_id'], user['username'], self)
         dialog.exec()
 
-    def toggle_user(self, user):
+    def toggle_user(self, user, row):
         """Toggle user active status"""
         action = "désactiver" if user['is_active'] else "activer"
 
@@ -576,12 +844,14 @@ class UserManagementScreen(QWidget):
             success, error = AuthManager.toggle_user_active(user['user_id'])
 
             if success:
+                user['is_active'] = 0 if user['is_active'] else 1
+                self.model.refresh_row(row)
+                self.update_summary()
                 QMessageBox.information(self, "Succès", f"Utilisateur {action}é avec succès")
-                self.load_users()
             else:
                 QMessageBox.critical(self, "Erreur", error)
 
-    def delete_user(self, user):
+    def delete_user(self, user, row):
         """Delete a user"""
         reply = QMessageBox.question(
             self,
@@ -596,7 +866,8 @@ class UserManagementScreen(QWidget):
             success, error = AuthManager.delete_user(user['user_id'])
 
             if success:
+                self.model.remove_row(row)
+                self.update_summary()
                 QMessageBox.information(self, "Succès", "Utilisateur supprimé avec succès")
-                self.load_users()
             else:
                 QMessageBox.critical(self, "Erreur", error)
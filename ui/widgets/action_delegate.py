@@ -0,0 +1,132 @@
+"""
+Action Button Delegate
+Paints per-row action buttons in a table column without creating widgets
+"""
+
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem, QStyle, QApplication
+from PyQt6.QtCore import Qt, QRect, QRectF, QEvent, pyqtSignal
+from PyQt6.QtGui import QColor, QPainter, QPixmap
+
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    """
+    Item delegate drawing a row of flat buttons and reporting clicks
+
+    The buttons of a row are given by ``buttons_provider(row)``, which returns a
+    sequence of ``(action, text, color)`` tuples. Clicking a button emits
+    ``action_triggered(action, row)``. Providers should return shared tuples:
+    the button widths are measured once per distinct tuple, and each button is
+    rendered once to a pixmap that later paints only blit.
+    """
+
+    action_triggered = pyqtSignal(str, int)
+
+    BUTTON_HEIGHT = 24
+    BUTTON_PADDING = 10  # Horizontal text padding inside a button
+    BUTTON_SPACING = 5
+    BUTTON_RADIUS = 3
+
+    TEXT_COLOR = QColor("white")
+    EMPTY_COLOR = QColor("#95a5a6")
+
+    def __init__(self, buttons_provider, parent=None, empty_text="Lecture seule"):
+        super().__init__(parent)
+        self._buttons_provider = buttons_provider
+        self._empty_text = empty_text
+        self._colors = {}  # Parsed QColor per hex string
+        self._widths = {}  # Button widths per buttons tuple
+        self._pixmaps = {}  # Rendered button per (text, color, width, pixel ratio)
+
+    def _color(self, hex_color):
+        """Return a cached QColor for a hex string"""
+        color = self._colors.get(hex_color)
+        if color is None:
+            color = self._colors[hex_color] = QColor(hex_color)
+        return color
+
+    def _button_widths(self, option, buttons):
+        """Return the cached button widths and their total for a buttons tuple"""
+        cached = self._widths.get(buttons)
+        if cached is None:
+            metrics = option.fontMetrics
+            widths = [
+                metrics.horizontalAdvance(text) + 2 * self.BUTTON_PADDING
+                for _, text, _ in buttons
+            ]
+            total_width = sum(widths) + self.BUTTON_SPACING * (len(widths) - 1)
+            cached = self._widths[buttons] = (widths, total_width)
+        return cached
+
+    def _button_pixmap(self, option, text, color, width, pixel_ratio):
+        """Return the cached rendering of a button (text shaping done once)"""
+        key = (text, color, width, pixel_ratio)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(round(width * pixel_ratio), round(self.BUTTON_HEIGHT * pixel_ratio))
+            pixmap.setDevicePixelRatio(pixel_ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+
+            rect = QRect(0, 0, width, self.BUTTON_HEIGHT)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setFont(option.font)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self._color(color))
+            painter.drawRoundedRect(QRectF(rect), self.BUTTON_RADIUS, self.BUTTON_RADIUS)
+            painter.setPen(self.TEXT_COLOR)
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+            painter.end()
+
+            self._pixmaps[key] = pixmap
+        return pixmap
+
+    def _button_rects(self, option, buttons):
+        """Compute the rectangle of each button, centered in the cell"""
+        widths, total_width = self._button_widths(option, buttons)
+
+        x = option.rect.x() + max(0, (option.rect.width() - total_width) // 2)
+        y = option.rect.y() + (option.rect.height() - self.BUTTON_HEIGHT) // 2
+
+        rects = []
+        for width in widths:
+            rects.append(QRect(x, y, width, self.BUTTON_HEIGHT))
+            x += width + self.BUTTON_SPACING
+        return rects
+
+    def paint(self, painter, option, index):
+        """Paint the cell background and its action buttons"""
+        # Background / selection as for a regular cell
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, opt, painter, opt.widget)
+
+        buttons = self._buttons_provider(index.row())
+
+        painter.save()
+        if not buttons:
+            font = painter.font()
+            font.setItalic(True)
+            painter.setFont(font)
+            painter.setPen(self.EMPTY_COLOR)
+            painter.drawText(option.rect, Qt.AlignmentFlag.AlignCenter, self._empty_text)
+            painter.restore()
+            return
+
+        pixel_ratio = painter.device().devicePixelRatioF()
+        for (_, text, color), rect in zip(buttons, self._button_rects(option, buttons)):
+            pixmap = self._button_pixmap(option, text, color, rect.width(), pixel_ratio)
+            painter.drawPixmap(rect.topLeft(), pixmap)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        """Map a left click inside a button to its action"""
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            buttons = self._buttons_provider(index.row())
+            position = event.position().toPoint()
+            for (action, _, _), rect in zip(buttons, self._button_rects(option, buttons)):
+                if rect.contains(position):
+                    self.action_triggered.emit(action, index.row())
+                    return True
+        return super().editorEvent(event, model, option, index)
@@ -0,0 +1,26 @@
+"""
+Debouncer
+Run a callback once a signal has stopped firing for a given delay
+"""
+
+from PyQt6.QtCore import QObject, QTimer
+
+
+class Debouncer(QObject):
+    """
+    Coalesce bursts of a signal (e.g. ``QLineEdit.textChanged``) into a single
+    call of ``callback`` made ``interval_ms`` after the last emission.
+    """
+
+    def __init__(self, signal, interval_ms, callback, parent=None):
+        super().__init__(parent)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(callback)
+        signal.connect(self.trigger)
+
+    def trigger(self, *args):
+        """Restart the delay (connected to the watched signal)"""
+        self._timer.start()
+
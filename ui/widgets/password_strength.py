@@ -0,0 +1,49 @@
+"""
+Password Strength
+Live password strength meter for password inputs
+"""
+
+from PyQt6.QtWidgets import QProgressBar
+
+from ui.widgets.debouncer import Debouncer
+from utils.user_validation import password_strength
+
+
+# Delay (ms) after the last keystroke before the meter is refreshed
+STRENGTH_DEBOUNCE_MS = 200
+
+STRENGTH_LABELS = ("Très faible", "Faible", "Moyen", "Fort", "Très fort")
+
+STRENGTH_BAR_QSS = """
+    QProgressBar {
+        border: 1px solid #bdc3c7;
+        border-radius: 4px;
+        text-align: center;
+        font-size: 11px;
+        max-height: 16px;
+    }
+    QProgressBar::chunk {
+        background-color: #3498db;
+        border-radius: 3px;
+    }
+"""
+
+
+class PasswordStrengthBar(QProgressBar):
+    """Strength meter following a password QLineEdit, refreshed once typing pauses"""
+
+    def __init__(self, password_input, parent=None):
+        super().__init__(parent)
+        self._password_input = password_input
+        self.setRange(0, len(STRENGTH_LABELS) - 1)
+        self.setStyleSheet(STRENGTH_BAR_QSS)
+        self.refresh()
+
+        # Coalesce keystrokes into a single estimate
+        Debouncer(password_input.textChanged, STRENGTH_DEBOUNCE_MS, self.refresh, self)
+
+    def refresh(self):
+        """Score the current password and update the meter"""
+        score = password_strength(self._password_input.text())
+        self.setValue(score)
+        self.setFormat(STRENGTH_LABELS[score])
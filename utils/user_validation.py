@@ -0,0 +1,88 @@
+"""
+User Validation
+Username, full name and password rules shared by the user dialogs and imports
+"""
+
+try:
+    from zxcvbn import zxcvbn
+except ImportError:  # zxcvbn not installed: use the length/character-class estimate
+    zxcvbn = None
+
+
+# Passwords scoring below this (0-4 scale) are rejected
+MIN_PASSWORD_SCORE = 2
+
+
+def password_strength(password: str) -> int:
+    """
+    Estimate the strength of a password
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        Score from 0 (trivially guessable) to 4 (very strong)
+    """
+    if not password:
+        return 0
+
+    if zxcvbn is not None:
+        return zxcvbn(password)['score']
+
+    # Character classes used: lowercase, uppercase, digits, other
+    classes = (
+        any(c.islower() for c in password)
+        + any(c.isupper() for c in password)
+        + any(c.isdigit() for c in password)
+        + any(not c.isalnum() for c in password)
+    )
+    score = classes - 1 + (len(password) >= 8) + (len(password) >= 12)
+    if len(password) < 6:
+        score = min(score, 1)
+    return max(0, min(4, score))
+
+
+# Validation rules: (predicate flagging invalid values, message),
+# checked in order until the first failure
+IDENTITY_RULES = (
+    (lambda username, fullname: not username, "Le nom d'utilisateur est requis"),
+    (lambda username, fullname: len(username) < 3,
+     "Le nom d'utilisateur doit contenir au moins 3 caractères"),
+    (lambda username, fullname: not fullname, "Le nom complet est requis"),
+)
+
+PASSWORD_RULES = (
+    (lambda password, confirm: not password, "Le mot de passe est requis"),
+    (lambda password, confirm: len(password) < 4,
+     "Le mot de passe doit contenir au moins 4 caractères"),
+    (lambda password, confirm: password_strength(password) < MIN_PASSWORD_SCORE,
+     "Le mot de passe est trop faible. Utilisez au moins 8 caractères "
+     "mêlant lettres, chiffres et symboles"),
+    (lambda password, confirm: password != confirm, "Les mots de passe ne correspondent pas"),
+)
+
+
+def first_failed_rule(rules, *values):
+    """Return the message of the first rule the values fail, or None"""
+    for is_invalid, message in rules:
+        if is_invalid(*values):
+            return message
+    return None
+
+
+def user_error(username: str, full_name: str, password: str) -> str:
+    """
+    Check a new user's identity and password against the rules
+
+    Args:
+        username: Username, already stripped
+        full_name: Full name, already stripped
+        password: Plain text password
+
+    Returns:
+        Message of the first failed rule, or None when the user is valid
+    """
+    return (
+        first_failed_rule(IDENTITY_RULES, username, full_name)
+        or first_failed_rule(PASSWORD_RULES, password, password)
+    )